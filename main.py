@@ -1,23 +1,30 @@
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import json
-import signal
-import subprocess
-import sys
+import queue
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Optional, List, Dict
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, BackgroundTasks, HTTPException, Header
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+import zstandard
+from fastapi import FastAPI, HTTPException, Header
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config.settings import settings
 from src.services.google_drive_service import GoogleDriveService
+from src.services.job_store import TERMINAL_STATUSES, JobStore, create_job_store
 from src.audio_processor.audio_transcription_processor import AudioTranscriptionProcessor
-from src.monitoring.health_check import KafkaMonitorService
 from src.monitoring.usage_tracker import UsageTracker
 
 # Configure logging
@@ -34,13 +41,40 @@ formatter = logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 handler.setFormatter(formatter)
-root_logger.addHandler(handler)
+log_handlers = [handler]
 
 # Add file handler for production
 if environment == "production":
     file_handler = logging.FileHandler("app.log")
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    log_handlers.append(file_handler)
+
+# Loggers only enqueue records; a listener thread does the formatting and
+# stream/file I/O so log calls never block the event loop
+queue_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+root_logger.addHandler(queue_handler)
+log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def start_log_listener():
+    """Start the thread that writes queued log records to the real handlers"""
+    global log_listener
+    log_listener = logging.handlers.QueueListener(
+        queue_handler.queue, *log_handlers, respect_handler_level=True
+    )
+    log_listener.start()
+
+
+def restart_log_listener_after_fork():
+    """Threads do not survive fork (gunicorn --preload), so give each worker its own"""
+    queue_handler.queue = queue.Queue(-1)
+    start_log_listener()
+
+
+start_log_listener()
+os.register_at_fork(after_in_child=restart_log_listener_after_fork)
+# Flush whatever is still queued on exit
+atexit.register(lambda: log_listener.stop())
 
 # Reduce third-party noise
 logging.getLogger("google").setLevel(logging.WARNING)
@@ -50,15 +84,21 @@ logging.getLogger("gunicorn").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize services
-monitor = KafkaMonitorService()
 drive_service: Optional[GoogleDriveService] = None
 usage_tracker: Optional[UsageTracker] = None
+job_store: Optional[JobStore] = None
+
+
+# Shared by the API models: parsed once, never mutated, unknown fields dropped
+API_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
 
 
 class TranscriptionRequest(BaseModel):
     """Request model for transcription"""
-    google_drive_link: str
-    gemini_api_key: Optional[str] = None  # Optional - can also use global env var
+    model_config = API_MODEL_CONFIG
+
+    google_drive_link: str = Field(min_length=1)
+    gemini_api_key: Optional[str] = Field(default=None, min_length=10)  # Optional - can also use global env var
     recursive: bool = True
     max_file_size_mb: Optional[int] = None
     to_book: bool = False  # If True, format transcripts as publishable book with chapters
@@ -68,6 +108,8 @@ class TranscriptionRequest(BaseModel):
 
 class TranscriptionStatus(BaseModel):
     """Response model for transcription status"""
+    model_config = API_MODEL_CONFIG
+
     job_id: str
     status: str
     message: str
@@ -75,13 +117,37 @@ class TranscriptionStatus(BaseModel):
     processed_files: Optional[int] = None
 
 
-# Global job tracking
-active_jobs: Dict[str, Dict] = {}
+# Jobs waiting for a free job worker (created in lifespan)
+job_queue: Optional[asyncio.Queue] = None
+job_workers: List[asyncio.Task] = []
+# Jobs currently being processed by a job worker
+running_jobs: set = set()
+
+# Wake-up events for job progress subscribers, replaced on every update
+job_events: Dict[str, asyncio.Event] = {}
+
+# Warm processors keyed by (API key, model), least recently used first
+MAX_CACHED_PROCESSORS = 32
+processor_cache: "OrderedDict[tuple, AudioTranscriptionProcessor]" = OrderedDict()
+
+# Pre-serialized health/metrics bodies (built in lifespan)
+health_payload_prefix: bytes = b""
+metrics_payload: bytes = b""
+
+# Optional process pool for transcription (created in lifespan)
+transcribe_pool: Optional[ProcessPoolExecutor] = None
+
+
+def notify_job_update(job_id: str):
+    """Wake every progress stream currently waiting on a job"""
+    event = job_events.pop(job_id, None)
+    if event:
+        event.set()
 
 
 def initialize_services():
-    """Initialize Google Drive service and usage tracker"""
-    global drive_service, usage_tracker
+    """Initialize Google Drive service, usage tracker and job store"""
+    global drive_service, usage_tracker, job_store
 
     try:
         # Validate required configuration
@@ -95,14 +161,24 @@ def initialize_services():
 
         logger.info("✅ Configuration validated")
 
-        # Initialize Google Drive service (no API key needed for public folders!)
-        drive_service = GoogleDriveService()
+        # Initialize Google Drive service (no API key needed for public folders!
+        # With GOOGLE_DRIVE_API_KEY set, folder listings use the Drive API)
+        drive_service = GoogleDriveService(api_key=settings.GOOGLE_DRIVE_API_KEY)
         logger.info("Google Drive service initialized (direct download mode)")
 
         # Initialize usage tracker
         usage_tracker = UsageTracker(storage_path="./usage_data")
         logger.info("Usage tracker initialized")
 
+        # Initialize job store (Redis when configured, so all workers share job state)
+        job_store = create_job_store(
+            settings.REDIS_URL,
+            ttl_seconds=settings.JOB_TTL_SECONDS,
+            max_jobs=settings.MAX_STORED_JOBS,
+            on_drop=remove_results_file
+        )
+        logger.info("Job store initialized")
+
     except ValueError as ve:
         # Configuration validation error - give helpful message
         logger.error(f"\n{'='*60}\n⚠️  CONFIGURATION ERROR\n{'='*60}\n{str(ve)}\n{'='*60}")
@@ -112,6 +188,64 @@ def initialize_services():
         raise
 
 
+def get_audio_processor(gemini_api_key: str) -> AudioTranscriptionProcessor:
+    """
+    Get a cached audio processor for an API key, creating it on first use
+
+    Args:
+        gemini_api_key: Gemini API key
+
+    Returns:
+        AudioTranscriptionProcessor configured for the key
+    """
+    cache_key = (gemini_api_key, settings.GEMINI_MODEL)
+
+    processor = processor_cache.get(cache_key)
+    if processor is not None:
+        processor_cache.move_to_end(cache_key)
+        return processor
+
+    processor = AudioTranscriptionProcessor(
+        gemini_api_key=gemini_api_key,
+        model_name=settings.GEMINI_MODEL,
+        temp_dir=settings.TEMP_DIR,
+        cleanup_temp_files=settings.CLEANUP_TEMP_FILES,
+        max_chunk_size_mb=settings.MAX_CHUNK_SIZE_MB,
+        segment_duration_seconds=settings.SEGMENT_DURATION_SECONDS,
+        max_concurrency=settings.MAX_CONCURRENT_PROCESSING,
+        max_chunk_concurrency=settings.MAX_CHUNK_CONCURRENCY,
+        max_gemini_calls=settings.MAX_CONCURRENT_GEMINI_CALLS,
+        max_poll_seconds=settings.GEMINI_TIMEOUT,
+        cache_enabled=settings.TRANSCRIPTION_CACHE_ENABLED,
+        cache_max_entries=settings.TRANSCRIPTION_CACHE_MAX_ENTRIES,
+        cache_max_age_seconds=settings.TRANSCRIPTION_CACHE_MAX_AGE_SECONDS,
+        compress_uploads=settings.COMPRESS_AUDIO_UPLOADS
+    )
+    processor_cache[cache_key] = processor
+
+    if len(processor_cache) > MAX_CACHED_PROCESSORS:
+        processor_cache.popitem(last=False)
+
+    return processor
+
+
+def transcribe_in_worker_process(gemini_api_key: str, audio_path: str) -> Dict:
+    """
+    Transcribe a file inside a transcription pool process
+
+    Must stay a top-level function so it can be pickled; each pool process
+    keeps its own processor cache.
+
+    Args:
+        gemini_api_key: Gemini API key
+        audio_path: Path to audio file
+
+    Returns:
+        Transcription result
+    """
+    return get_audio_processor(gemini_api_key).transcribe_file(audio_path)
+
+
 async def process_transcription_job(
     job_id: str,
     drive_link: str,
@@ -125,16 +259,11 @@ async def process_transcription_job(
     """Background task to process transcription job"""
     try:
         logger.info(f"Starting transcription job {job_id}")
-        active_jobs[job_id]["status"] = "processing"
-
-        # Create audio processor with the provided API key
-        job_audio_processor = AudioTranscriptionProcessor(
-            gemini_api_key=gemini_api_key,
-            model_name=settings.GEMINI_MODEL,
-            temp_dir=settings.TEMP_DIR,
-            cleanup_temp_files=settings.CLEANUP_TEMP_FILES,
-            max_chunk_size_mb=settings.MAX_CHUNK_SIZE_MB
-        )
+        await job_store.update(job_id, status="processing")
+        notify_job_update(job_id)
+
+        # Reuse a warm audio processor for the provided API key
+        job_audio_processor = get_audio_processor(gemini_api_key)
 
         # Extract folder ID from drive link
         folder_id = drive_service.extract_folder_id(drive_link)
@@ -143,56 +272,115 @@ async def process_transcription_job(
         download_dir = os.path.join(settings.DOWNLOAD_DIR, job_id)
         os.makedirs(download_dir, exist_ok=True)
 
-        # List audio files first (don't download yet)
+        # List audio files first (metadata only - nothing is downloaded yet)
         logger.info(f"Listing audio files from folder {folder_id}")
-        audio_file_list = drive_service.list_audio_files(
+        audio_file_list = await asyncio.to_thread(
+            drive_service.list_audio_metadata,
             folder_id=folder_id,
             recursive=recursive
         )
 
-        active_jobs[job_id]["total_files"] = len(audio_file_list)
-        logger.info(f"Found {len(audio_file_list)} audio files")
-
-        # Process files one by one (gdown already downloaded them all)
-        results = []
-        for i, audio_file_info in enumerate(audio_file_list, 1):
-            try:
+        total_files = len(audio_file_list)
+        await job_store.update(job_id, total_files=total_files, processed_files=0)
+        notify_job_update(job_id)
+        logger.info(f"Found {total_files} audio files")
+
+        # Pipeline: a producer downloads files into a small bounded queue while a
+        # pool of consumers transcribes them, so downloads overlap with Gemini
+        # round-trips and only a handful of files sit on disk at any moment
+        num_consumers = max(1, min(settings.MAX_CONCURRENT_PROCESSING, total_files))
+        download_queue: asyncio.Queue = asyncio.Queue(maxsize=num_consumers)
+        results: List[Optional[Dict]] = [None] * total_files
+
+        async def record_result(i: int, result: Dict):
+            results[i - 1] = result
+            await job_store.increment(job_id, "processed_files")
+            notify_job_update(job_id)
+
+        async def download_producer():
+            for i, audio_file_info in enumerate(audio_file_list, 1):
                 filename = audio_file_info.get('name')
-                # gdown already downloaded the file, use the local_path from the list
-                local_path = audio_file_info.get('local_path')
+                destination_path = os.path.join(
+                    download_dir, audio_file_info.get('path') or filename
+                )
+
+                try:
+                    logger.info(f"Downloading file {i}/{total_files}: {filename}")
+                    local_path = await asyncio.to_thread(
+                        drive_service.download_file,
+                        audio_file_info['id'],
+                        destination_path
+                    )
+                except Exception as download_error:
+                    logger.error(f"Failed to download {filename}: {download_error}")
+                    await record_result(i, {
+                        "file_path": filename,
+                        "success": False,
+                        "error": f"File not downloaded: {download_error}"
+                    })
+                    continue
+
+                await download_queue.put((i, filename, local_path))
+
+            # One stop marker per consumer
+            for _ in range(num_consumers):
+                await download_queue.put(None)
 
+        async def transcribe_one(i: int, filename: str, local_path: str) -> Dict:
+            try:
                 if not local_path or not os.path.exists(local_path):
                     logger.error(f"File not found locally: {filename}")
-                    results.append({
+                    return {
                         "file_path": filename,
                         "success": False,
                         "error": "File not downloaded"
-                    })
-                    continue
+                    }
 
-                logger.info(f"Processing file {i}/{len(audio_file_list)}: {filename}")
-                active_jobs[job_id]["processed_files"] = i - 1
+                logger.info(f"🎤 Transcribing file {i}/{total_files}: {filename}")
+                if transcribe_pool:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        transcribe_pool, transcribe_in_worker_process, gemini_api_key, local_path
+                    )
+                else:
+                    result = await asyncio.to_thread(job_audio_processor.transcribe_file, local_path)
 
-                # Transcribe the file (already downloaded by gdown)
-                logger.info(f"🎤 Transcribing: {filename}")
-                result = job_audio_processor.transcribe_file(local_path)
+                logger.info(f"✅ Completed: {filename}")
 
                 # Store result directly (no file saving needed for API)
-                results.append({
+                return {
                     "file_path": local_path,
                     "success": True,
                     "result": result
-                })
-
-                logger.info(f"✅ Completed: {filename}")
+                }
 
             except Exception as file_error:
                 logger.error(f"Failed to process {filename}: {file_error}")
-                results.append({
+                return {
                     "file_path": filename,
                     "success": False,
                     "error": str(file_error)
-                })
+                }
+
+            finally:
+                # Free disk space as soon as the file is done
+                if settings.CLEANUP_TEMP_FILES and local_path and os.path.exists(local_path):
+                    try:
+                        os.remove(local_path)
+                    except OSError as cleanup_error:
+                        logger.warning(f"Failed to remove {local_path}: {cleanup_error}")
+
+        async def transcribe_consumer():
+            while True:
+                item = await download_queue.get()
+                if item is None:
+                    return
+                i, filename, local_path = item
+                await record_result(i, await transcribe_one(i, filename, local_path))
+
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(download_producer())
+            for _ in range(num_consumers):
+                task_group.create_task(transcribe_consumer())
 
         # Update job status
         successful = sum(1 for r in results if r.get("success"))
@@ -205,25 +393,35 @@ async def process_transcription_job(
             try:
                 from src.audio_processor.book_formatter import BookFormatter
 
+                # Reuse the processor's model; its Gemini session keeps other
+                # keys from reconfiguring the SDK while the book is generated
                 book_formatter = BookFormatter(
                     gemini_api_key=gemini_api_key,
-                    model_name=settings.GEMINI_MODEL
+                    model_name=settings.GEMINI_MODEL,
+                    model=job_audio_processor.model
                 )
 
-                book_data = book_formatter.format_series_to_book(
-                    transcripts=results,
-                    book_title=book_title or "Untitled Book",
-                    author_name=author_name or "Unknown Author"
-                )
+                def format_book():
+                    with job_audio_processor.gemini_session():
+                        return book_formatter.format_series_to_book(
+                            transcripts=results,
+                            book_title=book_title or "Untitled Book",
+                            author_name=author_name or "Unknown Author"
+                        )
+
+                book_data = await asyncio.to_thread(format_book)
 
                 logger.info(f"Book formatting completed: {book_data['total_chapters']} chapters")
             except Exception as book_error:
                 logger.error(f"Failed to format book: {book_error}")
                 # Continue anyway - user still gets raw transcripts
 
-        job_result = {
+        # Full results (and book) go to a compressed file on disk so job state
+        # only carries summary stats for finished jobs
+        results_payload = {
+            "job_id": job_id,
             "status": "completed",
-            "processed_files": len(results),
+            "total_files": total_files,
             "successful": successful,
             "failed": failed,
             "results": results
@@ -231,9 +429,20 @@ async def process_transcription_job(
 
         # Add book data if available
         if book_data:
-            job_result["book"] = book_data
-
-        active_jobs[job_id].update(job_result)
+            results_payload["book"] = book_data
+
+        results_path = results_file_path(job_id)
+        await asyncio.to_thread(write_results_file, results_path, results_payload)
+
+        await job_store.update(
+            job_id,
+            status="completed",
+            processed_files=len(results),
+            successful=successful,
+            failed=failed,
+            results_path=results_path
+        )
+        notify_job_update(job_id)
 
         logger.info(
             f"Transcription job {job_id} completed: "
@@ -248,28 +457,187 @@ async def process_transcription_job(
 
     except Exception as e:
         logger.error(f"Transcription job {job_id} failed: {e}")
-        active_jobs[job_id].update({
-            "status": "failed",
-            "error": str(e)
-        })
+        await job_store.update(job_id, status="failed", error=str(e))
+        notify_job_update(job_id)
+
+
+def results_file_path(job_id: str) -> str:
+    """Where a job's results file is written"""
+    return os.path.join(settings.RESULTS_DIR, f"job_{job_id}.json.zst")
+
+
+def remove_results_file(job_id: str):
+    """Delete a job's results file once the job is dropped from the store"""
+    try:
+        os.remove(results_file_path(job_id))
+    except FileNotFoundError:
+        pass
+
+
+def write_results_file(path: str, payload: Dict):
+    """
+    Write job results as zstd-compressed JSON
+
+    Args:
+        path: Destination file path
+        payload: Results payload
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = zstandard.ZstdCompressor(level=6).compress(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    )
+
+    # Write to a temp file first so readers never see a partial file
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def read_results_file(path: str, decompress: bool = True) -> bytes:
+    """
+    Read job results written by write_results_file
+
+    Args:
+        path: Results file path
+        decompress: If False, return the zstd-compressed bytes as stored
+
+    Returns:
+        JSON-encoded results payload
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return zstandard.ZstdDecompressor().decompress(data) if decompress else data
+
+
+async def job_sweeper():
+    """Periodically drop finished jobs that are past their TTL"""
+    while True:
+        await asyncio.sleep(settings.JOB_SWEEP_INTERVAL_SECONDS)
+        try:
+            removed = await job_store.sweep()
+            if removed:
+                logger.info(f"Swept {removed} expired jobs")
+        except Exception as e:
+            logger.error(f"Job sweep failed: {e}")
+
+
+async def job_worker(worker_id: int):
+    """Pull queued transcription jobs and run them one at a time"""
+    while True:
+        job_kwargs = await job_queue.get()
+        running_jobs.add(job_kwargs['job_id'])
+        try:
+            logger.info(f"Job worker {worker_id} picked up job {job_kwargs['job_id']}")
+            await process_transcription_job(**job_kwargs)
+        except Exception as e:
+            logger.error(f"Job worker {worker_id} crashed on job {job_kwargs['job_id']}: {e}")
+        finally:
+            running_jobs.discard(job_kwargs['job_id'])
+            job_queue.task_done()
+
+
+async def drain_jobs(timeout: float):
+    """
+    Give running jobs a chance to finish before shutdown
+
+    Queued jobs that never started are marked failed so clients are not left
+    polling a job that will never run.
+
+    Args:
+        timeout: Seconds to wait for running jobs
+    """
+    while job_queue and not job_queue.empty():
+        job_kwargs = job_queue.get_nowait()
+        job_queue.task_done()
+        await job_store.update(
+            job_kwargs['job_id'], status="failed", error="Service restarted before the job started"
+        )
+        notify_job_update(job_kwargs['job_id'])
+
+    deadline = time.monotonic() + timeout
+    if running_jobs:
+        logger.info(f"Waiting up to {timeout:.0f}s for {len(running_jobs)} running jobs")
+    while running_jobs and time.monotonic() < deadline:
+        await asyncio.sleep(0.5)
+
+    if running_jobs:
+        logger.warning(f"Shutting down with {len(running_jobs)} unfinished jobs: {sorted(running_jobs)}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan"""
+    global job_queue, transcribe_pool
     logger.info("Starting Audio Transcription Service...")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
 
     try:
         initialize_services()
+        build_static_payloads()
         logger.info("Services initialized successfully")
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
         raise
 
+    # Start the job worker pool
+    job_queue = asyncio.Queue(maxsize=settings.MAX_QUEUED_JOBS)
+    job_workers.extend(
+        asyncio.create_task(job_worker(worker_id))
+        for worker_id in range(1, settings.MAX_CONCURRENT_JOBS + 1)
+    )
+    logger.info(f"Started {len(job_workers)} job workers")
+    job_workers.append(asyncio.create_task(job_sweeper()))
+
+    if settings.TRANSCRIBE_PROCESSES:
+        # spawn, not fork: the parent already runs the event loop and threads
+        transcribe_pool = ProcessPoolExecutor(
+            max_workers=settings.TRANSCRIBE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Started transcription process pool ({settings.TRANSCRIBE_PROCESSES} processes)")
+
     yield
 
     logger.info("Shutting down Audio Transcription Service...")
 
+    await drain_jobs(settings.SHUTDOWN_GRACE_SECONDS)
+
+    for worker in job_workers:
+        worker.cancel()
+    await asyncio.gather(*job_workers, return_exceptions=True)
+    job_workers.clear()
+
+    if transcribe_pool:
+        transcribe_pool.shutdown(wait=False, cancel_futures=True)
+        transcribe_pool = None
+
+    if drive_service:
+        drive_service.close()
+
+    if job_store:
+        await job_store.close()
+
+
+class EventStreamAwareGZipMiddleware:
+    """
+    GZip for every response except Server-Sent Event streams
+
+    GZipMiddleware buffers streamed bodies in zlib until the stream ends,
+    which would hold back live progress events, so those paths bypass it
+    """
+
+    def __init__(self, app, minimum_size: int = 500, excluded_path_suffixes=("/events",)):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.excluded_path_suffixes = tuple(excluded_path_suffixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith(self.excluded_path_suffixes):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip_app(scope, receive, send)
+
 
 # FastAPI Application
 app = FastAPI(
@@ -277,31 +645,69 @@ app = FastAPI(
     description="Google Drive audio file transcription service using Gemini AI",
     version="3.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress larger responses for clients that accept gzip (responses that
+# already set Content-Encoding, like zstd results, are passed through; the
+# SSE progress stream is never compressed)
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1024)
+
+
+def build_static_payloads():
+    """
+    Pre-serialize the parts of the health and metrics responses that do not
+    change after startup
+    """
+    global health_payload_prefix, metrics_payload
+
+    health_static = {
+        "status": "healthy",
+        "service": "audio-transcription",
+        "version": "3.0.0",
+        "environment": environment,
+        "services": {
+            "google_drive": drive_service is not None,
+            "gemini_key_configured": settings.GEMINI_KEY is not None
+        }
+    }
+    # Drop the closing brace so the live job count can be appended
+    health_payload_prefix = orjson.dumps(health_static)[:-1]
+
+    metrics_payload = orjson.dumps({
+        "service": "audio-transcription",
+        "version": "3.0.0",
+        "environment": environment,
+        "features": {
+            "google_drive_integration": True,
+            "audio_transcription": True,
+            "gemini_integration": True,
+            "batch_processing": True
+        },
+        "supported_formats": settings.get_supported_audio_formats(),
+        "configuration": {
+            "max_audio_size_mb": settings.MAX_AUDIO_SIZE_MB,
+            "max_chunk_size_mb": settings.MAX_CHUNK_SIZE_MB,
+            "cleanup_temp_files": settings.CLEANUP_TEMP_FILES
+        }
+    })
+
 
 @app.get("/")
 async def health_check():
     """Health check endpoint"""
     try:
-        status = {
-            "status": "healthy",
-            "service": "audio-transcription",
-            "version": "3.0.0",
-            "environment": environment,
-            "services": {
-                "google_drive": drive_service is not None,
-                "gemini_key_configured": settings.GEMINI_KEY is not None
-            },
-            "active_jobs": len(active_jobs)
-        }
+        active_jobs = await job_store.count() if job_store else 0
+        logger.debug(f"Health check: {active_jobs} active jobs")
 
-        logger.info(f"Health Check Status: {status}")
-        return JSONResponse(status_code=200, content=status)
+        return Response(
+            content=health_payload_prefix + b',"active_jobs":%d}' % active_jobs,
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.error(f"Health Check Failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
@@ -311,36 +717,15 @@ async def health_check():
 async def get_metrics():
     """Metrics endpoint"""
     try:
-        metrics = {
-            "service": "audio-transcription",
-            "version": "3.0.0",
-            "environment": environment,
-            "features": {
-                "google_drive_integration": True,
-                "audio_transcription": True,
-                "gemini_integration": True,
-                "batch_processing": True
-            },
-            "supported_formats": settings.get_supported_audio_formats(),
-            "configuration": {
-                "max_audio_size_mb": settings.MAX_AUDIO_SIZE_MB,
-                "max_chunk_size_mb": settings.MAX_CHUNK_SIZE_MB,
-                "cleanup_temp_files": settings.CLEANUP_TEMP_FILES
-            }
-        }
-
-        return JSONResponse(status_code=200, content=metrics)
+        return Response(content=metrics_payload, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Metrics endpoint error: {e}")
-        return JSONResponse(status_code=500, content={"error": str(e)})
+        return ORJSONResponse(status_code=500, content={"error": str(e)})
 
 
 @app.post("/transcribe", response_model=TranscriptionStatus)
-async def transcribe_audio(
-    request: TranscriptionRequest,
-    background_tasks: BackgroundTasks
-):
+async def transcribe_audio(request: TranscriptionRequest):
     """
     Start audio transcription job from Google Drive folder
 
@@ -358,6 +743,7 @@ async def transcribe_audio(
         TranscriptionStatus with job ID and status
     """
     # Use API key from request body or fall back to global env var
+    # (a key in the body is already length-checked by the model)
     gemini_api_key = request.gemini_api_key or settings.GEMINI_KEY
 
     if not gemini_api_key or len(gemini_api_key) < 10:
@@ -368,44 +754,49 @@ async def transcribe_audio(
 
     logger.info(f"Using {'request' if request.gemini_api_key else 'global'} API key")
 
-    if not drive_service:
+    if not drive_service or job_queue is None:
         raise HTTPException(
             status_code=503,
             detail="Google Drive service not configured"
         )
 
+    if job_queue.full():
+        raise HTTPException(
+            status_code=429,
+            detail="Too many queued transcription jobs. Please retry later."
+        )
+
     try:
         # Generate job ID
         import uuid
         job_id = str(uuid.uuid4())
 
         # Initialize job tracking
-        active_jobs[job_id] = {
+        await job_store.create(job_id, {
             "status": "queued",
             "drive_link": request.google_drive_link,
             "recursive": request.recursive,
-            "created_at": asyncio.get_event_loop().time()
-        }
+            "created_at": time.time()
+        })
 
-        # Start background task
-        background_tasks.add_task(
-            process_transcription_job,
-            job_id=job_id,
-            drive_link=request.google_drive_link,
-            recursive=request.recursive,
-            max_file_size_mb=request.max_file_size_mb,
-            gemini_api_key=gemini_api_key,
-            to_book=request.to_book,
-            book_title=request.book_title,
-            author_name=request.author_name
-        )
+        # Hand the job to the worker pool
+        job_queue.put_nowait({
+            "job_id": job_id,
+            "drive_link": request.google_drive_link,
+            "recursive": request.recursive,
+            "max_file_size_mb": request.max_file_size_mb,
+            "gemini_api_key": gemini_api_key,
+            "to_book": request.to_book,
+            "book_title": request.book_title,
+            "author_name": request.author_name
+        })
 
-        logger.info(f"Transcription job {job_id} queued")
+        logger.info(f"Transcription job {job_id} queued ({job_queue.qsize()} waiting)")
 
         return TranscriptionStatus(
             job_id=job_id,
             status="queued",
-            message="Transcription job started"
+            message="Transcription job queued"
         )
 
     except Exception as e:
@@ -424,12 +815,12 @@ async def get_transcription_status(job_id: str):
     Returns:
         TranscriptionStatus with current job status
     """
-    if job_id not in active_jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = active_jobs[job_id]
-
-    return TranscriptionStatus(
+    # Values come from our own job state, so skip re-validation
+    return TranscriptionStatus.model_construct(
         job_id=job_id,
         status=job.get("status", "unknown"),
         message=f"Job status: {job.get('status', 'unknown')}",
@@ -438,28 +829,107 @@ async def get_transcription_status(job_id: str):
     )
 
 
+@app.get("/transcribe/{job_id}/events")
+async def stream_transcription_events(job_id: str):
+    """
+    Stream job progress as Server-Sent Events
+
+    A snapshot is pushed whenever the job changes, and the stream ends once
+    the job completes or fails. Updates made by another worker process are
+    picked up by re-reading the job store every JOB_EVENTS_POLL_SECONDS.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        text/event-stream response
+    """
+    if await job_store.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        last_snapshot = None
+        event = None
+
+        try:
+            while True:
+                # Grab the wake-up event before reading so no update is missed
+                event = job_events.setdefault(job_id, asyncio.Event())
+
+                job = await job_store.get(job_id)
+                if job is None:
+                    return
+
+                snapshot = {
+                    "job_id": job_id,
+                    "status": job.get("status", "unknown"),
+                    "total_files": job.get("total_files"),
+                    "processed_files": job.get("processed_files"),
+                    "error": job.get("error")
+                }
+                if snapshot != last_snapshot:
+                    last_snapshot = snapshot
+                    yield b"data: " + orjson.dumps(snapshot) + b"\n\n"
+
+                if snapshot["status"] in TERMINAL_STATUSES:
+                    return
+
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=settings.JOB_EVENTS_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Finished, failed or disconnected streams must not leave their
+            # event behind (finished jobs are never notified again); streams
+            # still sharing it re-register on their next poll
+            if event is not None and job_events.get(job_id) is event:
+                del job_events[job_id]
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/transcribe/{job_id}/results")
-async def get_transcription_results(job_id: str):
+async def get_transcription_results(job_id: str, accept_encoding: Optional[str] = Header(None)):
     """
     Get detailed results of completed transcription job
 
     Args:
         job_id: Job ID
+        accept_encoding: Accept-Encoding header; with zstd the stored file is sent as-is
 
     Returns:
         Detailed transcription results
     """
-    if job_id not in active_jobs:
+    job = await job_store.get(job_id, include_results=True)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = active_jobs[job_id]
-
     if job.get("status") != "completed":
         raise HTTPException(
             status_code=400,
             detail=f"Job not completed. Current status: {job.get('status')}"
         )
 
+    # Results persisted on completion are already zstd-compressed JSON - send
+    # them as-is to clients that accept zstd, decompressed otherwise
+    if job.get("results_path"):
+        send_zstd = "zstd" in (accept_encoding or "").lower()
+        try:
+            content = await asyncio.to_thread(
+                read_results_file, job["results_path"], decompress=not send_zstd
+            )
+        except FileNotFoundError:
+            raise HTTPException(status_code=410, detail="Job results are no longer available")
+
+        headers = {"Vary": "Accept-Encoding"}
+        if send_zstd:
+            headers["Content-Encoding"] = "zstd"
+        return Response(content=content, media_type="application/json", headers=headers)
+
     response_data = {
         "job_id": job_id,
         "status": job.get("status"),
@@ -473,13 +943,18 @@ async def get_transcription_results(job_id: str):
     if job.get("book"):
         response_data["book"] = job.get("book")
 
-    return JSONResponse(status_code=200, content=response_data)
+    # Results can hold thousands of transcripts - serialize once with orjson
+    # and hand the bytes straight to the response
+    return Response(
+        content=orjson.dumps(response_data, option=orjson.OPT_NON_STR_KEYS),
+        media_type="application/json"
+    )
 
 
 @app.get("/jobs")
 async def list_jobs():
     """List all transcription jobs"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "jobs": [
@@ -489,7 +964,7 @@ async def list_jobs():
                     "total_files": job.get("total_files"),
                     "processed_files": job.get("processed_files")
                 }
-                for job_id, job in active_jobs.items()
+                for job_id, job in (await job_store.list_jobs()).items()
             ]
         }
     )
@@ -508,7 +983,7 @@ async def get_usage_stats():
 
     try:
         stats = usage_tracker.get_usage_stats()
-        return JSONResponse(status_code=200, content=stats)
+        return ORJSONResponse(status_code=200, content=stats)
     except Exception as e:
         logger.error(f"Failed to get usage stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -527,7 +1002,7 @@ async def get_burn_rate():
 
     try:
         burn_rate = usage_tracker.get_burn_rate()
-        return JSONResponse(status_code=200, content=burn_rate)
+        return ORJSONResponse(status_code=200, content=burn_rate)
     except Exception as e:
         logger.error(f"Failed to get burn rate: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -535,6 +1010,8 @@ async def get_burn_rate():
 
 class TierRequest(BaseModel):
     """Request model for setting API tier"""
+    model_config = API_MODEL_CONFIG
+
     tier: str  # "free" or "paid"
 
 
@@ -555,7 +1032,7 @@ async def set_api_tier(request: TierRequest):
     try:
         usage_tracker.set_tier(request.tier)
         stats = usage_tracker.get_usage_stats()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"message": f"Tier set to {request.tier}", "stats": stats}
         )
@@ -579,7 +1056,7 @@ async def reset_usage_stats():
 
     try:
         usage_tracker.reset_stats()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"message": "Usage statistics reset successfully"}
         )
@@ -588,16 +1065,17 @@ async def reset_usage_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def signal_handler(sig, frame):
-    """Signal handler for graceful shutdown"""
-    print("Received shutdown signal, stopping Audio Transcription Service...")
-    sys.exit(0)
-
-
 if __name__ == "__main__":
     try:
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # One worker unless asked otherwise: usage tracking (and, without
+        # REDIS_URL, job state) lives in each worker process, so with more
+        # workers /usage answers for whichever worker serves the request
+        workers = settings.WORKERS or 1
+
+        if workers > 1:
+            if not settings.REDIS_URL:
+                print("⚠️  Running multiple workers without REDIS_URL - job status will be per-worker")
+            print("⚠️  Running multiple workers - usage tracking is per-worker")
 
         cmd = [
             "gunicorn",
@@ -605,21 +1083,23 @@ if __name__ == "__main__":
             "--bind",
             f"{settings.SERVER_HOST}:{settings.PORT}",
             "--workers",
-            "1",
+            str(workers),
+            "--preload",  # Import the app once and share read-only state via fork
             "--timeout",
             "7200",  # 2 hours timeout for long downloads and transcriptions
+            "--graceful-timeout",
+            str(settings.SHUTDOWN_GRACE_SECONDS + 5),  # Leaves lifespan time to drain jobs
             "--log-level",
             settings.LOG_LEVEL.lower(),
             "-k",
             "uvicorn.workers.UvicornWorker",
         ]
 
-        subprocess.run(cmd, check=True)
-
-    except subprocess.CalledProcessError as e:
-        print(f"Server startup failed with exit code {e.returncode}: {e}")
-        import traceback
-        traceback.print_exc()
+        # Replace this process with gunicorn so SIGTERM/SIGINT reach the
+        # gunicorn master directly and go through the workers' graceful
+        # shutdown (lifespan) instead of killing a wrapper process
+        log_listener.stop()
+        os.execvp(cmd[0], cmd)
 
     except Exception as ex:
         print(f"Unexpected error: {ex}")
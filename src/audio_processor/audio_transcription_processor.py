@@ -4,17 +4,242 @@ Handles audio file transcription using Google Speech-to-Text or Gemini AI
 """
 
 import os
+import atexit
+import functools
 import logging
 import json
+import math
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 import google.generativeai as genai
-from pydub import AudioSegment
+import orjson
 from .transcript_formatter import TranscriptFormatter
+from .transcription_cache import TranscriptionCache, content_hash
+
+# Optional libsndfile bindings for in-process duration probes (falls back to ffprobe)
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+# Optional streaming JSON parser (falls back to orjson.loads)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Codecs Gemini accepts as-is, with the extensions (and so upload MIME types)
+# that match them; anything else is transcoded for speech first
+SUPPORTED_CODECS = {
+    "mp3": ('.mp3',),
+    "aac": ('.m4a', '.aac'),
+    "pcm": ('.wav',),
+    "opus": ('.ogg', '.opus'),
+}
+MAX_SUPPORTED_CHANNELS = 2
+
+# Speech-quality encodings: Gemini gains nothing from more than 16 kHz mono,
+# so uploads are a fraction of the original bytes. MP3 is the fallback for
+# ffmpeg builds without libopus.
+SPEECH_ENCODINGS = (
+    (".ogg", ["-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "24k"]),
+    (".mp3", ["-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "32k"]),
+)
+# Files above this bitrate are re-encoded for speech before upload
+# (when compress_uploads is enabled)
+SPEECH_MAX_BITRATE = 48_000
+
+# Prefixes of the per-call mkdtemp directories under temp_dir
+TEMP_DIR_PREFIXES = ("segments_", "converted_", "chunks_")
+
+TRANSCRIBE_PROMPT = """
+Please transcribe this audio file. Provide:
+1. A complete, accurate transcription of all spoken content
+2. Identify speakers if multiple people are speaking (Speaker 1, Speaker 2, etc.)
+3. Note any significant background sounds or music
+4. Indicate unclear or inaudible sections with [inaudible]
+
+Return the result in JSON format:
+{
+    "transcription": "full transcription text",
+    "language": "detected language",
+    "speakers": ["Speaker 1", "Speaker 2"],
+    "summary": "brief summary of content",
+    "key_topics": ["topic1", "topic2"],
+    "timestamps": [
+        {"time": "00:00", "text": "transcription segment"},
+        {"time": "00:30", "text": "transcription segment"}
+    ]
+}
+"""
+
+# JSON object inside a markdown code fence (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+
+
+def parse_gemini_json(response_text: str):
+    """
+    Parse a JSON object from a Gemini response, with or without a code fence
+
+    Args:
+        response_text: Raw response text
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the response does not contain valid JSON
+    """
+    match = _FENCE_RE.search(response_text)
+    payload = match.group(1) if match else response_text.strip()
+    return orjson.loads(payload)
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_audio(audio_path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Read container and first audio stream metadata with a single ffprobe call
+
+    Cached per (path, mtime, size), so a file rewritten in place (e.g. a
+    reused temp name) is probed again
+
+    Returns:
+        Dict with duration, codec_name, sample_rate, channels and size
+        (empty if the file could not be probed)
+    """
+    try:
+        probe = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "format=duration:stream=codec_name,sample_rate,channels",
+                "-of", "json",
+                audio_path
+            ],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        data = json.loads(probe.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError) as e:
+        logger.error(f"Failed to probe {audio_path}: {e}")
+        return {}
+
+    stream = (data.get("streams") or [{}])[0]
+    return {
+        "duration": float(data.get("format", {}).get("duration", 0) or 0),
+        "codec_name": stream.get("codec_name", ""),
+        "sample_rate": int(stream.get("sample_rate", 0) or 0),
+        "channels": int(stream.get("channels", 0) or 0),
+        "size": size
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _OutputPaths:
+    """Where a batch writes one audio file's results"""
+
+    json_name: str
+    txt_name: str
+    json: str
+    txt: str
+
+    @classmethod
+    def for_audio(cls, audio_path: str, output_dir: str) -> "_OutputPaths":
+        stem = Path(audio_path).stem
+        json_name = f"{stem}_transcription.json"
+        txt_name = f"{stem}_transcript.txt"
+        return cls(
+            json_name=json_name,
+            txt_name=txt_name,
+            json=os.path.join(output_dir, json_name),
+            txt=os.path.join(output_dir, txt_name)
+        )
+
+
+# Processors that may still hold Gemini uploads awaiting deletion
+_live_processors: "weakref.WeakSet[AudioTranscriptionProcessor]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_deletes():
+    """Delete uploads that background flushes did not get to before exit"""
+    for processor in list(_live_processors):
+        processor.flush_deletes()
+
+
+class _GeminiKeyLease:
+    """
+    Serializes use of the process-global Gemini SDK configuration
+
+    genai.configure applies to every thread in the process, so calls made
+    with one API key must not overlap a reconfigure for another. Any number
+    of callers may share the SDK while they use the same key; a caller with
+    a different key waits until they are done, and callers for the current
+    key stop joining once someone is waiting so the other key is not starved.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._key: Optional[str] = None
+        self._active = 0
+        self._waiting = 0
+
+    @contextmanager
+    def hold(self, api_key: str):
+        with self._cond:
+            if not (self._key == api_key and self._active and not self._waiting):
+                self._waiting += 1
+                try:
+                    while self._active and not (self._key == api_key and self._waiting == 1):
+                        self._cond.wait()
+                finally:
+                    self._waiting -= 1
+                if self._key != api_key:
+                    genai.configure(api_key=api_key, transport="grpc")
+                    self._key = api_key
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                if not self._active:
+                    self._cond.notify_all()
+
+
+_gemini_lease = _GeminiKeyLease()
+
+# Gemini transcriptions in flight across every processor in the process:
+# jobs x files x chunks would otherwise multiply without bound. Sized by
+# the first processor created.
+_gemini_call_slots: Optional[threading.BoundedSemaphore] = None
+_gemini_call_slots_lock = threading.Lock()
+
+
+def _get_gemini_call_slots(limit: int) -> threading.BoundedSemaphore:
+    """Get the process-wide Gemini call semaphore, creating it on first use"""
+    global _gemini_call_slots
+    with _gemini_call_slots_lock:
+        if _gemini_call_slots is None:
+            _gemini_call_slots = threading.BoundedSemaphore(max(1, limit))
+        return _gemini_call_slots
+
 
 class AudioTranscriptionProcessor:
     """Processor for transcribing audio files using Google Gemini"""
@@ -25,7 +250,17 @@ class AudioTranscriptionProcessor:
         model_name: str = "gemini-2.5-flash",
         temp_dir: str = "/tmp/audio_processing",
         cleanup_temp_files: bool = True,
-        max_chunk_size_mb: int = 20
+        max_chunk_size_mb: int = 20,
+        segment_duration_seconds: int = 600,
+        max_concurrency: int = 4,
+        max_chunk_concurrency: int = 4,
+        max_poll_seconds: float = 600,
+        cache_enabled: bool = True,
+        cache_path: Optional[str] = None,
+        compress_uploads: bool = True,
+        cache_max_entries: int = 10_000,
+        cache_max_age_seconds: float = 30 * 86400,
+        max_gemini_calls: int = 8
     ):
         """
         Initialize the audio transcription processor
@@ -36,15 +271,34 @@ class AudioTranscriptionProcessor:
             temp_dir: Temporary directory for processing
             cleanup_temp_files: Whether to clean up temporary files after processing
             max_chunk_size_mb: Maximum audio chunk size in MB for processing
+            segment_duration_seconds: Files longer than this are cut into segments
+                of this length before upload (0 disables duration segmentation)
+            max_concurrency: Files transcribed in parallel by batch_transcribe
+            max_chunk_concurrency: Chunks of one file transcribed in parallel
+            max_poll_seconds: How long to wait for Gemini to process an upload
+            cache_enabled: Whether to reuse results for audio transcribed before
+            cache_path: Transcription cache database (default: temp_dir/cache.db)
+            compress_uploads: Re-encode high-bitrate audio to 16 kHz mono speech
+                quality before upload
+            cache_max_entries: Cached results kept (oldest dropped first)
+            cache_max_age_seconds: How long cached results are kept
+            max_gemini_calls: Gemini transcriptions in flight at once across
+                the whole process (set by the first processor created)
         """
         self.gemini_api_key = gemini_api_key
         self.model_name = model_name
         self.temp_dir = temp_dir
         self.cleanup_temp_files = cleanup_temp_files
         self.max_chunk_size_mb = max_chunk_size_mb
-
-        # Configure Gemini
-        genai.configure(api_key=self.gemini_api_key)
+        self.segment_duration_seconds = segment_duration_seconds
+        self.max_concurrency = max_concurrency
+        self.max_chunk_concurrency = max_chunk_concurrency
+        self.max_poll_seconds = max_poll_seconds
+        self.compress_uploads = compress_uploads
+        self._gemini_call_slots = _get_gemini_call_slots(max_gemini_calls)
+
+        # The model binds the SDK client lazily, on its first call under
+        # gemini_session(), so it always talks with this processor's key
         self.model = genai.GenerativeModel(model_name)
 
         # Initialize transcript formatter
@@ -53,64 +307,262 @@ class AudioTranscriptionProcessor:
         # Create temp directory
         os.makedirs(self.temp_dir, exist_ok=True)
 
+        # Uploaded Gemini files are deleted off the critical path
+        self._pending_deletes: List[str] = []
+        self._pending_deletes_lock = threading.Lock()
+        _live_processors.add(self)
+
+        # Results keyed by the input's content hash, so repeated audio skips
+        # conversion and Gemini
+        self.cache = None
+        if cache_enabled:
+            self.cache = TranscriptionCache(
+                cache_path or os.path.join(self.temp_dir, "cache.db"),
+                max_entries=cache_max_entries,
+                max_age_seconds=cache_max_age_seconds
+            )
+
         logger.info(f"AudioTranscriptionProcessor initialized with model: {model_name}")
 
+    def gemini_session(self):
+        """
+        Context manager for calls into the Gemini SDK with this processor's key
+
+        genai.configure is process-global, so the SDK is only reconfigured
+        once no call made with another key is still in flight (see
+        _GeminiKeyLease). Calls with the same key run concurrently. The gRPC
+        transport keeps one HTTP/2 channel open, so concurrent uploads and
+        generate calls share a connection instead of handshaking each time
+        """
+        return _gemini_lease.hold(self.gemini_api_key)
+
     def get_audio_duration(self, audio_path: str) -> float:
         """
         Get audio file duration in seconds
 
+        Only container metadata is read, never the audio itself: libsndfile
+        in-process for the formats it supports (WAV, FLAC, OGG, ...), the
+        cached ffprobe metadata for everything else (MP3/M4A on older
+        libsndfile builds, AAC, ...)
+
         Args:
             audio_path: Path to audio file
 
         Returns:
             Duration in seconds
         """
+        if SOUNDFILE_AVAILABLE:
+            try:
+                info = sf.info(audio_path)
+                if info.samplerate:
+                    return info.frames / info.samplerate
+            except RuntimeError:
+                # Format not supported by libsndfile - fall through to ffprobe
+                pass
+
+        return self._probe(audio_path).get("duration", 0.0)
+
+    def _probe(self, audio_path: str) -> Dict:
+        """
+        Get cached audio metadata (duration, codec_name, sample_rate, channels, size)
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Metadata dict (empty if the file could not be probed)
+        """
         try:
-            audio = AudioSegment.from_file(audio_path)
-            duration = len(audio) / 1000.0  # Convert to seconds
-            return duration
-        except Exception as e:
-            logger.error(f"Failed to get audio duration: {e}")
-            return 0.0
+            stat = os.stat(audio_path)
+        except OSError as e:
+            logger.error(f"Failed to get audio metadata: {e}")
+            return {}
+        return _probe_audio(audio_path, stat.st_mtime_ns, stat.st_size)
+
+    def _supported_codec(self, audio_path: str) -> Optional[str]:
+        """
+        Get the SUPPORTED_CODECS family of a file's audio stream
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            "mp3", "aac", "pcm" or "opus", or None if the stream must be transcoded
+            (unknown codec or more than MAX_SUPPORTED_CHANNELS channels)
+        """
+        info = self._probe(audio_path)
+        codec = info.get("codec_name", "")
+        family = "pcm" if codec.startswith("pcm_") else codec
+
+        if family in SUPPORTED_CODECS and info.get("channels", 0) <= MAX_SUPPORTED_CHANNELS:
+            return family
+        return None
+
+    def _needs_conversion(self, audio_path: str) -> bool:
+        """
+        Check whether a file must be converted before upload
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            True unless both the codec and the extension (which decides the
+            upload MIME type) are supported as-is
+        """
+        family = self._supported_codec(audio_path)
+        return not (family and audio_path.lower().endswith(SUPPORTED_CODECS[family]))
+
+    def _exceeds_speech_bitrate(self, audio_path: str) -> bool:
+        """
+        Check whether a file carries more bits per second than speech needs
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            True if the average bitrate is above SPEECH_MAX_BITRATE
+        """
+        info = self._probe(audio_path)
+        duration = info.get("duration", 0)
+        if duration <= 0:
+            return False
+        return info["size"] * 8 / duration > SPEECH_MAX_BITRATE
+
+    def segment_audio(self, audio_path: str, segment_seconds: int) -> List[str]:
+        """
+        Cut audio into fixed-length segments with ffmpeg's segment muxer
+
+        **Memory-efficient:** streams are copied, nothing is decoded in Python
+
+        Args:
+            audio_path: Path to audio file
+            segment_seconds: Length of each segment in seconds
+
+        Returns:
+            List of segment paths in playback order
+        """
+        ext = os.path.splitext(audio_path)[1].lower() or ".mp3"
+        segment_dir = tempfile.mkdtemp(prefix="segments_", dir=self.temp_dir)
+
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg", "-v", "error", "-y",
+                    "-i", audio_path,
+                    "-map", "0:a",
+                    "-f", "segment",
+                    "-segment_time", str(segment_seconds),
+                    "-reset_timestamps", "1",
+                    "-c", "copy",
+                    os.path.join(segment_dir, f"segment_%03d{ext}")
+                ],
+                capture_output=True,
+                check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+            logger.error(f"Failed to segment audio: {e}")
+            return [audio_path]
+
+        segments = sorted(
+            os.path.join(segment_dir, name) for name in os.listdir(segment_dir)
+        )
+        logger.info(f"Cut {audio_path} into {len(segments)} segments of {segment_seconds}s")
+        return segments or [audio_path]
 
     def convert_to_supported_format(self, audio_path: str) -> str:
         """
         Convert audio to a format supported by Gemini (MP3, WAV, etc.)
 
+        A supported stream in the wrong container (e.g. AAC without an .m4a
+        extension) is only remuxed with stream copy; everything else is
+        transcoded to speech-quality Opus (or MP3)
+
         Args:
             audio_path: Path to audio file
 
         Returns:
             Path to converted audio file
         """
+        # Private directory per call: files are converted concurrently and
+        # different inputs can share a stem (a.mp3/a.wav, sub1/x.mp3/sub2/x.mp3)
+        output_dir = tempfile.mkdtemp(prefix="converted_", dir=self.temp_dir)
         try:
-            audio = AudioSegment.from_file(audio_path)
+            family = self._supported_codec(audio_path)
+            stem = os.path.join(output_dir, Path(audio_path).stem)
 
-            # Convert to MP3 with reasonable quality
-            output_path = os.path.join(
-                self.temp_dir,
-                f"converted_{Path(audio_path).stem}.mp3"
-            )
+            if family and not (self.compress_uploads and self._exceeds_speech_bitrate(audio_path)):
+                # Container-only change: copy the audio stream as-is
+                output_path = stem + SUPPORTED_CODECS[family][0]
+                try:
+                    self._run_ffmpeg(audio_path, ["-c:a", "copy"], output_path)
+                    logger.info(f"Remuxed audio to: {output_path}")
+                    return output_path
+                except subprocess.CalledProcessError as e:
+                    # e.g. big-endian PCM cannot be copied into WAV
+                    logger.warning(f"Remux failed for {audio_path}, transcoding: {e.stderr!r}")
 
-            audio.export(
-                output_path,
-                format="mp3",
-                bitrate="128k",
-                parameters=["-ac", "1"]  # Mono audio
-            )
+            # Transcode in a single ffmpeg pass (nothing is decoded into
+            # Python memory)
+            output_path = self._encode_for_speech(audio_path, stem)
 
             logger.info(f"Converted audio to: {output_path}")
             return output_path
 
         except Exception as e:
             logger.error(f"Failed to convert audio: {e}")
+            shutil.rmtree(output_dir, ignore_errors=True)
             raise
 
+    def _encode_for_speech(self, audio_path: str, stem: str, input_args: Iterable[str] = ()) -> str:
+        """
+        Transcode audio to the first SPEECH_ENCODINGS entry ffmpeg can write
+
+        Args:
+            audio_path: Path to audio file
+            stem: Output path without extension
+            input_args: Arguments placed before -i (e.g. -ss/-t for chunks)
+
+        Returns:
+            Path to the encoded file
+        """
+        for i, (ext, codec_args) in enumerate(SPEECH_ENCODINGS):
+            output_path = stem + ext
+            try:
+                self._run_ffmpeg(audio_path, codec_args, output_path, input_args)
+                return output_path
+            except subprocess.CalledProcessError as e:
+                if i == len(SPEECH_ENCODINGS) - 1:
+                    raise
+                logger.warning(f"{ext} speech encoding failed for {audio_path}, trying next: {e.stderr!r}")
+
+    def _run_ffmpeg(
+        self,
+        audio_path: str,
+        codec_args: List[str],
+        output_path: str,
+        input_args: Iterable[str] = ()
+    ):
+        """Write the first audio stream of a file to output_path with the given codec args"""
+        subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-v", "error", "-y",
+                *input_args,
+                "-i", audio_path,
+                "-map", "0:a",
+                *codec_args,
+                output_path
+            ],
+            capture_output=True,
+            check=True
+        )
+
     def split_audio_if_needed(self, audio_path: str) -> List[str]:
         """
         Split audio file into chunks if it exceeds max size
 
-        **Memory-efficient:** Uses file size, not in-memory loading
+        **Memory-efficient:** Uses file size, not in-memory loading, and cuts
+        chunks with ffmpeg stream copy (no decode, no re-encode)
 
         Args:
             audio_path: Path to audio file
@@ -123,26 +575,26 @@ class AudioTranscriptionProcessor:
         if file_size_mb <= self.max_chunk_size_mb:
             return [audio_path]
 
-        try:
-            audio = AudioSegment.from_file(audio_path)
-            duration_ms = len(audio)
+        duration = self.get_audio_duration(audio_path)
+        if duration <= 0:
+            logger.warning(f"Unknown duration for {audio_path}, not splitting")
+            return [audio_path]
 
-            # Calculate chunk duration based on file size
-            num_chunks = int(file_size_mb / self.max_chunk_size_mb) + 1
-            chunk_duration_ms = duration_ms // num_chunks
+        # Fewest chunks that each fit the size limit (at the file's average
+        # bitrate), all the same length
+        num_chunks = math.ceil(file_size_mb / self.max_chunk_size_mb)
+        chunk_duration = duration / num_chunks
 
-            chunks = []
+        # Private directory per call: concurrent files and jobs share temp_dir
+        # and same-named inputs would otherwise overwrite each other's chunks
+        chunk_dir = tempfile.mkdtemp(prefix="chunks_", dir=self.temp_dir)
+        chunks = []
+        try:
             for i in range(num_chunks):
-                start = i * chunk_duration_ms
-                end = start + chunk_duration_ms if i < num_chunks - 1 else duration_ms
-
-                chunk = audio[start:end]
-                chunk_path = os.path.join(
-                    self.temp_dir,
-                    f"chunk_{i}_{Path(audio_path).name}"
+                chunk_path = os.path.join(chunk_dir, f"chunk_{i}_{Path(audio_path).name}")
+                chunk_path = self._extract_chunk(
+                    audio_path, i * chunk_duration, chunk_duration, chunk_path
                 )
-
-                chunk.export(chunk_path, format="mp3", bitrate="128k")
                 chunks.append(chunk_path)
 
                 logger.info(f"Created chunk {i+1}/{num_chunks}: {chunk_path}")
@@ -151,8 +603,45 @@ class AudioTranscriptionProcessor:
 
         except Exception as e:
             logger.error(f"Failed to split audio: {e}")
+            shutil.rmtree(chunk_dir, ignore_errors=True)
             return [audio_path]
 
+    def _extract_chunk(self, audio_path: str, start: float, duration: float, chunk_path: str) -> str:
+        """
+        Cut one chunk out of an audio file with ffmpeg
+
+        Streams are copied as-is; only if the container cannot be cut that
+        way is the chunk re-encoded at speech quality
+
+        Args:
+            audio_path: Path to audio file
+            start: Chunk start in seconds
+            duration: Chunk length in seconds
+            chunk_path: Destination path
+
+        Returns:
+            Path to the written chunk
+        """
+        base_cmd = [
+            "ffmpeg", "-hide_banner", "-v", "error", "-y",
+            "-ss", f"{start:.3f}",
+            "-i", audio_path,
+            "-t", f"{duration:.3f}",
+            "-map", "0:a"
+        ]
+
+        try:
+            subprocess.run(base_cmd + ["-c", "copy", chunk_path], capture_output=True, check=True)
+            return chunk_path
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Stream copy failed for {audio_path}, re-encoding chunk: {e.stderr!r}")
+
+        return self._encode_for_speech(
+            audio_path,
+            os.path.splitext(chunk_path)[0],
+            ["-ss", f"{start:.3f}", "-t", f"{duration:.3f}"]
+        )
+
     def _get_mime_type(self, audio_path: str) -> str:
         """Get MIME type for audio file"""
         ext = os.path.splitext(audio_path)[1].lower()
@@ -177,93 +666,188 @@ class AudioTranscriptionProcessor:
         Returns:
             Dictionary with transcription results
         """
+        return self._transcribe_chunk(audio_path)[0]
+
+    def _transcribe_chunk(self, audio_path: str) -> Tuple[Dict, bool]:
+        """
+        Transcribe one uploadable file with Gemini
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Tuple of (transcription result, whether it is worth caching: the
+            response parsed as JSON and the transcription is not empty)
+        """
         try:
             logger.info(f"Starting transcription for: {audio_path}")
             start_time = time.time()
 
-            # Get MIME type for the file
-            mime_type = self._get_mime_type(audio_path)
-            logger.info(f"Detected MIME type: {mime_type}")
-
-            # Upload audio file to Gemini with explicit MIME type
-            audio_file = genai.upload_file(audio_path, mime_type=mime_type)
-            logger.info(f"Uploaded audio file: {audio_file.name}")
-
-            # Wait for file to be processed
-            while audio_file.state.name == "PROCESSING":
-                time.sleep(2)
-                audio_file = genai.get_file(audio_file.name)
-
-            if audio_file.state.name == "FAILED":
-                raise ValueError(f"Audio processing failed: {audio_file.state.name}")
-
-            # Create transcription prompt
-            prompt = """
-            Please transcribe this audio file. Provide:
-            1. A complete, accurate transcription of all spoken content
-            2. Identify speakers if multiple people are speaking (Speaker 1, Speaker 2, etc.)
-            3. Note any significant background sounds or music
-            4. Indicate unclear or inaudible sections with [inaudible]
-
-            Return the result in JSON format:
-            {
-                "transcription": "full transcription text",
-                "language": "detected language",
-                "speakers": ["Speaker 1", "Speaker 2"],
-                "summary": "brief summary of content",
-                "key_topics": ["topic1", "topic2"],
-                "timestamps": [
-                    {"time": "00:00", "text": "transcription segment"},
-                    {"time": "00:30", "text": "transcription segment"}
-                ]
-            }
-            """
+            with self._gemini_call_slots, self.gemini_session():
+                # Get MIME type for the file
+                mime_type = self._get_mime_type(audio_path)
+                logger.info(f"Detected MIME type: {mime_type}")
+
+                # Upload audio file to Gemini with explicit MIME type
+                audio_file = genai.upload_file(audio_path, mime_type=mime_type)
+                logger.info(f"Uploaded audio file: {audio_file.name}")
+
+                # Wait for file to be processed (exponential backoff with jitter,
+                # so short clips are picked up quickly without hammering the API)
+                delay = 0.25
+                poll_deadline = time.monotonic() + self.max_poll_seconds
+                while audio_file.state.name == "PROCESSING":
+                    if time.monotonic() > poll_deadline:
+                        genai.delete_file(audio_file.name)
+                        raise TimeoutError(
+                            f"Gemini did not finish processing {audio_file.name} "
+                            f"within {self.max_poll_seconds}s"
+                        )
+                    time.sleep(delay + random.uniform(0, delay * 0.1))
+                    delay = min(delay * 2, 4.0)
+                    audio_file = genai.get_file(audio_file.name)
+
+                if audio_file.state.name == "FAILED":
+                    raise ValueError(f"Audio processing failed: {audio_file.state.name}")
+
+                # Generate transcription (streamed and parsed as it arrives)
+                response_text, result = self._stream_generate_json([TRANSCRIBE_PROMPT, audio_file])
+
+                processing_time = time.time() - start_time
+                logger.info(f"Transcription completed in {processing_time:.2f} seconds")
+
+                # Fall back to parsing the buffered response
+                parsed = True
+                if result is None:
+                    result, parsed = self._parse_response_text(response_text)
+
+                # Add metadata
+                result["processing_time"] = processing_time
+                result["model"] = self.model_name
+                result["file_name"] = os.path.basename(audio_path)
+                result["file_size_mb"] = os.path.getsize(audio_path) / (1024 * 1024)
+
+                # Uploaded file is deleted in the background by transcribe_file
+                with self._pending_deletes_lock:
+                    self._pending_deletes.append(audio_file.name)
+
+            # Only proper results are cached: a raw-text fallback or an empty
+            # transcription would otherwise be served for this audio forever
+            transcription = result.get("transcription")
+            return result, parsed and isinstance(transcription, str) and bool(transcription.strip())
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
 
-            # Generate transcription
-            response = self.model.generate_content([prompt, audio_file])
+    def _stream_generate_json(self, contents: List) -> Tuple[str, Optional[Dict]]:
+        """
+        Stream a Gemini response and parse its JSON body while chunks arrive
+
+        Top-level fields are decoded as soon as they are complete, so parsing
+        overlaps with generation instead of starting after the last chunk.
+
+        Args:
+            contents: Inputs for generate_content
+
+        Returns:
+            Tuple of (full response text, parsed result or None if the
+            streaming parse did not produce a complete object)
+
+        Raises:
+            ValueError: If the stream carried no text at all (e.g. the
+                prompt or response was blocked by safety filters)
+        """
+        chunks = []
+        fields = {}
+        pending = held = ""
+        started = finished = False
 
-            processing_time = time.time() - start_time
-            logger.info(f"Transcription completed in {processing_time:.2f} seconds")
+        events = ijson.sendable_list() if IJSON_AVAILABLE else None
+        parser = ijson.kvitems_coro(events, '', use_float=True) if IJSON_AVAILABLE else None
 
-            # Parse response
+        response = self.model.generate_content(contents, stream=True)
+        for chunk in response:
             try:
-                # Try to extract JSON from response
-                response_text = response.text.strip()
-
-                # Remove markdown code blocks if present
-                if response_text.startswith("```json"):
-                    response_text = response_text[7:]
-                if response_text.startswith("```"):
-                    response_text = response_text[3:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-
-                result = json.loads(response_text.strip())
-            except json.JSONDecodeError:
-                # Fallback: use raw text as transcription
-                result = {
-                    "transcription": response.text,
-                    "language": "unknown",
-                    "speakers": [],
-                    "summary": "",
-                    "key_topics": [],
-                    "timestamps": []
-                }
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. final finish metadata)
+                continue
+
+            chunks.append(text)
+            if parser is None or finished:
+                continue
+
+            # Skip anything before the object, such as a ```json fence
+            if not started:
+                pending += text
+                brace = pending.find("{")
+                if brace < 0:
+                    continue
+                text, pending, started = pending[brace:], "", True
 
-            # Add metadata
-            result["processing_time"] = processing_time
-            result["model"] = self.model_name
-            result["file_name"] = os.path.basename(audio_path)
-            result["file_size_mb"] = os.path.getsize(audio_path) / (1024 * 1024)
+            # A closing fence ends the JSON body; trailing backticks are held
+            # back in case the fence is split across chunks
+            text = held + text
+            fence = text.find("```")
+            if fence >= 0:
+                text, held, finished = text[:fence], "", True
+            else:
+                body = text.rstrip("`")
+                text, held = body, text[len(body):]
 
-            # Clean up uploaded file
-            genai.delete_file(audio_file.name)
+            if not text:
+                continue
 
-            return result
+            try:
+                parser.send(text.encode("utf-8"))
+                fields.update(events)
+                del events[:]
+            except ijson.JSONError:
+                parser = None
 
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            raise
+        if not chunks:
+            feedback = getattr(response, "prompt_feedback", None)
+            raise ValueError(f"Gemini returned no text for the audio (prompt feedback: {feedback})")
+
+        response_text = "".join(chunks)
+
+        if parser is not None and started:
+            try:
+                if held:
+                    parser.send(held.encode("utf-8"))
+                parser.close()
+                fields.update(events)
+                if "transcription" in fields:
+                    return response_text, fields
+            except ijson.JSONError:
+                pass
+
+        return response_text, None
+
+    def _parse_response_text(self, response_text: str) -> Tuple[Dict, bool]:
+        """
+        Parse a buffered Gemini response
+
+        Args:
+            response_text: Full response text
+
+        Returns:
+            Tuple of (parsed result, or the raw text as transcription if it is
+            not JSON; whether the response parsed as JSON)
+        """
+        try:
+            return parse_gemini_json(response_text), True
+        except json.JSONDecodeError:
+            # Fallback: use raw text as transcription
+            return {
+                "transcription": response_text,
+                "language": "unknown",
+                "speakers": [],
+                "summary": "",
+                "key_topics": [],
+                "timestamps": []
+            }, False
 
     def transcribe_file(self, audio_path: str) -> Dict:
         """
@@ -277,84 +861,178 @@ class AudioTranscriptionProcessor:
         """
         logger.info(f"Processing audio file: {audio_path}")
 
-        # Convert to supported format if needed
+        # The original input is hashed (conversion output is not
+        # byte-for-byte reproducible), so a hit also skips ffmpeg
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(audio_path)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Transcription cache hit for: {audio_path}")
+                cached["file_name"] = os.path.basename(audio_path)
+                cached["cached"] = True
+                return cached
+
+        # Convert to supported format if needed (decided from the probed
+        # codec; the probe is cached for the duration lookup below)
         converted_path = audio_path
-        if not audio_path.lower().endswith(('.mp3', '.wav', '.m4a')):
-            converted_path = self.convert_to_supported_format(audio_path)
+        chunks: List[str] = []
+        try:
+            if self._needs_conversion(audio_path) or (
+                self.compress_uploads and self._exceeds_speech_bitrate(audio_path)
+            ):
+                converted_path = self.convert_to_supported_format(audio_path)
+
+            # Long files are cut by duration so memory stays flat regardless of
+            # length; shorter ones are only split if they exceed the size limit
+            duration = self.get_audio_duration(converted_path)
+            if self.segment_duration_seconds and duration > self.segment_duration_seconds:
+                chunks = self.segment_audio(converted_path, self.segment_duration_seconds)
+                chunk_seconds = self.segment_duration_seconds
+            else:
+                chunks = self.split_audio_if_needed(converted_path)
+                chunk_seconds = duration / len(chunks)
+
+            if len(chunks) == 1:
+                # Single file transcription
+                result, cacheable = self._transcribe_chunk(chunks[0])
+            else:
+                # Multiple chunks - transcribe them in parallel (map keeps chunk
+                # order for the merge) and merge
+                logger.info(f"Processing {len(chunks)} audio chunks")
+                workers = max(1, min(self.max_chunk_concurrency, len(chunks)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    chunk_outcomes = list(executor.map(self._transcribe_chunk, chunks))
+
+                # Merge results, shifting chunk timestamps to file time
+                chunk_results = [chunk_result for chunk_result, _ in chunk_outcomes]
+                chunk_offsets = [i * chunk_seconds for i in range(len(chunks))]
+                result = self._merge_chunk_results(chunk_results, chunk_offsets)
+                result["num_chunks"] = len(chunks)
+                cacheable = all(chunk_cacheable for _, chunk_cacheable in chunk_outcomes)
+
+            if cache_key is not None and cacheable:
+                self.cache.set(cache_key, result)
+        finally:
+            # Also after a failed chunk, so temp dirs are not left behind
+            if self.cleanup_temp_files:
+                self._cleanup_temp_files(chunks, converted_path, audio_path)
+
+            # Delete this file's Gemini uploads without holding up the result
+            threading.Thread(target=self.flush_deletes, daemon=True).start()
 
-        # Split if file is too large
-        chunks = self.split_audio_if_needed(converted_path)
+        return result
+
+    def _cache_key(self, audio_path: str) -> str:
+        """
+        Cache key for a whole input file
 
-        if len(chunks) == 1:
-            # Single file transcription
-            result = self.transcribe_audio_with_gemini(chunks[0])
-        else:
-            # Multiple chunks - transcribe each and merge
-            logger.info(f"Processing {len(chunks)} audio chunks")
-            chunk_results = []
+        Covers everything that changes what is sent to Gemini: the model, the
+        original content, and the conversion and segmentation settings
+        """
+        return (
+            f"{self.model_name}:{content_hash(audio_path)}:"
+            f"compress={int(self.compress_uploads)}:"
+            f"segment={self.segment_duration_seconds}:max_mb={self.max_chunk_size_mb}"
+        )
 
-            for i, chunk_path in enumerate(chunks):
-                logger.info(f"Transcribing chunk {i+1}/{len(chunks)}")
-                chunk_result = self.transcribe_audio_with_gemini(chunk_path)
-                chunk_results.append(chunk_result)
+    def flush_deletes(self):
+        """
+        Delete all uploaded Gemini files that are pending deletion
 
-            # Merge results
-            result = self._merge_chunk_results(chunk_results)
-            result["num_chunks"] = len(chunks)
+        Failures are only logged - Gemini expires uploads on its own after 48 hours
+        """
+        with self._pending_deletes_lock:
+            names, self._pending_deletes = self._pending_deletes, []
 
-        # Cleanup temporary files
-        if self.cleanup_temp_files:
-            self._cleanup_temp_files(chunks, converted_path, audio_path)
+        if not names:
+            return
 
-        return result
+        with self.gemini_session():
+            for name in names:
+                try:
+                    genai.delete_file(name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete uploaded file {name}: {e}")
 
-    def _merge_chunk_results(self, chunk_results: List[Dict]) -> Dict:
+    def _merge_chunk_results(
+        self,
+        chunk_results: List[Dict],
+        chunk_offsets: Optional[List[float]] = None
+    ) -> Dict:
         """
         Merge results from multiple audio chunks
 
         Args:
             chunk_results: List of chunk transcription results
+            chunk_offsets: Start time of each chunk within the file, in seconds
 
         Returns:
             Merged transcription result
         """
-        merged = {
-            "transcription": "",
+        # Single pass over the chunks; dicts keep unique speakers/topics in
+        # first-seen order
+        transcription_parts = []
+        summary_parts = []
+        speakers = {}
+        topics = {}
+        timestamps = []
+        total_time = 0.0
+        total_size = 0.0
+
+        chunk_offsets = chunk_offsets or [0] * len(chunk_results)
+        for r, offset in zip(chunk_results, chunk_offsets):
+            transcription_parts.append(r.get("transcription", ""))
+
+            summary = r.get("summary")
+            if summary:
+                summary_parts.append(summary)
+
+            speakers.update(dict.fromkeys(r.get("speakers", ())))
+            topics.update(dict.fromkeys(r.get("key_topics", ())))
+
+            # Offset timestamps by the chunk's start time
+            for entry in r.get("timestamps", ()):
+                seconds = self._parse_timestamp(entry.get("time", ""))
+                if seconds is not None:
+                    entry = {**entry, "time": self._format_timestamp(seconds + offset)}
+                timestamps.append(entry)
+
+            total_time += r.get("processing_time", 0)
+            total_size += r.get("file_size_mb", 0)
+
+        return {
+            "transcription": " ".join(transcription_parts),
             "language": chunk_results[0].get("language", "unknown"),
-            "speakers": [],
-            "summary": "",
-            "key_topics": [],
-            "timestamps": [],
-            "processing_time": 0,
+            "speakers": list(speakers),
+            "summary": " ".join(summary_parts),
+            "key_topics": list(topics),
+            "timestamps": timestamps,
+            "processing_time": total_time,
             "model": self.model_name,
             "file_name": chunk_results[0].get("file_name", ""),
-            "file_size_mb": sum(r.get("file_size_mb", 0) for r in chunk_results)
+            "file_size_mb": total_size
         }
 
-        # Merge transcriptions
-        transcriptions = [r.get("transcription", "") for r in chunk_results]
-        merged["transcription"] = " ".join(transcriptions)
-
-        # Merge speakers (unique)
-        all_speakers = []
-        for r in chunk_results:
-            all_speakers.extend(r.get("speakers", []))
-        merged["speakers"] = list(set(all_speakers))
-
-        # Merge key topics (unique)
-        all_topics = []
-        for r in chunk_results:
-            all_topics.extend(r.get("key_topics", []))
-        merged["key_topics"] = list(set(all_topics))
-
-        # Merge summaries
-        summaries = [r.get("summary", "") for r in chunk_results if r.get("summary")]
-        merged["summary"] = " ".join(summaries)
-
-        # Sum processing times
-        merged["processing_time"] = sum(r.get("processing_time", 0) for r in chunk_results)
-
-        return merged
+    @staticmethod
+    def _parse_timestamp(value: str) -> Optional[float]:
+        """Parse an "MM:SS" or "HH:MM:SS" timestamp into seconds"""
+        try:
+            seconds = 0.0
+            for part in str(value).split(":"):
+                seconds = seconds * 60 + float(part)
+            return seconds
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _format_timestamp(seconds: float) -> str:
+        """Format seconds as "MM:SS", or "HH:MM:SS" past the first hour"""
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, secs = divmod(remainder, 60)
+        if hours:
+            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
 
     def _cleanup_temp_files(
         self,
@@ -362,22 +1040,40 @@ class AudioTranscriptionProcessor:
         converted_path: str,
         original_path: str
     ):
-        """Clean up temporary files after processing"""
+        """Clean up temporary files (and their per-call directories) after processing"""
+        temp_dirs = {
+            os.path.dirname(path) for path in (*chunks, converted_path)
+            if path != original_path
+        }
+
         for chunk_path in chunks:
-            if chunk_path != original_path and os.path.exists(chunk_path):
+            if chunk_path != original_path:
                 try:
                     os.remove(chunk_path)
                     logger.debug(f"Removed temporary chunk: {chunk_path}")
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.warning(f"Failed to remove chunk {chunk_path}: {e}")
 
-        if converted_path != original_path and os.path.exists(converted_path):
+        if converted_path != original_path:
             try:
                 os.remove(converted_path)
                 logger.debug(f"Removed converted file: {converted_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to remove converted file {converted_path}: {e}")
 
+        # Only the mkdtemp directories created for this file, never TEMP_DIR
+        # itself or the input's own folder
+        for temp_dir in temp_dirs:
+            if (
+                os.path.dirname(temp_dir) == os.path.normpath(self.temp_dir)
+                and os.path.basename(temp_dir).startswith(TEMP_DIR_PREFIXES)
+            ):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
     def batch_transcribe(
         self,
         audio_files: List[str],
@@ -386,59 +1082,37 @@ class AudioTranscriptionProcessor:
         """
         Transcribe multiple audio files
 
+        Up to max_concurrency files are in flight at once - each one is
+        dominated by Gemini upload/generate round-trips, so they overlap well
+        on threads
+
         Args:
             audio_files: List of audio file paths
             output_dir: Directory to save transcription results (optional)
 
         Returns:
-            List of transcription results
+            List of transcription results (in input order)
         """
-        results = []
-
-        logger.info(f"Starting batch transcription of {len(audio_files)} files")
-
-        for i, audio_path in enumerate(audio_files, 1):
-            logger.info(f"Processing file {i}/{len(audio_files)}: {audio_path}")
+        total_files = len(audio_files)
 
-            # Check if already transcribed (skip if exists)
-            if output_dir and self._is_already_transcribed(audio_path, output_dir):
-                logger.info(f"⏭️  Skipping already transcribed file: {audio_path}")
-
-                # Load existing result
-                try:
-                    existing_result = self._load_existing_transcription(audio_path, output_dir)
-                    results.append({
-                        "file_path": audio_path,
-                        "success": True,
-                        "result": existing_result,
-                        "skipped": True
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to load existing transcription, will re-transcribe: {e}")
-                    # Continue to transcription if loading fails
-                    pass
-                else:
-                    continue
-
-            try:
-                result = self.transcribe_file(audio_path)
-                results.append({
-                    "file_path": audio_path,
-                    "success": True,
-                    "result": result
-                })
+        logger.info(
+            f"Starting batch transcription of {total_files} files "
+            f"({self.max_concurrency} concurrent)"
+        )
 
-                # Save individual result if output directory is specified
-                if output_dir:
-                    self._save_transcription_result(audio_path, result, output_dir)
+        # One directory listing instead of two stat calls per file
+        existing_outputs = frozenset()
+        if output_dir and os.path.isdir(output_dir):
+            with os.scandir(output_dir) as entries:
+                existing_outputs = frozenset(entry.name for entry in entries)
 
-            except Exception as e:
-                logger.error(f"Failed to transcribe {audio_path}: {e}")
-                results.append({
-                    "file_path": audio_path,
-                    "success": False,
-                    "error": str(e)
-                })
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            results = list(executor.map(
+                lambda item: self._batch_transcribe_one(
+                    item[0], total_files, item[1], output_dir, existing_outputs
+                ),
+                enumerate(audio_files, 1)
+            ))
 
         logger.info(f"Batch transcription completed: {len(results)} files processed")
 
@@ -451,6 +1125,69 @@ class AudioTranscriptionProcessor:
 
         return results
 
+    def _batch_transcribe_one(
+        self,
+        index: int,
+        total_files: int,
+        audio_path: str,
+        output_dir: Optional[str],
+        existing_outputs: frozenset = frozenset()
+    ) -> Dict:
+        """
+        Transcribe one file of a batch (skipping files that were already transcribed)
+
+        Args:
+            index: 1-based position of the file in the batch
+            total_files: Number of files in the batch
+            audio_path: Path to audio file
+            output_dir: Directory to save transcription results (optional)
+            existing_outputs: File names in output_dir when the batch started
+
+        Returns:
+            Batch result entry for the file
+        """
+        logger.info(f"Processing file {index}/{total_files}: {audio_path}")
+        paths = _OutputPaths.for_audio(audio_path, output_dir) if output_dir else None
+
+        # Check if already transcribed (skip if exists)
+        if paths and self._is_already_transcribed(paths, existing_outputs):
+            logger.info(f"⏭️  Skipping already transcribed file: {audio_path}")
+
+            # Load existing result
+            try:
+                existing_result = self._load_existing_transcription(paths)
+                return {
+                    "file_path": audio_path,
+                    "success": True,
+                    "result": existing_result,
+                    "skipped": True
+                }
+            except Exception as e:
+                logger.warning(f"Failed to load existing transcription, will re-transcribe: {e}")
+                # Continue to transcription if loading fails
+
+        try:
+            result = self.transcribe_file(audio_path)
+
+            # Save individual result if output directory is specified
+            # (inside the worker, so saves overlap with other uploads)
+            if paths:
+                self._save_transcription_result(audio_path, result, paths)
+
+            return {
+                "file_path": audio_path,
+                "success": True,
+                "result": result
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to transcribe {audio_path}: {e}")
+            return {
+                "file_path": audio_path,
+                "success": False,
+                "error": str(e)
+            }
+
     def _create_combined_transcript(
         self,
         transcription_results: List[Dict],
@@ -476,73 +1213,77 @@ class AudioTranscriptionProcessor:
 
         logger.info(f"Combined transcript created successfully")
 
-    def _is_already_transcribed(self, audio_path: str, output_dir: str) -> bool:
+    def _is_already_transcribed(self, paths: _OutputPaths, existing_outputs: frozenset) -> bool:
         """
         Check if audio file has already been transcribed
 
         Args:
-            audio_path: Path to audio file
-            output_dir: Directory where transcriptions are saved
+            paths: Output paths of the audio file
+            existing_outputs: File names in the output directory
 
         Returns:
             True if both JSON and TXT files exist
         """
-        json_filename = f"{Path(audio_path).stem}_transcription.json"
-        txt_filename = f"{Path(audio_path).stem}_transcript.txt"
+        return paths.json_name in existing_outputs and paths.txt_name in existing_outputs
 
-        json_path = os.path.join(output_dir, json_filename)
-        txt_path = os.path.join(output_dir, txt_filename)
-
-        # Check if both files exist
-        return os.path.exists(json_path) and os.path.exists(txt_path)
-
-    def _load_existing_transcription(self, audio_path: str, output_dir: str) -> Dict:
+    def _load_existing_transcription(
+        self,
+        paths: _OutputPaths,
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict:
         """
         Load existing transcription from JSON file
 
+        With ijson installed the file is parsed incrementally, one top-level
+        field at a time, so the raw text and the decoded result are never in
+        memory together
+
         Args:
-            audio_path: Path to audio file
-            output_dir: Directory where transcriptions are saved
+            paths: Output paths of the audio file
+            fields: Only keep these top-level fields (default: all)
 
         Returns:
             Transcription result dictionary
         """
-        json_filename = f"{Path(audio_path).stem}_transcription.json"
-        json_path = os.path.join(output_dir, json_filename)
-
-        with open(json_path, 'r', encoding='utf-8') as f:
-            result = json.load(f)
+        fields = set(fields) if fields else None
+
+        with open(paths.json, 'rb') as f:
+            if IJSON_AVAILABLE:
+                return {
+                    key: value
+                    for key, value in ijson.kvitems(f, '', use_float=True)
+                    if fields is None or key in fields
+                }
+            result = orjson.loads(f.read())
 
+        if fields is not None:
+            result = {key: value for key, value in result.items() if key in fields}
         return result
 
     def _save_transcription_result(
         self,
         audio_path: str,
         result: Dict,
-        output_dir: str
+        paths: _OutputPaths
     ):
         """Save transcription result to both JSON and formatted text files"""
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Save JSON file
-        json_filename = f"{Path(audio_path).stem}_transcription.json"
-        json_path = os.path.join(output_dir, json_filename)
+        os.makedirs(os.path.dirname(paths.json) or ".", exist_ok=True)
 
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        # Serialize up front (orjson writes UTF-8, like ensure_ascii=False)
+        # and write once
+        content = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        with open(paths.json, 'wb') as f:
+            f.write(content)
 
-        logger.info(f"Saved JSON transcription to: {json_path}")
+        logger.info(f"Saved JSON transcription to: {paths.json}")
 
         # Save formatted text file
-        txt_filename = f"{Path(audio_path).stem}_transcript.txt"
-        txt_path = os.path.join(output_dir, txt_filename)
-
         try:
             self.formatter.save_formatted_transcript(
                 transcription_data=result,
                 audio_filename=os.path.basename(audio_path),
-                output_path=txt_path
+                output_path=paths.txt
             )
-            logger.info(f"Saved formatted transcript to: {txt_path}")
+            logger.info(f"Saved formatted transcript to: {paths.txt}")
         except Exception as e:
             logger.error(f"Failed to save formatted transcript: {e}")
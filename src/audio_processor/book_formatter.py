@@ -12,24 +12,77 @@ import logging
 from typing import List, Dict, Optional
 import google.generativeai as genai
 
+from .audio_transcription_processor import parse_gemini_json
+
 logger = logging.getLogger(__name__)
 
+# Chapter prompt around the raw transcript; the transcript itself is sent as
+# its own content part so it is never copied into one big prompt string
+CHAPTER_INSTRUCTIONS_TEMPLATE = """
+You are a professional editor converting sermon/lecture transcripts into publishable book chapters.
+
+IMPORTANT INSTRUCTIONS:
+1. This is Chapter {chapter_number} of {total_chapters} in the book "{book_title}"
+2. Clean up the text but PRESERVE THE COMPLETE MESSAGE - do not summarize
+3. Remove filler words (um, uh, you know, etc.)
+4. Fix grammar and sentence structure for readability
+5. Organize into logical paragraphs
+6. Keep the speaker's voice and style
+7. Add subheadings for major sections (format as "## Subheading")
+8. If there are scripture references, keep them
+
+DO NOT:
+- Summarize or shorten the content
+- Change the meaning or theology
+- Add content that wasn't said
+- Remove important examples or stories
+
+Raw transcript:
+"""
+
+CHAPTER_CONTEXT_TEMPLATE = """
+Summary (for context):
+{summary}
+
+Key topics covered:
+{topics}
+
+Return a JSON object with this structure:
+{{
+    "chapter_title": "Descriptive chapter title (3-8 words)",
+    "chapter_number": {chapter_number},
+    "content": "The cleaned, formatted chapter text with subheadings",
+    "key_points": ["3-5 key takeaways from this chapter"],
+    "scripture_references": ["Any Bible verses mentioned"],
+    "word_count": approximate_word_count
+}}
+"""
+
 
 class BookFormatter:
     """Format transcripts into publishable book chapters"""
     
-    def __init__(self, gemini_api_key: str, model_name: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        gemini_api_key: str,
+        model_name: str = "gemini-2.5-flash",
+        model: Optional[genai.GenerativeModel] = None
+    ):
         """
         Initialize book formatter
         
         Args:
             gemini_api_key: Google Gemini API key
             model_name: Gemini model to use
+            model: Already configured model to reuse (e.g. the audio processor's);
+                genai is configured and a new model created only when omitted
         """
         self.gemini_api_key = gemini_api_key
         self.model_name = model_name
-        genai.configure(api_key=self.gemini_api_key)
-        self.model = genai.GenerativeModel(model_name)
+        if model is None:
+            genai.configure(api_key=self.gemini_api_key, transport="grpc")
+            model = genai.GenerativeModel(model_name)
+        self.model = model
     
     def format_series_to_book(
         self,
@@ -134,59 +187,23 @@ class BookFormatter:
         summary = transcript_data.get('summary', '')
         topics = transcript_data.get('key_topics', [])
         
-        prompt = f"""
-        You are a professional editor converting sermon/lecture transcripts into publishable book chapters.
-        
-        IMPORTANT INSTRUCTIONS:
-        1. This is Chapter {chapter_number} of {total_chapters} in the book "{book_title}"
-        2. Clean up the text but PRESERVE THE COMPLETE MESSAGE - do not summarize
-        3. Remove filler words (um, uh, you know, etc.)
-        4. Fix grammar and sentence structure for readability
-        5. Organize into logical paragraphs
-        6. Keep the speaker's voice and style
-        7. Add subheadings for major sections (format as "## Subheading")
-        8. If there are scripture references, keep them
-        
-        DO NOT:
-        - Summarize or shorten the content
-        - Change the meaning or theology
-        - Add content that wasn't said
-        - Remove important examples or stories
-        
-        Raw transcript:
-        {raw_transcription}
-        
-        Summary (for context):
-        {summary}
-        
-        Key topics covered:
-        {', '.join(topics)}
-        
-        Return a JSON object with this structure:
-        {{
-            "chapter_title": "Descriptive chapter title (3-8 words)",
-            "chapter_number": {chapter_number},
-            "content": "The cleaned, formatted chapter text with subheadings",
-            "key_points": ["3-5 key takeaways from this chapter"],
-            "scripture_references": ["Any Bible verses mentioned"],
-            "word_count": approximate_word_count
-        }}
-        """
+        prompt = [
+            CHAPTER_INSTRUCTIONS_TEMPLATE.format(
+                chapter_number=chapter_number,
+                total_chapters=total_chapters,
+                book_title=book_title
+            ),
+            raw_transcription or "[empty transcript]",  # Gemini rejects empty parts
+            CHAPTER_CONTEXT_TEMPLATE.format(
+                summary=summary,
+                topics=', '.join(topics),
+                chapter_number=chapter_number
+            )
+        ]
         
         try:
             response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            import json
-            chapter = json.loads(response_text.strip())
+            chapter = parse_gemini_json(response.text)
             
             return chapter
             
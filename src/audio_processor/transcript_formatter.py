@@ -4,12 +4,52 @@ Converts raw transcriptions into clean, readable formatted text
 """
 
 import os
+import re
 import logging
-from typing import Dict
+import textwrap
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, TextIO
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Section rules and the timestamp format used in document headers
+_HEAVY_RULE = "=" * 80
+_LIGHT_RULE = "-" * 80
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+_BULLET = "\u2022 "  # "• "
+
+# Whitespace after sentence-ending punctuation
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.?!])\s+')
+
+
+def _write_lines(f: TextIO, lines: Iterable[str]):
+    """Write lines separated by newlines (no trailing newline), like "\\n".join"""
+    separator = ""
+    for line in lines:
+        f.write(separator)
+        f.write(line)
+        separator = "\n"
+
+
+@lru_cache(maxsize=16)
+def _text_wrapper(width: int, indent: int) -> textwrap.TextWrapper:
+    """
+    Get a shared TextWrapper for a width/indent pair
+
+    Wrappers are only read after construction, so one instance can be used
+    from every batch thread
+    """
+    prefix = " " * indent
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=prefix,
+        subsequent_indent=prefix,
+        break_long_words=False,
+        break_on_hyphens=False
+    )
+
 
 class TranscriptFormatter:
     """Formats raw transcriptions into clean, readable text documents"""
@@ -29,70 +69,91 @@ class TranscriptFormatter:
         Returns:
             Formatted transcript as string
         """
+        return "\n".join(chain(
+            self._header_lines(transcription_data, audio_filename),
+            self._body_lines(transcription_data)
+        ))
+
+    def _header_lines(self, transcription_data: Dict, audio_filename: str) -> Iterator[str]:
+        """
+        Yield the header of a formatted transcript: metadata, summary, key
+        topics and the full transcript banner
+
+        Args:
+            transcription_data: Raw transcription data from Gemini
+            audio_filename: Original audio filename
+
+        Yields:
+            Output lines
+        """
         # Extract data
-        transcription = transcription_data.get('transcription', '')
-        language = transcription_data.get('language', 'Unknown')
-        speakers = transcription_data.get('speakers', [])
-        summary = transcription_data.get('summary', '')
-        key_topics = transcription_data.get('key_topics', [])
-        timestamps = transcription_data.get('timestamps', [])
-        processing_time = transcription_data.get('processing_time', 0)
-        model = transcription_data.get('model', 'Unknown')
-
-        # Build formatted transcript
-        lines = []
+        get = transcription_data.get
+        language = get('language', 'Unknown')
+        speakers = get('speakers', [])
+        summary = get('summary', '')
+        key_topics = get('key_topics', [])
+        processing_time = get('processing_time', 0)
+        model = get('model', 'Unknown')
 
         # Header
-        lines.append("=" * 80)
-        lines.append("AUDIO TRANSCRIPTION")
-        lines.append("=" * 80)
-        lines.append("")
+        yield _HEAVY_RULE
+        yield "AUDIO TRANSCRIPTION"
+        yield _HEAVY_RULE
+        yield ""
 
         # Metadata
-        lines.append(f"File: {audio_filename}")
-        lines.append(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Language: {language}")
+        yield f"File: {audio_filename}"
+        yield f"Date: {datetime.now().strftime(_DATE_FORMAT)}"
+        yield f"Language: {language}"
         if speakers:
-            lines.append(f"Speakers: {', '.join(speakers)}")
-        lines.append(f"Transcribed by: {model}")
-        lines.append(f"Processing time: {processing_time:.2f} seconds")
-        lines.append("")
+            yield f"Speakers: {', '.join(speakers)}"
+        yield f"Transcribed by: {model}"
+        yield f"Processing time: {processing_time:.2f} seconds"
+        yield ""
 
         # Summary (if available)
         if summary:
-            lines.append("-" * 80)
-            lines.append("SUMMARY")
-            lines.append("-" * 80)
-            lines.append("")
-            lines.append(self._wrap_text(summary, width=80))
-            lines.append("")
+            yield _LIGHT_RULE
+            yield "SUMMARY"
+            yield _LIGHT_RULE
+            yield ""
+            yield self._wrap_text(summary, width=80)
+            yield ""
 
         # Key Topics (if available)
         if key_topics:
-            lines.append("-" * 80)
-            lines.append("KEY TOPICS")
-            lines.append("-" * 80)
-            lines.append("")
+            yield _LIGHT_RULE
+            yield "KEY TOPICS"
+            yield _LIGHT_RULE
+            yield ""
             for topic in key_topics:
-                lines.append(f"• {topic}")
-            lines.append("")
+                yield _BULLET + str(topic)
+            yield ""
 
         # Main Transcript
-        lines.append("=" * 80)
-        lines.append("FULL TRANSCRIPT")
-        lines.append("=" * 80)
-        lines.append("")
+        yield _HEAVY_RULE
+        yield "FULL TRANSCRIPT"
+        yield _HEAVY_RULE
+        yield ""
+
+    def _body_lines(self, transcription_data: Dict) -> Iterator[str]:
+        """
+        Yield the transcript paragraphs and footer of a formatted transcript
 
+        Args:
+            transcription_data: Raw transcription data from Gemini
+
+        Yields:
+            Output lines
+        """
         # Format the full transcription with proper line breaks (no timestamps)
-        lines.append(self._format_paragraphs(transcription))
+        yield self._format_paragraphs(transcription_data.get('transcription', ''))
 
         # Footer
-        lines.append("")
-        lines.append("-" * 80)
-        lines.append("End of Transcript")
-        lines.append("-" * 80)
-
-        return "\n".join(lines)
+        yield ""
+        yield _LIGHT_RULE
+        yield "End of Transcript"
+        yield _LIGHT_RULE
 
     def _wrap_text(self, text: str, width: int = 80, indent: int = 0) -> str:
         """
@@ -109,25 +170,7 @@ class TranscriptFormatter:
         if not text:
             return ""
 
-        words = text.split()
-        lines = []
-        current_line = " " * indent
-
-        for word in words:
-            if len(current_line) + len(word) + 1 <= width:
-                if current_line.strip():
-                    current_line += " " + word
-                else:
-                    current_line += word
-            else:
-                if current_line.strip():
-                    lines.append(current_line)
-                current_line = " " * indent + word
-
-        if current_line.strip():
-            lines.append(current_line)
-
-        return "\n".join(lines)
+        return "\n".join(_text_wrapper(width, indent).wrap(text))
 
     def _format_paragraphs(self, text: str, width: int = 80) -> str:
         """
@@ -147,7 +190,7 @@ class TranscriptFormatter:
         paragraphs = []
         current_para = []
 
-        sentences = text.replace('. ', '.\n').replace('? ', '?\n').replace('! ', '!\n').split('\n')
+        sentences = _SENTENCE_BREAK_RE.split(text)
 
         for sentence in sentences:
             sentence = sentence.strip()
@@ -158,16 +201,16 @@ class TranscriptFormatter:
 
             # Create paragraph every 4-5 sentences or at topic changes
             if len(current_para) >= 5:
-                para_text = ' '.join(current_para)
-                paragraphs.append(self._wrap_text(para_text, width=width))
+                paragraphs.append(' '.join(current_para))
                 current_para = []
 
         # Add remaining sentences
         if current_para:
-            para_text = ' '.join(current_para)
-            paragraphs.append(self._wrap_text(para_text, width=width))
+            paragraphs.append(' '.join(current_para))
 
-        return "\n\n".join(paragraphs)
+        # Wrap every paragraph with the same wrapper in one pass
+        wrapper = _text_wrapper(width, 0)
+        return "\n\n".join(map(wrapper.fill, paragraphs))
 
     def save_formatted_transcript(
         self,
@@ -187,14 +230,15 @@ class TranscriptFormatter:
             Path to saved file
         """
         try:
-            # Format the transcript
-            formatted_text = self.format_transcript(transcription_data, audio_filename)
-
-            # Save to file
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+            # Lines go straight to the file; the formatted transcript is
+            # never built as one string
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_text)
+                _write_lines(f, chain(
+                    self._header_lines(transcription_data, audio_filename),
+                    self._body_lines(transcription_data)
+                ))
 
             logger.info(f"Saved formatted transcript to: {output_path}")
             return output_path
@@ -203,6 +247,53 @@ class TranscriptFormatter:
             logger.error(f"Failed to save formatted transcript: {e}")
             raise
 
+    def _combined_lines(self, transcription_results: list, title: str) -> Iterator[str]:
+        """
+        Yield the lines of a combined transcript
+
+        Args:
+            transcription_results: List of transcription results
+            title: Title for the combined document
+
+        Yields:
+            Output lines
+        """
+        # Header
+        yield _HEAVY_RULE
+        yield title.upper()
+        yield _HEAVY_RULE
+        yield ""
+        yield f"Generated: {datetime.now().strftime(_DATE_FORMAT)}"
+        yield f"Total files: {len(transcription_results)}"
+        yield ""
+        yield ""
+
+        # Process each file
+        for idx, result in enumerate(transcription_results, 1):
+            result_get = result.get
+            if not result_get('success'):
+                continue
+
+            file_path = result_get('file_path', 'Unknown')
+            filename = os.path.basename(file_path)
+
+            # File header
+            yield _HEAVY_RULE
+            yield f"FILE {idx}: {filename}"
+            yield _HEAVY_RULE
+            yield ""
+
+            # Transcript body only - the per-file header would duplicate
+            # the combined one
+            yield from self._body_lines(result_get('result', {}))
+            yield ""
+            yield ""
+
+        # Footer
+        yield _HEAVY_RULE
+        yield "END OF COMBINED TRANSCRIPT"
+        yield _HEAVY_RULE
+
     def create_combined_transcript(
         self,
         transcription_results: list,
@@ -221,63 +312,12 @@ class TranscriptFormatter:
             Path to saved file
         """
         try:
-            lines = []
-
-            # Header
-            lines.append("=" * 80)
-            lines.append(title.upper())
-            lines.append("=" * 80)
-            lines.append("")
-            lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append(f"Total files: {len(transcription_results)}")
-            lines.append("")
-            lines.append("")
-
-            # Process each file
-            for idx, result in enumerate(transcription_results, 1):
-                if not result.get('success'):
-                    continue
-
-                file_path = result.get('file_path', 'Unknown')
-                filename = os.path.basename(file_path)
-                transcription_data = result.get('result', {})
-
-                # File header
-                lines.append("=" * 80)
-                lines.append(f"FILE {idx}: {filename}")
-                lines.append("=" * 80)
-                lines.append("")
-
-                # Add formatted content
-                formatted = self.format_transcript(transcription_data, filename)
-
-                # Skip the header from individual file (avoid duplication)
-                formatted_lines = formatted.split('\n')
-                # Find where "FULL TRANSCRIPT" starts
-                start_idx = 0
-                for i, line in enumerate(formatted_lines):
-                    if 'FULL TRANSCRIPT' in line:
-                        start_idx = i + 3  # Skip the header and separator
-                        break
-
-                if start_idx > 0:
-                    lines.extend(formatted_lines[start_idx:])
-                else:
-                    lines.append(transcription_data.get('transcription', ''))
-
-                lines.append("")
-                lines.append("")
-
-            # Footer
-            lines.append("=" * 80)
-            lines.append("END OF COMBINED TRANSCRIPT")
-            lines.append("=" * 80)
-
-            # Save to file
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
+            # Lines are written as they are produced, so the combined
+            # document is never held in memory
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                _write_lines(f, self._combined_lines(transcription_results, title))
 
             logger.info(f"Saved combined transcript to: {output_path}")
             return output_path
@@ -0,0 +1,162 @@
+"""
+Transcription Cache
+Remembers Gemini transcription results by audio content hash, so identical
+audio (re-runs, duplicate files) skips the upload -> poll -> generate cycle
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import orjson
+
+# Optional fast hash (falls back to BLAKE2b)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def content_hash(path: str) -> str:
+    """
+    Hash a file's contents in 1 MiB blocks
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest (xxh3_64 when xxhash is installed, BLAKE2b otherwise)
+    """
+    hasher = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+class TranscriptionCache:
+    """SQLite-backed transcription results keyed by content hash"""
+
+    # Expired and overflow rows are pruned once every this many writes
+    PRUNE_EVERY_WRITES = 100
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = 10_000,
+        max_age_seconds: float = 30 * 86400
+    ):
+        """
+        Initialize the transcription cache
+
+        Args:
+            db_path: SQLite database file
+            max_entries: Oldest results beyond this count are dropped
+            max_age_seconds: Results older than this are dropped
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+        self._writes = 0
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcriptions ("
+                "key TEXT PRIMARY KEY, result BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS transcriptions_created_at "
+                "ON transcriptions (created_at)"
+            )
+        self.prune()
+
+        logger.info(f"TranscriptionCache initialized at: {db_path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            # WAL lets readers in other threads/processes proceed during writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Get a cached result
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT result FROM transcriptions WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Transcription cache read failed: {e}")
+            return None
+
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, result: Dict):
+        """
+        Store a result
+
+        Args:
+            key: Cache key
+            result: Transcription result
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcriptions (key, result, created_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(result), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Transcription cache write failed: {e}")
+            return
+
+        # Racy across threads, which only shifts when the next prune happens
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY_WRITES == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop results older than max_age_seconds, then the oldest beyond max_entries
+
+        Returns:
+            Number of results removed
+        """
+        try:
+            with self._connection() as conn:
+                removed = conn.execute(
+                    "DELETE FROM transcriptions WHERE created_at < ?",
+                    (time.time() - self.max_age_seconds,)
+                ).rowcount
+                removed += conn.execute(
+                    "DELETE FROM transcriptions WHERE key IN ("
+                    "SELECT key FROM transcriptions ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Transcription cache prune failed: {e}")
+            return 0
+
+        if removed:
+            logger.info(f"Pruned {removed} cached transcriptions")
+        return removed
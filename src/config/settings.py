@@ -1,10 +1,10 @@
 import os
 from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from pydantic import Field, StringConstraints
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
 # Optional New Relic import (only for production)
 try:
@@ -23,9 +23,14 @@ class Settings(BaseSettings):
     Centralized configuration management using Pydantic
     """
 
-    # Model configuration for environment variable loading
+    # Model configuration for environment variable loading (frozen: settings
+    # are shared by every module and never reassigned at runtime)
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False
     )
 
     # Google Drive Configuration (API Key for public folders)
@@ -34,10 +39,13 @@ class Settings(BaseSettings):
     # Directories
     TEMP_DIR: str = "/tmp/audio_processing"
     DOWNLOAD_DIR: str = "/tmp/audio_downloads"
+    RESULTS_DIR: str = "./transcriptions"  # Completed job results (zstd-compressed JSON)
 
     # Server Configuration
     SERVER_HOST: str = "0.0.0.0"
     PORT: int = Field(default=8000, validation_alias="PORT")  # Railway provides PORT env var
+    WORKERS: Optional[int] = None  # Gunicorn workers (default 1: usage tracking is per-process)
+    SHUTDOWN_GRACE_SECONDS: int = 30  # How long shutdown waits for running jobs
 
     # AI/ML Service Configuration
     GEMINI_KEY: Optional[str] = None
@@ -47,12 +55,29 @@ class Settings(BaseSettings):
     # Audio Processing Configuration
     MAX_AUDIO_SIZE_MB: int = 200
     MAX_AUDIO_DURATION_SECONDS: int = 7200  # 2 hours
-    SUPPORTED_AUDIO_FORMATS: str = "mp3,wav,m4a,aac,ogg,flac,opus"
+    SUPPORTED_AUDIO_FORMATS: Annotated[str, StringConstraints(min_length=1)] = "mp3,wav,m4a,aac,ogg,flac,opus"
     MAX_CHUNK_SIZE_MB: int = 200  # Max chunk size - set high to avoid memory-intensive splitting
+    SEGMENT_DURATION_SECONDS: int = 600  # Longer files are cut into segments of this length (0 disables)
+    COMPRESS_AUDIO_UPLOADS: bool = True  # Re-encode high-bitrate audio to 16 kHz mono Opus before upload
 
     # Processing Configuration
     CLEANUP_TEMP_FILES: bool = True
-    MAX_CONCURRENT_PROCESSING: int = 5
+    MAX_CONCURRENT_PROCESSING: int = 5  # Files transcribed in parallel per job
+    MAX_CHUNK_CONCURRENCY: int = 4  # Chunks of one long file transcribed in parallel
+    MAX_CONCURRENT_GEMINI_CALLS: int = 8  # Gemini transcriptions in flight per process (all jobs/files/chunks)
+    MAX_CONCURRENT_JOBS: int = 2  # Jobs run in parallel by the job worker pool
+    MAX_QUEUED_JOBS: int = 100  # Pending jobs accepted before /transcribe returns 429
+    TRANSCRIBE_PROCESSES: int = 0  # >0 runs transcribe_file in a process pool instead of threads
+    TRANSCRIPTION_CACHE_ENABLED: bool = True  # Reuse results for identical audio (TEMP_DIR/cache.db)
+    TRANSCRIPTION_CACHE_MAX_ENTRIES: int = 10000  # Oldest cached results beyond this are dropped
+    TRANSCRIPTION_CACHE_MAX_AGE_SECONDS: int = 2592000  # Cached results are kept 30 days
+
+    # Job State (set REDIS_URL to share job state between workers)
+    REDIS_URL: Optional[str] = None
+    JOB_TTL_SECONDS: int = 86400  # How long finished jobs are kept
+    MAX_STORED_JOBS: int = 1000  # In-memory store capacity (least recently used finished jobs are evicted)
+    JOB_SWEEP_INTERVAL_SECONDS: int = 300  # How often expired jobs are swept
+    JOB_EVENTS_POLL_SECONDS: float = 5.0  # Fallback re-read interval for /transcribe/{job_id}/events
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -61,6 +86,11 @@ class Settings(BaseSettings):
     # Optional Kafka Configuration (if you want to keep it for future use)
     KAFKA_BROKER: Optional[str] = None
     KAFKA_ENABLED: bool = False
+    KAFKA_TRANSACTIONAL: bool = False  # Commit produce_many batches as one producer transaction
+    KAFKA_CONSUME_BATCH_SIZE: int = 500  # Messages fetched per consumer.consume() call
+    KAFKA_MAX_CONCURRENT_MESSAGES: int = 10  # Consumed messages handled in parallel
+    KAFKA_MAX_HANDLER_ATTEMPTS: int = 3  # Handler attempts before a message is dead-lettered
+    KAFKA_MAX_PENDING_OFFSETS: int = 10000  # Unstored messages per partition before dispatch pauses
 
     def get_supported_audio_formats(self) -> list:
         """Get list of supported audio formats"""
@@ -94,14 +124,15 @@ class ProductionSettings(Settings):
     NEW_RELIC_LICENSE_KEY: Optional[str] = None
     NEW_RELIC_APP_NAME: Optional[str] = None
 
-    # Model configuration for environment variable loading
-    model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
-    )
-
 
+@lru_cache(maxsize=1)
 def get_settings():
-    """Factory function to return appropriate settings class"""
+    """
+    Factory function to return appropriate settings class
+
+    Cached: environment and .env are parsed once per process, so NODE_ENV
+    and every other variable are read at the first call only
+    """
     environment = os.getenv("NODE_ENV", "development").lower()
 
     if environment == "production":
@@ -1,22 +1,17 @@
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 
 class KafkaMonitorService:
     """
-    Singleton health monitoring service for Kafka components
-    """
-
-    _instance = None
+    Health monitoring service for Kafka components
 
-    def __new__(cls):
-        if not cls._instance:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+    Use the shared module-level ``monitor`` instance
+    """
 
-    def _initialize(self):
+    def __init__(self):
         """Initialize monitoring attributes"""
         self.kafka_broker_connection = False
         self.consumer_status = "Not Started"
@@ -24,6 +19,11 @@ class KafkaMonitorService:
         self.last_successful_message = None
         self.error_count = 0
 
+        # Health timestamps have second resolution, so the formatted string
+        # is only rebuilt when the second changes
+        self._timestamp_second = None
+        self._timestamp_iso = None
+
     def update_kafka_connection(self, connection_status: bool):
         """Update Kafka broker connection status"""
         self.kafka_broker_connection = connection_status
@@ -36,6 +36,14 @@ class KafkaMonitorService:
         """Update producer operational status"""
         self.producer_status = status
 
+    def _timestamp(self) -> str:
+        """Current UTC time as an ISO string, cached per second"""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_iso = datetime.fromtimestamp(second, timezone.utc).isoformat(timespec="seconds")
+            self._timestamp_second = second
+        return self._timestamp_iso
+
     def get_health_status(self) -> Dict[str, Any]:
         """
         Generate comprehensive health status
@@ -48,5 +56,9 @@ class KafkaMonitorService:
                 if self.last_successful_message
                 else None
             ),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(),
         }
+
+
+# Shared instance (previously enforced by a __new__ singleton)
+monitor = KafkaMonitorService()
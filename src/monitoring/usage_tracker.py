@@ -4,12 +4,18 @@ Tracks Gemini API usage, costs, and rate limits for free and paid users
 """
 
 import os
-import json
+import atexit
 import logging
+import mmap
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Dict, Optional
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +38,14 @@ class UsageTracker:
         }
     }
 
+    # Request records kept in history (oldest are dropped first)
+    MAX_HISTORY = 1000
+
+    # Tracked requests are written to disk every SAVE_EVERY_N requests or
+    # SAVE_INTERVAL_SECONDS, whichever comes first (and on exit)
+    SAVE_EVERY_N = 20
+    SAVE_INTERVAL_SECONDS = 5.0
+
     def __init__(self, storage_path: str = "./usage_data"):
         """
         Initialize usage tracker
@@ -54,6 +68,19 @@ class UsageTracker:
 
         # Load existing usage data
         self.usage_data = self._load_usage_data()
+        # Parsed last_reset_date, kept in sync whenever it changes
+        self._last_reset_date = datetime.fromisoformat(self.usage_data["last_reset_date"]).date()
+        self._apply_tier_limits()
+
+        # Bumped on every change to usage_data; get_usage_stats reuses its
+        # last result while this is unchanged
+        self._mutation_seq = 0
+        self._stats_cache = None
+
+        # Unsaved tracked requests, flushed by _maybe_save and at exit
+        self._requests_since_save = 0
+        self._last_save = time.monotonic()
+        atexit.register(self._flush)
 
         logger.info(f"UsageTracker initialized with storage at: {self.storage_path}")
 
@@ -61,8 +88,14 @@ class UsageTracker:
         """Load usage data from file"""
         if self.usage_file.exists():
             try:
-                with open(self.usage_file, 'r') as f:
-                    return json.load(f)
+                # Parse straight from the mapped file, without an
+                # intermediate bytes copy
+                with open(self.usage_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    data = orjson.loads(view)
+                data["history"] = deque(data.get("history", []), maxlen=self.MAX_HISTORY)
+                return data
             except Exception as e:
                 logger.error(f"Failed to load usage data: {e}")
                 return self._create_default_usage_data()
@@ -78,26 +111,50 @@ class UsageTracker:
             "tier": "free",  # or "paid"
             "requests_today": 0,
             "last_reset_date": datetime.now().isoformat(),
-            "history": []
+            "history": deque(maxlen=self.MAX_HISTORY)
         }
 
     def _save_usage_data(self):
         """Save usage data to file"""
         try:
-            with open(self.usage_file, 'w') as f:
-                json.dump(self.usage_data, f, indent=2)
+            content = orjson.dumps(
+                {**self.usage_data, "history": list(self.usage_data["history"])}
+            )
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated log behind
+            tmp_file = self.usage_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_file, self.usage_file)
+            self._requests_since_save = 0
+            self._last_save = time.monotonic()
         except Exception as e:
             logger.error(f"Failed to save usage data: {e}")
 
+    def _maybe_save(self):
+        """Save usage data once enough requests or time have accumulated"""
+        self._requests_since_save += 1
+        if (
+            self._requests_since_save >= self.SAVE_EVERY_N
+            or time.monotonic() - self._last_save >= self.SAVE_INTERVAL_SECONDS
+        ):
+            self._save_usage_data()
+
+    def _flush(self):
+        """Save usage data if any tracked request has not been written yet"""
+        if self._requests_since_save:
+            self._save_usage_data()
+
     def _reset_daily_counters_if_needed(self):
         """Reset daily counters if it's a new day"""
-        last_reset = datetime.fromisoformat(self.usage_data["last_reset_date"])
         now = datetime.now()
 
-        if now.date() > last_reset.date():
+        if now.date() > self._last_reset_date:
             logger.info("Resetting daily usage counters")
             self.usage_data["requests_today"] = 0
             self.usage_data["last_reset_date"] = now.isoformat()
+            self._last_reset_date = now.date()
+            self._mutation_seq += 1
             self._save_usage_data()
 
     def track_request(
@@ -122,6 +179,7 @@ class UsageTracker:
         self._reset_daily_counters_if_needed()
 
         # Update counters
+        self._mutation_seq += 1
         self.usage_data["total_requests"] += 1
         self.usage_data["requests_today"] += 1
         self.usage_data["total_input_tokens"] += input_tokens
@@ -137,9 +195,10 @@ class UsageTracker:
             cost = input_cost + output_cost
             self.usage_data["total_cost_usd"] += cost
 
-        # Add to history
+        # Add to history (the deque drops the oldest record past MAX_HISTORY)
         self.usage_data["history"].append({
             "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),  # Epoch seconds, for cheap time-window filters
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "cost_usd": cost,
@@ -147,15 +206,16 @@ class UsageTracker:
             "file_size_mb": file_size_mb
         })
 
-        # Keep only last 1000 records
-        if len(self.usage_data["history"]) > 1000:
-            self.usage_data["history"] = self.usage_data["history"][-1000:]
-
-        self._save_usage_data()
+        self._maybe_save()
 
         # Check limits and return warnings
         return self._check_limits()
 
+    def _apply_tier_limits(self):
+        """Cache the current tier's daily limit (refreshed whenever the tier changes)"""
+        self._daily_limit = self.PRICING[self.usage_data["tier"]]["requests_per_day"]
+        self._daily_pct_factor = 100.0 / self._daily_limit
+
     def _check_limits(self) -> Dict:
         """
         Check if usage is approaching or exceeding limits
@@ -163,14 +223,11 @@ class UsageTracker:
         Returns:
             Dictionary with usage stats and warnings
         """
-        tier = self.usage_data["tier"]
-        limits = self.PRICING[tier]
-
         requests_today = self.usage_data["requests_today"]
-        daily_limit = limits["requests_per_day"]
+        daily_limit = self._daily_limit
 
         # Calculate usage percentage
-        daily_usage_pct = (requests_today / daily_limit) * 100
+        daily_usage_pct = requests_today * self._daily_pct_factor
 
         warnings = []
         status = "ok"
@@ -187,7 +244,7 @@ class UsageTracker:
 
         return {
             "status": status,
-            "tier": tier,
+            "tier": self.usage_data["tier"],
             "requests_today": requests_today,
             "daily_limit": daily_limit,
             "daily_usage_pct": daily_usage_pct,
@@ -200,7 +257,10 @@ class UsageTracker:
         """Get current usage statistics"""
         self._reset_daily_counters_if_needed()
 
-        return {
+        if self._stats_cache and self._stats_cache[0] == self._mutation_seq:
+            return self._stats_cache[1]
+
+        stats = {
             "tier": self.usage_data["tier"],
             "total_requests": self.usage_data["total_requests"],
             "requests_today": self.usage_data["requests_today"],
@@ -210,6 +270,8 @@ class UsageTracker:
             "limits": self._check_limits(),
             "last_reset": self.usage_data["last_reset_date"]
         }
+        self._stats_cache = (self._mutation_seq, stats)
+        return stats
 
     def set_tier(self, tier: str):
         """
@@ -222,6 +284,8 @@ class UsageTracker:
             raise ValueError("Tier must be 'free' or 'paid'")
 
         self.usage_data["tier"] = tier
+        self._apply_tier_limits()
+        self._mutation_seq += 1
         self._save_usage_data()
         logger.info(f"API tier set to: {tier}")
 
@@ -240,7 +304,7 @@ class UsageTracker:
             }
 
         # Calculate burn rate from recent history
-        recent_history = self.usage_data["history"][-100:]  # Last 100 requests
+        recent_history = list(islice(reversed(self.usage_data["history"]), 100))  # Last 100 requests
 
         if not recent_history:
             return {
@@ -249,12 +313,13 @@ class UsageTracker:
                 "message": "No recent usage"
             }
 
-        # Sum costs from today
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        # Sum costs from today (records written before "ts" existed fall
+        # back to parsing the ISO timestamp)
+        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
         today_cost = sum(
             record["cost_usd"]
             for record in recent_history
-            if datetime.fromisoformat(record["timestamp"]) >= today_start
+            if (record.get("ts") or datetime.fromisoformat(record["timestamp"]).timestamp()) >= today_start
         )
 
         # Estimate monthly cost
@@ -271,4 +336,7 @@ class UsageTracker:
         """Reset all usage statistics (use with caution!)"""
         logger.warning("Resetting all usage statistics")
         self.usage_data = self._create_default_usage_data()
+        self._last_reset_date = datetime.fromisoformat(self.usage_data["last_reset_date"]).date()
+        self._apply_tier_limits()
+        self._mutation_seq += 1
         self._save_usage_data()
@@ -1,26 +1,91 @@
 """
 Google Drive Service for Audio File Management
-Downloads files directly from public Google Drive links using gdown
+Downloads files directly from public Google Drive links over a pooled HTTP
+session (gdown handles the cases the session cannot)
 """
 
 import os
 import logging
 import re
-from typing import List, Dict, Optional
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import gdown
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+# Native Docs/Sheets/Slides etc. (no extension, never audio)
+GOOGLE_APPS_MIME_PREFIX = "application/vnd.google-apps."
+# Public file content (confirm=t skips the large-file virus-scan page)
+DRIVE_DOWNLOAD_URL = "https://drive.usercontent.google.com/download"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.opus', '.wma'})
+EXT_TO_MIME = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.m4a': 'audio/m4a',
+    '.aac': 'audio/aac',
+    '.ogg': 'audio/ogg',
+    '.flac': 'audio/flac',
+    '.opus': 'audio/opus',
+    '.wma': 'audio/x-ms-wma'
+}
+
 
 class GoogleDriveService:
     """Service for downloading from public Google Drive folders (no authentication!)"""
 
-    def __init__(self):
+    # Parent folders OR-ed together in one Drive API query
+    PARENTS_PER_QUERY = 50
+
+    # Folder listings are reused for this long (retries and re-submitted
+    # folders skip the Drive walk); least recently used beyond the cap are dropped
+    LISTING_CACHE_TTL_SECONDS = 300
+    LISTING_CACHE_MAX_FOLDERS = 128
+
+    def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Google Drive service
         No credentials needed for public folders!
+
+        Args:
+            api_key: Optional Drive API key - folder listings then use the
+                Drive v3 API instead of scraping folder pages with gdown
         """
-        logger.info("Google Drive service initialized (gdown mode - no API needed)")
+        self.api_key = api_key
+
+        # (folder_id, recursive) -> (listed at, audio file metadata)
+        # (shared by request threads, so guarded by a lock)
+        self._listing_cache: "OrderedDict[Tuple[str, bool], Tuple[float, List[Dict]]]" = OrderedDict()
+        self._listing_cache_lock = threading.Lock()
+
+        # One pooled session for listings and downloads, so batch downloads
+        # reuse TCP/TLS connections instead of handshaking per file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount("https://", adapter)
+
+        if api_key:
+            logger.info("Google Drive service initialized (Drive API listing and downloads)")
+        else:
+            logger.info("Google Drive service initialized (public links - no API needed)")
+
+    def close(self):
+        """Release the HTTP connection pool"""
+        self.session.close()
 
     def extract_folder_id(self, drive_link: str) -> str:
         """
@@ -44,7 +109,11 @@ class GoogleDriveService:
 
     def list_audio_files(self, folder_id: str, recursive: bool = True) -> List[Dict]:
         """
-        List all audio files in a public Google Drive folder using gdown
+        List all audio files in a public Google Drive folder
+
+        Only metadata is fetched (Drive v3 files.list when an API key is set,
+        gdown's folder walk otherwise); nothing is downloaded until
+        download_file is called for the files that are actually needed
 
         Args:
             folder_id: Google Drive folder ID
@@ -53,95 +122,195 @@ class GoogleDriveService:
         Returns:
             List of audio file metadata dictionaries
         """
-        audio_files = []
-        audio_extensions = ['.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.opus', '.wma']
+        return self.list_audio_metadata(folder_id, recursive=recursive)
+
+    def list_audio_metadata(self, folder_id: str, recursive: bool = True) -> List[Dict]:
+        """
+        List audio files in a public Google Drive folder without downloading them
+
+        Args:
+            folder_id: Google Drive folder ID
+            recursive: Whether to include files from subfolders
+
+        Returns:
+            List of audio file metadata dictionaries (id, name, path, mimeType)
+        """
+        cache_key = (folder_id, recursive)
+        with self._listing_cache_lock:
+            cached = self._listing_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.LISTING_CACHE_TTL_SECONDS:
+                self._listing_cache.move_to_end(cache_key)
+            else:
+                cached = None
+        if cached is not None:
+            logger.info(f"Using cached listing for folder {folder_id}")
+            return [dict(audio_file) for audio_file in cached[1]]
+
+        # Listed outside the lock so other folders are not held up
+        audio_files = self._list_audio_metadata_uncached(folder_id, recursive=recursive)
+
+        with self._listing_cache_lock:
+            self._listing_cache[cache_key] = (time.monotonic(), audio_files)
+            self._listing_cache.move_to_end(cache_key)
+            while len(self._listing_cache) > self.LISTING_CACHE_MAX_FOLDERS:
+                self._listing_cache.popitem(last=False)
+
+        return [dict(audio_file) for audio_file in audio_files]
+
+    def _list_audio_metadata_uncached(self, folder_id: str, recursive: bool = True) -> List[Dict]:
+        """List audio files from Drive (API or gdown), bypassing the listing cache"""
+        if self.api_key:
+            return self._list_audio_metadata_api(folder_id, recursive=recursive)
 
         try:
-            # Construct folder URL
             folder_url = f"https://drive.google.com/drive/folders/{folder_id}"
-            logger.info(f"Accessing folder: {folder_url}")
+            logger.info(f"Listing folder: {folder_url}")
+
+            # skip_download makes gdown walk the folder tree and return the
+            # file IDs and relative paths only
+            drive_files = gdown.download_folder(
+                url=folder_url,
+                output=folder_id,
+                quiet=True,
+                use_cookies=False,
+                remaining_ok=True,
+                skip_download=True
+            ) or []
+
+            audio_files = []
+            for drive_file in drive_files:
+                rel_path = os.path.relpath(drive_file.local_path, folder_id)
+                filename = os.path.basename(rel_path)
+
+                # Skip hidden files and system files
+                if filename.startswith('.') or filename == 'desktop.ini':
+                    continue
 
-            # Use gdown to list files in the folder
-            # gdown.download_folder downloads everything, but we can use it to discover files
-            # First, try to list the folder contents
+                if not recursive and os.path.dirname(rel_path):
+                    continue
 
-            # Create a temporary directory to test folder access
-            import tempfile
-            temp_dir = tempfile.mkdtemp()
+                if self._is_audio_filename(filename):
+                    audio_files.append({
+                        'id': drive_file.id,
+                        'name': filename,
+                        'path': rel_path,
+                        'mimeType': self._get_mime_type(filename)
+                    })
 
-            try:
-                # gdown will list files when we try to download the folder
-                # We'll capture the file list from gdown's output
-                file_list = gdown.download_folder(
-                    url=folder_url,
-                    output=temp_dir,
-                    quiet=False,
-                    use_cookies=False,
-                    remaining_ok=True
-                )
+            logger.info(f"Found {len(audio_files)} audio files in folder {folder_id}")
+            return audio_files
 
-                # List downloaded files and identify audio files
-                for root, dirs, files in os.walk(temp_dir):
-                    for filename in files:
-                        # Skip hidden files and system files
-                        if filename.startswith('.') or filename == 'desktop.ini':
-                            continue
+        except Exception as error:
+            logger.error(f"An error occurred while listing files: {error}")
+            raise
 
-                        file_path = os.path.join(root, filename)
+    def _list_audio_metadata_api(self, folder_id: str, recursive: bool = True) -> List[Dict]:
+        """
+        List audio files through the Drive v3 API
 
-                        # Check if file has an audio extension OR no extension at all
-                        # (assume files without extensions from audio folders are audio files)
-                        has_audio_ext = any(filename.lower().endswith(ext) for ext in audio_extensions)
-                        has_no_ext = '.' not in filename or filename.endswith('-')
+        The tree is walked breadth-first, one level at a time: each query ORs
+        together up to PARENTS_PER_QUERY parent folders and returns both the
+        subfolders and the files, so API calls scale with depth and page count
+        rather than with the number of subfolders.
 
-                        if has_audio_ext or has_no_ext:
-                            rel_path = os.path.relpath(file_path, temp_dir)
+        Args:
+            folder_id: Google Drive folder ID
+            recursive: Whether to include files from subfolders
+
+        Returns:
+            List of audio file metadata dictionaries (id, name, path, mimeType, size)
+        """
+        try:
+            audio_files = []
+            # Relative path of every folder on the current level
+            level = {folder_id: ""}
+
+            while level:
+                next_level = {}
+                parent_ids = list(level)
+
+                for start in range(0, len(parent_ids), self.PARENTS_PER_QUERY):
+                    batch = parent_ids[start:start + self.PARENTS_PER_QUERY]
+                    parents_query = " or ".join(f"'{parent}' in parents" for parent in batch)
+
+                    for item in self._query_files(f"({parents_query}) and trashed = false"):
+                        parent_path = next(
+                            (level[p] for p in item.get('parents', []) if p in level), ""
+                        )
+                        rel_path = os.path.join(parent_path, item['name'])
+
+                        if item['mimeType'] == DRIVE_FOLDER_MIME_TYPE:
+                            if recursive:
+                                next_level[item['id']] = rel_path
+                            continue
 
-                            # Get file size
-                            file_size = os.path.getsize(file_path)
+                        if item['mimeType'].startswith(GOOGLE_APPS_MIME_PREFIX):
+                            continue
+
+                        filename = item['name']
+                        if filename.startswith('.') or filename == 'desktop.ini':
+                            continue
 
+                        if item['mimeType'].startswith('audio/') or self._is_audio_filename(filename):
                             audio_files.append({
-                                'id': filename,  # We'll use filename as ID since we have the file
+                                'id': item['id'],
                                 'name': filename,
                                 'path': rel_path,
-                                'local_path': file_path,  # Already downloaded!
-                                'size': file_size,
-                                'mimeType': self._get_mime_type(filename)
+                                'mimeType': self._get_mime_type(filename),
+                                'size': int(item.get('size', 0))
                             })
-                            logger.info(f"Found audio file: {filename}")
 
-            except Exception as e:
-                logger.error(f"Error listing folder with gdown: {e}")
-                # Clean up temp directory
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                raise
+                level = next_level
 
             logger.info(f"Found {len(audio_files)} audio files in folder {folder_id}")
             return audio_files
 
         except Exception as error:
-            logger.error(f"An error occurred while listing files: {error}")
+            logger.error(f"An error occurred while listing files via Drive API: {error}")
             raise
 
-    def _get_mime_type(self, filename: str) -> str:
-        """Get MIME type from filename extension"""
-        ext_to_mime = {
-            '.mp3': 'audio/mpeg',
-            '.wav': 'audio/wav',
-            '.m4a': 'audio/m4a',
-            '.aac': 'audio/aac',
-            '.ogg': 'audio/ogg',
-            '.flac': 'audio/flac',
-            '.opus': 'audio/opus',
-            '.wma': 'audio/x-ms-wma'
+    def _query_files(self, query: str):
+        """
+        Run a Drive v3 files.list query, following nextPageToken
+
+        Args:
+            query: Drive search query
+
+        Yields:
+            File resources (id, name, mimeType, size, parents)
+        """
+        params = {
+            'q': query,
+            'key': self.api_key,
+            'pageSize': 1000,
+            'fields': 'nextPageToken,files(id,name,mimeType,size,parents)',
+            'supportsAllDrives': 'true',
+            'includeItemsFromAllDrives': 'true'
         }
 
-        ext = os.path.splitext(filename)[1].lower()
-        # If no extension, assume MP3 (most common)
-        if not ext or ext == '-':
-            return 'audio/mpeg'
-        return ext_to_mime.get(ext, 'audio/mpeg')
+        while True:
+            response = self.session.get(DRIVE_FILES_URL, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+
+            yield from data.get('files', [])
+
+            page_token = data.get('nextPageToken')
+            if not page_token:
+                return
+            params['pageToken'] = page_token
+
+    @staticmethod
+    def _is_audio_filename(filename: str) -> bool:
+        """Same rule as list_audio_files: audio extension or no extension"""
+        has_audio_ext = os.path.splitext(filename)[1].lower() in AUDIO_EXTENSIONS
+        has_no_ext = '.' not in filename or filename.endswith('-')
+        return has_audio_ext or has_no_ext
+
+    def _get_mime_type(self, filename: str) -> str:
+        """Get MIME type from filename extension"""
+        # No extension: assume MP3 (most common)
+        return EXT_TO_MIME.get(os.path.splitext(filename)[1].lower(), 'audio/mpeg')
 
     def download_file(self, file_id: str, destination_path: str, download_url: str = None,
                      local_path: str = None) -> str:
@@ -161,21 +330,23 @@ class GoogleDriveService:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(destination_path), exist_ok=True)
 
-            # If we already have the file locally (from gdown), just copy it
+            # If we already have the file locally, copy it (the source stays
+            # valid for cached listings and other callers); copyfile uses
+            # sendfile(2), so the bytes never pass through Python
             if local_path and os.path.exists(local_path):
-                logger.info(f"Copying file from {local_path} to {destination_path}")
-                import shutil
-                shutil.copy2(local_path, destination_path)
+                if not os.path.exists(destination_path) or not os.path.samefile(local_path, destination_path):
+                    logger.info(f"Copying file from {local_path} to {destination_path}")
+                    shutil.copyfile(local_path, destination_path)
                 return destination_path
 
-            # Otherwise, download using gdown
+            logger.info(f"Downloading file to {destination_path}")
+
+            # Explicit URLs and files our pooled session cannot fetch directly
+            # (e.g. confirm pages it does not understand) go through gdown
             if download_url:
-                logger.info(f"Downloading file to {destination_path}")
                 gdown.download(download_url, destination_path, quiet=False)
-            else:
-                # Construct download URL
+            elif not self._download_with_session(file_id, destination_path):
                 download_url = f"https://drive.google.com/uc?id={file_id}"
-                logger.info(f"Downloading file to {destination_path}")
                 gdown.download(download_url, destination_path, quiet=False)
 
             logger.info(f"Downloaded file to {destination_path}")
@@ -185,31 +356,103 @@ class GoogleDriveService:
             logger.error(f"An error occurred while downloading file: {error}")
             raise
 
+    def _download_with_session(self, file_id: str, destination_path: str) -> bool:
+        """
+        Stream a public file to disk over the pooled session
+
+        Uses the Drive v3 media endpoint when an API key is set, the public
+        download endpoint otherwise
+
+        Args:
+            file_id: Google Drive file ID
+            destination_path: Local path to save the file
+
+        Returns:
+            True if the file was downloaded, False if gdown should take over
+        """
+        if self.api_key:
+            url = f"{DRIVE_FILES_URL}/{file_id}"
+            params = {'alt': 'media', 'key': self.api_key, 'supportsAllDrives': 'true'}
+        else:
+            url = DRIVE_DOWNLOAD_URL
+            params = {'id': file_id, 'export': 'download', 'confirm': 't'}
+
+        part_path = destination_path + ".part"
+        try:
+            with self.session.get(url, params=params, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                # An HTML page instead of content means a confirm/quota page
+                if response.headers.get('Content-Type', '').startswith('text/html'):
+                    logger.warning(f"Drive returned a web page for {file_id}, falling back to gdown")
+                    return False
+
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+            os.replace(part_path, destination_path)
+            return True
+
+        except requests.RequestException as e:
+            logger.warning(f"Direct download of {file_id} failed, falling back to gdown: {e}")
+            return False
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
     def batch_download_audio_files(
         self,
         folder_id: str,
         download_dir: str,
         recursive: bool = True,
-        max_size_mb: Optional[int] = None
+        max_size_mb: Optional[int] = None,
+        max_workers: int = 8
     ) -> List[str]:
         """
         Download all audio files from a folder
 
+        Downloads run in parallel on a thread pool so per-request round
+        trips overlap; keep max_workers modest to stay within Drive's quotas
+
         Args:
             folder_id: Google Drive folder ID
             download_dir: Local directory to save files
             recursive: Whether to search subfolders recursively
             max_size_mb: Maximum file size in MB (skip larger files)
+            max_workers: Concurrent downloads
 
         Returns:
-            List of downloaded file paths
+            List of downloaded file paths (in listing order)
         """
-        # List files (this also downloads them to temp location)
+        # List metadata only, then download just the files that are kept
         audio_files = self.list_audio_files(folder_id, recursive=recursive)
-        downloaded_files = []
+        return self.download_audio_files(
+            audio_files,
+            download_dir,
+            max_size_mb=max_size_mb,
+            max_workers=max_workers
+        )
+
+    def download_audio_files(
+        self,
+        audio_files: List[Dict],
+        download_dir: str,
+        max_size_mb: Optional[int] = None,
+        max_workers: int = 8
+    ) -> List[str]:
+        """
+        Download listed audio files straight into download_dir
 
-        logger.info(f"Starting batch download of {len(audio_files)} files")
+        Args:
+            audio_files: Metadata from list_audio_files / list_audio_metadata
+            download_dir: Local directory to save files
+            max_size_mb: Maximum file size in MB (skip larger files)
+            max_workers: Concurrent downloads
 
+        Returns:
+            List of downloaded file paths (in listing order)
+        """
+        to_download = []
         for file_info in audio_files:
             # Check file size if limit is set
             if max_size_mb and file_info.get('size', 0) > 0:
@@ -220,21 +463,26 @@ class GoogleDriveService:
                         f"size {file_size_mb:.2f}MB exceeds limit {max_size_mb}MB"
                     )
                     continue
+            to_download.append(file_info)
 
+        logger.info(f"Starting batch download of {len(to_download)} files ({max_workers} concurrent)")
+
+        def download_one(file_info: Dict) -> Optional[str]:
             # Create local file path preserving folder structure
             local_path = os.path.join(download_dir, file_info['path'])
 
             try:
-                # Copy from temp location to final destination
-                downloaded_path = self.download_file(
+                return self.download_file(
                     file_info['id'],
                     local_path,
                     local_path=file_info.get('local_path')
                 )
-                downloaded_files.append(downloaded_path)
             except Exception as e:
                 logger.error(f"Failed to download {file_info['name']}: {e}")
-                continue
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            downloaded_files = [path for path in executor.map(download_one, to_download) if path]
 
         logger.info(f"Successfully downloaded {len(downloaded_files)} files")
         return downloaded_files
@@ -0,0 +1,282 @@
+"""
+Job Store
+Keeps transcription job state in process memory or in Redis (shared by all workers)
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# Optional Redis import (only needed when REDIS_URL is configured)
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Jobs in these states are never updated again and may be evicted
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class JobStore:
+    """In-memory job store - state is private to a single worker process"""
+
+    def __init__(
+        self,
+        max_jobs: int = 1000,
+        ttl_seconds: int = 86400,
+        on_drop: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the in-memory job store
+
+        Args:
+            max_jobs: Finished jobs beyond this count are evicted, least recently used first
+            ttl_seconds: Finished jobs older than this are dropped by sweep()
+            on_drop: Called with the ID of every job that is swept or evicted
+                (e.g. to delete its results file)
+        """
+        self._jobs: "OrderedDict[str, Dict]" = OrderedDict()
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.on_drop = on_drop
+
+    async def create(self, job_id: str, fields: Dict):
+        """
+        Register a new job
+
+        Args:
+            job_id: Job ID
+            fields: Initial job fields
+        """
+        self._jobs[job_id] = dict(fields)
+        self._evict_overflow()
+
+    async def update(self, job_id: str, **fields):
+        """Set one or more fields on a job"""
+        self._jobs[job_id].update(fields)
+
+    async def increment(self, job_id: str, field: str, amount: int = 1) -> int:
+        """
+        Atomically increment a numeric job field
+
+        Returns:
+            The new field value
+        """
+        job = self._jobs[job_id]
+        job[field] = job.get(field, 0) + amount
+        return job[field]
+
+    async def get(self, job_id: str, include_results: bool = False) -> Optional[Dict]:
+        """
+        Get a job
+
+        Args:
+            job_id: Job ID
+            include_results: Whether the (potentially large) results must be included
+
+        Returns:
+            Job fields, or None if the job does not exist
+        """
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._jobs.move_to_end(job_id)
+        return job
+
+    async def list_jobs(self) -> Dict[str, Dict]:
+        """Get all known jobs keyed by job ID"""
+        return dict(self._jobs)
+
+    async def count(self) -> int:
+        """Get the number of known jobs"""
+        return len(self._jobs)
+
+    async def sweep(self) -> int:
+        """
+        Drop finished jobs older than the TTL
+
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("status") in TERMINAL_STATUSES and job.get("created_at", 0) < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._dropped(job_id)
+        return len(expired)
+
+    def _evict_overflow(self):
+        """Evict least recently used finished jobs while over capacity"""
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow <= 0:
+            return
+
+        # Queued and processing jobs are still being updated, so only finished
+        # ones are candidates
+        evictable = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("status") in TERMINAL_STATUSES
+        ][:overflow]
+        for job_id in evictable:
+            del self._jobs[job_id]
+            self._dropped(job_id)
+
+    def _dropped(self, job_id: str):
+        """Run the on_drop hook for a job that is gone from the store"""
+        if self.on_drop is None:
+            return
+        try:
+            self.on_drop(job_id)
+        except Exception as e:
+            logger.warning(f"Cleanup of dropped job {job_id} failed: {e}")
+
+    async def close(self):
+        """Release any resources held by the store"""
+
+
+class RedisJobStore(JobStore):
+    """Redis-backed job store - every worker process sees the same jobs"""
+
+    KEY_PREFIX = "job:"
+    INDEX_KEY = "jobs:index"
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_seconds: int = 86400,
+        on_drop: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the Redis job store
+
+        Args:
+            redis_url: Redis connection URL
+            ttl_seconds: How long job state and results are kept
+            on_drop: Called with the ID of every expired job sweep() prunes
+        """
+        super().__init__(ttl_seconds=ttl_seconds, on_drop=on_drop)
+        self.redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def _results_key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}:results"
+
+    async def _write(self, job_id: str, fields: Dict):
+        """Write job fields (JSON-encoded hash values) and refresh the TTL"""
+        fields = dict(fields)
+        results = fields.pop("results", None)
+        key = self._key(job_id)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if fields:
+                pipe.hset(key, mapping={k: json.dumps(v) for k, v in fields.items()})
+            pipe.expire(key, self.ttl_seconds)
+            # Results can be large, so they live in their own key and are only
+            # fetched by the results endpoint
+            if results is not None:
+                pipe.set(self._results_key(job_id), json.dumps(results), ex=self.ttl_seconds)
+            await pipe.execute()
+
+    async def create(self, job_id: str, fields: Dict):
+        now = time.time()
+        await self._write(job_id, fields)
+
+        # Expired index entries are pruned by sweep(), which also runs on_drop
+        await self.redis.zadd(self.INDEX_KEY, {job_id: now})
+
+    async def update(self, job_id: str, **fields):
+        await self._write(job_id, fields)
+
+    async def increment(self, job_id: str, field: str, amount: int = 1) -> int:
+        return await self.redis.hincrby(self._key(job_id), field, amount)
+
+    async def get(self, job_id: str, include_results: bool = False) -> Optional[Dict]:
+        raw = await self.redis.hgetall(self._key(job_id))
+        if not raw:
+            return None
+
+        job = {k: json.loads(v) for k, v in raw.items()}
+
+        if include_results:
+            results = await self.redis.get(self._results_key(job_id))
+            job["results"] = json.loads(results) if results else []
+
+        return job
+
+    async def list_jobs(self) -> Dict[str, Dict]:
+        job_ids = await self.redis.zrange(self.INDEX_KEY, 0, -1)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._key(job_id))
+            raw_jobs = await pipe.execute()
+
+        return {
+            job_id: {k: json.loads(v) for k, v in raw.items()}
+            for job_id, raw in zip(job_ids, raw_jobs)
+            if raw
+        }
+
+    async def count(self) -> int:
+        return await self.redis.zcount(self.INDEX_KEY, time.time() - self.ttl_seconds, "+inf")
+
+    async def sweep(self) -> int:
+        # Job keys expire on their own (their TTL is refreshed on every
+        # write); index entries are pruned once their key is gone
+        job_ids = await self.redis.zrangebyscore(self.INDEX_KEY, 0, time.time() - self.ttl_seconds)
+        if not job_ids:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.exists(self._key(job_id))
+            alive = await pipe.execute()
+
+        gone = [job_id for job_id, exists in zip(job_ids, alive) if not exists]
+        if gone:
+            await self.redis.zrem(self.INDEX_KEY, *gone)
+        for job_id in gone:
+            self._dropped(job_id)
+        return len(gone)
+
+    async def close(self):
+        await self.redis.aclose()
+
+
+def create_job_store(
+    redis_url: Optional[str] = None,
+    ttl_seconds: int = 86400,
+    max_jobs: int = 1000,
+    on_drop: Optional[Callable[[str], None]] = None
+) -> JobStore:
+    """
+    Factory function to return the appropriate job store
+
+    Args:
+        redis_url: Redis connection URL (in-memory store is used when not set)
+        ttl_seconds: How long finished jobs are kept
+        max_jobs: Capacity of the in-memory store
+        on_drop: Called with the ID of every job dropped from the store
+
+    Returns:
+        JobStore instance
+    """
+    if redis_url:
+        if not REDIS_AVAILABLE:
+            raise ValueError("REDIS_URL is set but the 'redis' package is not installed")
+
+        logger.info("Using Redis job store")
+        return RedisJobStore(redis_url, ttl_seconds=ttl_seconds, on_drop=on_drop)
+
+    logger.info("Using in-memory job store (state is not shared between workers)")
+    return JobStore(max_jobs=max_jobs, ttl_seconds=ttl_seconds, on_drop=on_drop)
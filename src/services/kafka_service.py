@@ -1,13 +1,24 @@
-import json
+import asyncio
 import logging
-from typing import Dict, Any, List
-from confluent_kafka import Consumer, Producer, KafkaError, KafkaException
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
+from confluent_kafka import Consumer, Producer, KafkaError, KafkaException, TopicPartition
 from confluent_kafka.admin import AdminClient, NewTopic
 import os
 from src.config.settings import settings
-from src.monitoring.health_check import KafkaMonitorService
+from src.monitoring.health_check import monitor
 from aws_msk_iam_sasl_signer import MSKAuthTokenProvider
 
+# Optional msgspec import (faster decoding of consumed messages; orjson otherwise)
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 # Configure logging
 environment = settings.NODE_ENV
 log_level = logging.DEBUG if environment == "development" else logging.INFO
@@ -20,21 +31,107 @@ logging.basicConfig(
 # Reduce third-party noise
 logging.getLogger("kafka").setLevel(logging.WARNING)
 
+# Envelope fields identical on every produced message
+SERVICE_META = {"service": "enhanced-video-classification", "version": "2.0.0"}
+
+# Decoder for consumed message values (bytes in, dict out), and the errors it
+# raises on malformed JSON
+if MSGSPEC_AVAILABLE:
+    decode_message = msgspec.json.Decoder().decode
+    MESSAGE_DECODE_ERRORS = (msgspec.DecodeError,)
+else:
+    decode_message = orjson.loads
+    MESSAGE_DECODE_ERRORS = (orjson.JSONDecodeError,)
+
+
+class PartitionOffsetTracker:
+    """
+    Contiguous handled offsets per partition, for out-of-order handlers
+
+    Messages are tracked in dispatch order and marked handled as their
+    handlers finish; only the end of each partition's handled prefix is
+    stored, so nothing past a message that is still running gets committed.
+    Rebalance callbacks run on the consumer's thread, so all state is
+    guarded by a lock.
+    """
+
+    def __init__(self, consumer):
+        self.consumer = consumer
+        self._lock = threading.Lock()
+        # (topic, partition) -> offset -> handled, in dispatch order
+        self._pending: Dict[Tuple[str, int], "OrderedDict[int, bool]"] = {}
+
+    def track(self, msg):
+        """Record a message as dispatched but not yet handled"""
+        with self._lock:
+            pending = self._pending.setdefault((msg.topic(), msg.partition()), OrderedDict())
+            pending[msg.offset()] = False
+
+    def pending_count(self, msg) -> int:
+        """Messages of msg's partition that are tracked but not yet stored"""
+        with self._lock:
+            return len(self._pending.get((msg.topic(), msg.partition()), ()))
+
+    def complete(self, msg) -> int:
+        """
+        Mark a message as handled and store its partition's contiguous progress
+
+        Returns:
+            Number of messages whose offsets were newly stored
+        """
+        topic, partition = msg.topic(), msg.partition()
+        with self._lock:
+            pending = self._pending.get((topic, partition))
+            if pending is None or msg.offset() not in pending:
+                return 0
+            pending[msg.offset()] = True
+
+            handled = 0
+            last = None
+            while pending:
+                offset, done = next(iter(pending.items()))
+                if not done:
+                    break
+                pending.popitem(last=False)
+                last = offset
+                handled += 1
+
+            if last is not None:
+                self.consumer.store_offsets(offsets=[TopicPartition(topic, partition, last + 1)])
+            return handled
+
+    def revoke(self, partitions):
+        """Forget partitions taken away by a rebalance"""
+        with self._lock:
+            for tp in partitions:
+                self._pending.pop((tp.topic, tp.partition), None)
+
 
 class KafkaService:
     """
     Kafka Service with multi-topic support for video classification workflow
+
+    Produces are queued and delivered in the background, so owners must
+    await close_producer() on shutdown (after close_consumer()); anything
+    still queued when the process exits without it is lost.
     """
 
+    # After a failed delivery, produces are rejected up front for this long
+    # (doubling while deliveries keep failing)
+    PRODUCER_BACKOFF_MIN_SECONDS = 1.0
+    PRODUCER_BACKOFF_MAX_SECONDS = 30.0
+
     def __init__(self):
         # Initialize monitoring service
-        self.monitor = KafkaMonitorService()
+        self.monitor = monitor
 
         # Define topics for the enhanced video classification workflow
         self.topics = {
             "input": settings.INPUT_TOPIC,  # file-service topic (CircoPost data)
             "safety_output": "classification.safety_check_passed",
             "quality_output": "classification.quality_analysis",
+            # Messages whose handler kept failing
+            "dead_letter": f"{settings.INPUT_TOPIC}.dead_letter",
         }
 
         # Base configuration for both producer and consumer
@@ -63,11 +160,21 @@ class KafkaService:
                 )
             elif settings.KAFKA_AUTH_TYPE == "IAM":
 
+                # Tokens are valid for ~15 minutes, so one is reused until it
+                # is about to expire (librdkafka calls this from its own
+                # threads, hence the lock)
+                token_lock = threading.Lock()
+                cached_token = {"token": None, "expiry": 0.0}
+
                 def oauth_cb(oauth_config):
-                    auth_token, expiry_ms = MSKAuthTokenProvider.generate_auth_token(
-                        settings.AWS_REGION
-                    )
-                    return auth_token, expiry_ms / 1000
+                    with token_lock:
+                        if time.time() + 60 >= cached_token["expiry"]:
+                            auth_token, expiry_ms = MSKAuthTokenProvider.generate_auth_token(
+                                settings.AWS_REGION
+                            )
+                            cached_token["token"] = auth_token
+                            cached_token["expiry"] = expiry_ms / 1000
+                        return cached_token["token"], cached_token["expiry"]
 
                 self.base_conf.update(
                     {
@@ -88,20 +195,29 @@ class KafkaService:
                 "retries": 5,
                 "retry.backoff.ms": "1000",
                 "enable.idempotence": "true",  # Prevent duplicate messages
-                "compression.type": "gzip",  # Compress messages
+                "compression.type": "lz4",  # Compress messages (several times gzip's throughput)
                 "batch.size": 16384,
                 "linger.ms": 5,  # Small delay to batch messages
             }
         )
 
+        # Transactional producer: a produce_many batch becomes one atomic
+        # commit instead of individually acknowledged messages
+        self.transactional = settings.KAFKA_TRANSACTIONAL
+        if self.transactional:
+            self.producer_conf["transactional.id"] = f"{self.base_conf['client.id']}_txn"
+        self._transaction_lock = asyncio.Lock()
+
         # Enhanced Consumer Configuration
         self.consumer_conf = self.base_conf.copy()
         self.consumer_conf.update(
             {
                 "group.id": f"{settings.MICROSERVICE_GROUPID}_enhanced",
                 "auto.offset.reset": "earliest",
-                "enable.auto.commit": True,
-                "auto.commit.interval.ms": 5000,
+                # Offsets are stored once a message is handled and committed
+                # in batches by the consume loop (at-least-once)
+                "enable.auto.commit": False,
+                "enable.auto.offset.store": False,
                 "max.poll.interval.ms": 300000,  # 5 minutes max processing time
                 "session.timeout.ms": 30000,
                 "heartbeat.interval.ms": 3000,
@@ -113,14 +229,53 @@ class KafkaService:
         self.consumer = None
         self.admin_client = None
 
+        # Serves producer delivery callbacks while messages are in flight
+        # (produces no longer flush one by one)
+        self._poll_task = None
+        self.producer_poll_interval = 0.1
+
+        # Producer health, updated from delivery callbacks
+        self._producer_healthy = True
+        self._producer_backoff = self.PRODUCER_BACKOFF_MIN_SECONDS
+        self._producer_retry_at = 0.0
+
+        # Output topics are created once, by the first produce
+        self._topics_initialized = False
+        self._topics_lock = asyncio.Lock()
+
+        # Messages fetched per consumer call, and handled concurrently
+        self.consume_batch_size = settings.KAFKA_CONSUME_BATCH_SIZE
+        self.max_concurrent_messages = settings.KAFKA_MAX_CONCURRENT_MESSAGES
+
+        # Stored offsets are committed every N handled messages or T seconds
+        self.commit_every_messages = 100
+        self.commit_interval_seconds = 5.0
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+        # A failing handler is retried this many times in total before its
+        # message is dead-lettered (and its offset stored)
+        self.max_handler_attempts = settings.KAFKA_MAX_HANDLER_ATTEMPTS
+        self.handler_retry_max_seconds = 30.0
+        # Dispatch pauses while a partition has this many unstored messages
+        # queued behind one that is still being handled
+        self.max_pending_offsets = settings.KAFKA_MAX_PENDING_OFFSETS
+
         self._initialize_clients()
 
+        # Handlers finish out of order, so offsets are stored per partition
+        # only up to the first message that is still being handled
+        self._offsets = PartitionOffsetTracker(self.consumer)
+
     def _initialize_clients(self):
         """Initialize enhanced Kafka clients with error handling"""
         try:
             self.producer = Producer(self.producer_conf)
+            if self.transactional:
+                self.producer.init_transactions(10)
             self.consumer = Consumer(self.consumer_conf)
-            self.admin_client = AdminClient({**self.producer_conf})
+            # Admin requests only need connection/auth settings
+            self.admin_client = AdminClient(self.base_conf.copy())
 
             # Test connection
             self.admin_client.poll(3)
@@ -162,6 +317,14 @@ class KafkaService:
                         "cleanup.policy": "delete",
                     },
                 },
+                self.topics["dead_letter"]: {
+                    "num_partitions": 1,
+                    "replication_factor": 1,
+                    "config": {
+                        "retention.ms": "1209600000",  # 14 days
+                        "cleanup.policy": "delete",
+                    },
+                },
             }
 
             new_topics = []
@@ -190,6 +353,15 @@ class KafkaService:
         except Exception as e:
             logging.error(f"Error in enhanced topic creation: {e}")
 
+    async def _ensure_topics(self):
+        """Create the output topics on first use only"""
+        if self._topics_initialized:
+            return
+        async with self._topics_lock:
+            if not self._topics_initialized:
+                await self.create_topics_if_not_exist()
+                self._topics_initialized = True
+
     async def produce_safety_result(self, data: Dict[str, Any]):
         """Produce safety check and tagging results to safety topic"""
         return await self._produce_message(
@@ -206,49 +378,217 @@ class KafkaService:
         """Generic produce method for backward compatibility"""
         return await self._produce_message(topic, data, "generic")
 
-    async def _produce_message(
-        self, topic: str, data: Dict[str, Any], message_type: str
-    ):
-        """Internal method to produce messages with enhanced error handling and monitoring"""
-        try:
-            # Ensure topic exists
-            await self.create_topics_if_not_exist()
+    async def produce_sync(self, topic: str, data: Dict[str, Any], timeout: float = 10):
+        """Produce a message and wait until the broker acknowledges it"""
+        return await self._produce_message(topic, data, "generic", wait_timeout=timeout)
+
+    async def produce_many(
+        self, topic: str, records: List[Dict[str, Any]], message_type: str = "generic"
+    ) -> List[Dict[str, Any]]:
+        """
+        Produce a batch of messages and wait for all of their acknowledgements
+
+        Every record is queued before a single poll, so librdkafka can pack
+        them into as few broker requests as linger.ms/batch.size allow. With
+        KAFKA_TRANSACTIONAL the batch is committed as one transaction.
+
+        Args:
+            topic: Topic name
+            records: Message payloads (keyed by their jobId, like produce)
+            message_type: Message type recorded in the envelope
+
+        Returns:
+            One status dict per record, in order
+        """
+        if self._producer_unavailable():
+            timestamp = self._get_current_timestamp()
+            return [
+                self._producer_unavailable_result(topic, data, timestamp) for data in records
+            ]
+
+        await self._ensure_topics()
+
+        if self.transactional:
+            async with self._transaction_lock:
+                return await self._produce_batch(topic, records, message_type)
+        return await self._produce_batch(topic, records, message_type)
+
+    async def _produce_batch(
+        self, topic: str, records: List[Dict[str, Any]], message_type: str
+    ) -> List[Dict[str, Any]]:
+        """Queue records (inside a transaction when transactional) and collect their outcomes"""
+        if self.transactional:
+            try:
+                self.producer.begin_transaction()
+            except KafkaException as e:
+                logging.error(f"Could not begin transaction to {topic}: {e}")
+                timestamp = self._get_current_timestamp()
+                return [self._error_result(data, e, timestamp) for data in records]
+
+        # (delivery future or local error, envelope timestamp) per record
+        queued = []
+        for data in records:
+            try:
+                queued.append(self._enqueue(topic, data, message_type))
+            except Exception as e:
+                logging.error(f"Error producing enhanced message to {topic}: {e}")
+                queued.append((e, self._get_current_timestamp()))
+
+        if self.transactional:
+            # A batch is all or nothing: one record that could not be queued
+            # aborts the transaction instead of committing the rest
+            enqueue_error = next(
+                (outcome for outcome, _ in queued if not isinstance(outcome, asyncio.Future)),
+                None,
+            )
+            try:
+                if enqueue_error is not None:
+                    raise KafkaException(f"Transaction aborted, a record failed to queue: {enqueue_error}")
+                # Flushes the batch; blocks until the transaction is committed
+                await asyncio.to_thread(self.producer.commit_transaction, 10)
+            except KafkaException as e:
+                logging.error(f"Transaction to {topic} failed, aborting: {e}")
+                try:
+                    await asyncio.to_thread(self.producer.abort_transaction, 10)
+                except KafkaException as abort_error:
+                    logging.error(f"Failed to abort transaction to {topic}: {abort_error}")
+                queued = [
+                    (outcome if not isinstance(outcome, asyncio.Future) else e, timestamp)
+                    for outcome, timestamp in queued
+                ]
+        else:
+            self.producer.poll(0)
+            self._ensure_poll_task()
+
+        delivery_errors = iter(await asyncio.gather(
+            *(outcome for outcome, _ in queued if isinstance(outcome, asyncio.Future))
+        ))
+
+        results = []
+        for data, (outcome, timestamp) in zip(records, queued):
+            err = next(delivery_errors) if isinstance(outcome, asyncio.Future) else outcome
+            if err:
+                results.append(self._error_result(data, err, timestamp))
+                continue
+            results.append({
+                "status": "success",
+                "message": f"Message produced to {topic}",
+                "jobId": data.get("jobId", "unknown"),
+                "timestamp": timestamp,
+            })
 
-            # Add metadata to message
-            enhanced_data = {
-                "timestamp": self._get_current_timestamp(),
-                "message_type": message_type,
-                "service": "enhanced-video-classification",
-                "version": "2.0.0",
-                "data": data,
-            }
+        logging.info(f"Produced batch of {len(records)} messages to topic {topic}")
+        return results
 
-            # Convert data to JSON
-            data_json = json.dumps(enhanced_data, ensure_ascii=False).encode("utf-8")
+    def _error_result(self, data: Dict[str, Any], err, timestamp: int) -> Dict[str, Any]:
+        """Status dict for a message that was not produced"""
+        return {
+            "status": "error",
+            "message": str(err),
+            "jobId": data.get("jobId", "unknown"),
+            "timestamp": timestamp,
+        }
 
-            # Add message key based on jobId for partitioning
-            message_key = data.get("jobId", "default").encode("utf-8")
+    def _producer_unavailable(self) -> bool:
+        """Whether recent delivery failures mean produces should fail fast"""
+        return not self._producer_healthy and time.monotonic() < self._producer_retry_at
 
-            # Produce message with callback
-            def delivery_callback(err, msg):
-                if err:
-                    logging.error(f"Message delivery failed to {topic}: {err}")
-                    self.monitor.update_producer_status("Failed")
-                else:
-                    logging.info(
-                        f"Message delivered to {topic} "
-                        f"[partition: {msg.partition()}, offset: {msg.offset()}]"
-                    )
+    def _producer_unavailable_result(self, topic: str, data: Dict[str, Any], timestamp: int):
+        """Error result for a produce rejected while the producer is failing"""
+        return {
+            "status": "error",
+            "message": f"Producer unavailable after failed deliveries to {topic}, retrying later",
+            "jobId": data.get("jobId", "unknown"),
+            "timestamp": timestamp,
+        }
 
-            self.producer.produce(
-                topic=topic,
-                key=message_key,
-                value=data_json,
-                callback=delivery_callback,
+    def _record_delivery(self, failed: bool):
+        """Track producer health from a delivery report"""
+        if not failed:
+            self._producer_healthy = True
+            self._producer_backoff = self.PRODUCER_BACKOFF_MIN_SECONDS
+            return
+
+        now = time.monotonic()
+        if self._producer_healthy:
+            self._producer_backoff = self.PRODUCER_BACKOFF_MIN_SECONDS
+        elif now >= self._producer_retry_at:
+            # The produces let through after the last backoff failed too
+            self._producer_backoff = min(
+                self._producer_backoff * 2, self.PRODUCER_BACKOFF_MAX_SECONDS
             )
+        else:
+            # Another report from the same burst of failures
+            return
+        self._producer_healthy = False
+        self._producer_retry_at = now + self._producer_backoff
+
+    def _ensure_poll_task(self):
+        """Start the background delivery-callback poller if it is not running"""
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_producer())
+
+    async def _poll_producer(self):
+        """Serve delivery callbacks until nothing is left in flight"""
+        while len(self.producer) > 0:
+            self.producer.poll(0)
+            await asyncio.sleep(self.producer_poll_interval)
+
+    async def close_producer(self, timeout: float = 10):
+        """
+        Deliver everything still queued, then stop the poller
+
+        Not called automatically: the service's owner must await this on
+        shutdown, from the event loop the produces ran on (delivery callbacks
+        resolve their futures through it)
+        """
+        if self._poll_task:
+            self._poll_task.cancel()
+        if self.producer:
+            remaining = await asyncio.to_thread(self.producer.flush, timeout)
+            if remaining:
+                logging.error(f"{remaining} messages were not delivered before shutdown")
+
+    async def _produce_message(
+        self,
+        topic: str,
+        data: Dict[str, Any],
+        message_type: str,
+        wait_timeout: Optional[float] = None
+    ):
+        """
+        Internal method to produce messages with enhanced error handling and monitoring
+
+        Messages are queued and batched by librdkafka (linger.ms/batch.size);
+        delivery is reported by the callback. Pass wait_timeout to wait for
+        the broker acknowledgement instead.
+
+        With KAFKA_TRANSACTIONAL every single produce is its own transaction:
+        produces are serialized behind the transaction lock and each one waits
+        for its begin/commit round-trips (commit blocks for up to 10s), so
+        wait_timeout is ignored. Use produce_many to amortize that cost over
+        a batch.
+        """
+        if self.transactional:
+            # Transactional producers cannot produce outside a transaction
+            return (await self.produce_many(topic, [data], message_type))[0]
+
+        # Fail fast (before encoding) while deliveries are failing
+        if self._producer_unavailable():
+            return self._producer_unavailable_result(topic, data, self._get_current_timestamp())
+
+        try:
+            # Ensure topics exist (one CreateTopics round-trip per service)
+            await self._ensure_topics()
 
-            # Flush to ensure delivery
-            self.producer.flush(timeout=10)
+            delivered, timestamp = self._enqueue(topic, data, message_type)
+            self.producer.poll(0)
+            self._ensure_poll_task()
+
+            if wait_timeout is not None:
+                err = await asyncio.wait_for(delivered, wait_timeout)
+                if err:
+                    raise KafkaException(err)
 
             logging.info(
                 f"Enhanced message produced to topic {topic} for job {data.get('jobId', 'unknown')}"
@@ -257,7 +597,7 @@ class KafkaService:
                 "status": "success",
                 "message": f"Message produced to {topic}",
                 "jobId": data.get("jobId", "unknown"),
-                "timestamp": enhanced_data["timestamp"],
+                "timestamp": timestamp,
             }
 
         except Exception as e:
@@ -269,6 +609,60 @@ class KafkaService:
                 "timestamp": self._get_current_timestamp(),
             }
 
+    def _enqueue(
+        self, topic: str, data: Dict[str, Any], message_type: str
+    ) -> Tuple[asyncio.Future, int]:
+        """
+        Queue one message on the producer without polling
+
+        Returns:
+            Future resolved with the delivery error (None on success) once the
+            delivery callback runs, and the envelope timestamp
+        """
+        # Add metadata to message
+        enhanced_data = {
+            "timestamp": self._get_current_timestamp(),
+            "message_type": message_type,
+            **SERVICE_META,
+            "data": data,
+        }
+
+        # Convert data to JSON (orjson emits UTF-8 bytes directly)
+        data_json = orjson.dumps(enhanced_data)
+
+        # Add message key based on jobId for partitioning
+        message_key = data.get("jobId", "default").encode("utf-8")
+
+        # Produce message with callback. Callbacks run in whichever thread
+        # serves the producer (poll on the loop, flush/commit in a worker),
+        # so the future is resolved through the loop
+        loop = asyncio.get_running_loop()
+        delivered = loop.create_future()
+
+        def resolve(err):
+            if not delivered.done():
+                delivered.set_result(err)
+
+        def delivery_callback(err, msg):
+            self._record_delivery(failed=err is not None)
+            if err:
+                logging.error(f"Message delivery failed to {topic}: {err}")
+                self.monitor.update_producer_status("Failed")
+            else:
+                logging.info(
+                    f"Message delivered to {topic} "
+                    f"[partition: {msg.partition()}, offset: {msg.offset()}]"
+                )
+            loop.call_soon_threadsafe(resolve, err)
+
+        self.producer.produce(
+            topic=topic,
+            key=message_key,
+            value=data_json,
+            callback=delivery_callback,
+        )
+        return delivered, enhanced_data["timestamp"]
+
     async def consume(self, topics: List[str], message_handler, stop_event=None):
         """Enhanced consume method with improved error handling and monitoring"""
         try:
@@ -282,7 +676,7 @@ class KafkaService:
 
     def _subscribe_to_topics(self, topics: List[str]):
         """Subscribe to topics with enhanced logging"""
-        self.consumer.subscribe(topics)
+        self.consumer.subscribe(topics, on_revoke=self._on_revoke)
         logging.info(f"Enhanced consumer subscribed to topics: {topics}")
         self.monitor.update_consumer_status("Subscribed")
 
@@ -290,28 +684,57 @@ class KafkaService:
         """Enhanced message consumption with better error handling and monitoring"""
         consecutive_errors = 0
         max_consecutive_errors = 5
+        # Handler tasks still running (bounded by max_concurrent_messages)
+        inflight = set()
 
         while stop_event is None or not stop_event.is_set():
             try:
-                msg = self.consumer.poll(1.0)
+                # One call fetches up to a batch of messages; it blocks for up
+                # to the timeout, so it runs off the loop while handlers work
+                msgs = await asyncio.to_thread(
+                    self.consumer.consume,
+                    num_messages=self.consume_batch_size,
+                    timeout=1.0,
+                )
 
-                if msg is None:
+                if not msgs:
                     consecutive_errors = 0  # Reset error count on successful poll
                     continue
 
-                if msg.error():
-                    self._handle_message_error_enhanced(msg)
-                    consecutive_errors += 1
-                    if consecutive_errors >= max_consecutive_errors:
-                        logging.error(
-                            f"Too many consecutive errors ({consecutive_errors}), stopping consumer"
+                batch_failed = False
+                for msg in msgs:
+                    if msg.error():
+                        self._handle_message_error_enhanced(msg)
+                        batch_failed = True
+                        continue
+
+                    if len(inflight) >= self.max_concurrent_messages:
+                        _, inflight = await asyncio.wait(
+                            inflight, return_when=asyncio.FIRST_COMPLETED
+                        )
+                    # Bound the handled-but-unstored backlog behind a slow message
+                    while inflight and self._offsets.pending_count(msg) >= self.max_pending_offsets:
+                        _, inflight = await asyncio.wait(
+                            inflight, return_when=asyncio.FIRST_COMPLETED
                         )
-                        break
+                    self._offsets.track(msg)
+                    inflight.add(asyncio.create_task(
+                        self._process_message_enhanced(msg, message_handler)
+                    ))
+
+                self._maybe_commit()
+
+                # Errors are counted per batch: a batch without any resets the count
+                if not batch_failed:
+                    consecutive_errors = 0
                     continue
 
-                # Reset error count on successful message
-                consecutive_errors = 0
-                await self._process_message_enhanced(msg, message_handler)
+                consecutive_errors += 1
+                if consecutive_errors >= max_consecutive_errors:
+                    logging.error(
+                        f"Too many consecutive errors ({consecutive_errors}), stopping consumer"
+                    )
+                    break
 
             except Exception as e:
                 consecutive_errors += 1
@@ -323,6 +746,59 @@ class KafkaService:
                     )
                     break
 
+        # Let handlers that are still running finish before the consumer closes
+        if inflight:
+            await asyncio.wait(inflight)
+
+    def _on_revoke(self, consumer, partitions):
+        """
+        Commit handled work before partitions move to another consumer
+
+        Runs on the consumer's thread (inside consume()). Messages still being
+        handled are redelivered to the new owner.
+        """
+        self._offsets.revoke(partitions)
+        if not self._uncommitted:
+            return
+        try:
+            consumer.commit(asynchronous=False)
+            self._uncommitted = 0
+            self._last_commit = time.monotonic()
+        except KafkaException as e:
+            logging.error(f"Failed to commit offsets on partition revoke: {e}")
+
+    def _store_offset(self, msg):
+        """
+        Mark a message as handled so the next commit covers it
+
+        The stored offset of its partition only advances once every earlier
+        message there is handled too (see PartitionOffsetTracker)
+        """
+        self._uncommitted += self._offsets.complete(msg)
+
+    def _maybe_commit(self):
+        """Commit stored offsets once enough messages or time have accumulated"""
+        if not self._uncommitted:
+            return
+        if (
+            self._uncommitted < self.commit_every_messages
+            and time.monotonic() - self._last_commit < self.commit_interval_seconds
+        ):
+            return
+        self.consumer.commit(asynchronous=True)
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def _commit_final(self):
+        """Synchronously commit whatever is still stored (before closing)"""
+        if not self._uncommitted:
+            return
+        try:
+            self.consumer.commit(asynchronous=False)
+            self._uncommitted = 0
+        except KafkaException as e:
+            logging.error(f"Failed to commit consumer offsets: {e}")
+
     def _handle_message_error_enhanced(self, msg):
         """Enhanced message error handling"""
         if msg.error().code() == KafkaError._PARTITION_EOF:
@@ -339,8 +815,8 @@ class KafkaService:
     async def _process_message_enhanced(self, msg, message_handler):
         """Enhanced message processing with metadata extraction"""
         try:
-            # Decode message
-            message_data = json.loads(msg.value().decode("utf-8"))
+            # Decode message (msgspec/orjson parse the raw bytes)
+            message_data = decode_message(msg.value())
 
             # Extract metadata if present
             if "data" in message_data and "message_type" in message_data:
@@ -367,20 +843,73 @@ class KafkaService:
                 "timestamp": msg.timestamp()[1] if msg.timestamp()[0] == 1 else None,
             }
 
-            # Process message
-            await message_handler(actual_data)
-
-            # Update monitoring
-            self.monitor.update_consumer_status("Processing")
-
-        except json.JSONDecodeError as e:
+        except MESSAGE_DECODE_ERRORS as e:
             logging.error(f"Failed to decode enhanced message JSON: {e}")
+            # Undecodable messages never succeed; do not redeliver them
+            self._store_offset(msg)
+            return
         except Exception as e:
             logging.error(f"Error processing enhanced message: {e}")
+            await self._dead_letter(msg, e)
+            self._store_offset(msg)
+            return
+
+        # Process message; the offset is stored even when the handler gives
+        # up, so one poison message cannot hold its partition back forever
+        await self._handle_with_retries(msg, actual_data, message_handler)
+        self._store_offset(msg)
+
+    async def _handle_with_retries(self, msg, actual_data, message_handler):
+        """Run the handler, retrying with backoff, and dead-letter the message if it keeps failing"""
+        for attempt in range(1, self.max_handler_attempts + 1):
+            try:
+                await message_handler(actual_data)
+                # Update monitoring
+                self.monitor.update_consumer_status("Processing")
+                return
+            except Exception as e:
+                if attempt >= self.max_handler_attempts:
+                    logging.error(
+                        f"Error processing enhanced message {msg.topic()}[{msg.partition()}]"
+                        f"@{msg.offset()} after {attempt} attempts, dead-lettering it: {e}"
+                    )
+                    await self._dead_letter(msg, e)
+                    return
+
+                delay = min(2 ** (attempt - 1), self.handler_retry_max_seconds)
+                logging.warning(
+                    f"Error processing enhanced message (attempt {attempt}/"
+                    f"{self.max_handler_attempts}), retrying in {delay}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _dead_letter(self, msg, error: Exception):
+        """Produce a message that could not be handled to the dead-letter topic"""
+        key = msg.key()
+        result = await self._produce_message(
+            self.topics["dead_letter"],
+            {
+                "jobId": key.decode("utf-8", errors="replace") if key else "unknown",
+                "source": {
+                    "topic": msg.topic(),
+                    "partition": msg.partition(),
+                    "offset": msg.offset(),
+                },
+                "error": str(error),
+                "value": (msg.value() or b"").decode("utf-8", errors="replace"),
+            },
+            "dead_letter",
+        )
+        if result["status"] != "success":
+            logging.error(
+                f"Failed to dead-letter message {msg.topic()}[{msg.partition()}]@{msg.offset()}: "
+                f"{result['message']}"
+            )
 
     def _close_consumer(self):
         """Enhanced consumer closing with better error handling"""
         try:
+            self._commit_final()
             self.consumer.close()
             self.monitor.update_consumer_status("Closed")
             logging.info("Enhanced consumer closed successfully")
@@ -390,6 +919,7 @@ class KafkaService:
     async def close_consumer(self):
         """Async method to close consumer"""
         try:
+            self._commit_final()
             self.consumer.close()
             self.monitor.update_consumer_status("Closed")
             logging.info("Enhanced consumer is closed")
@@ -436,6 +966,4 @@ class KafkaService:
 
     def _get_current_timestamp(self) -> int:
         """Get current timestamp in milliseconds"""
-        import time
-
         return int(time.time() * 1000)
@@ -1,5 +1,6 @@
 from datetime import datetime
 import threading
+import time
 
 
 class ServiceStatus:
@@ -17,25 +18,39 @@ class ServiceStatus:
                     cls._instance = super().__new__(cls)
                     cls._instance.startup_time = datetime.now()
                     cls._instance.kafka_connected = False
-                    cls._instance.total_messages_processed = 0
-                    cls._instance.last_processed_time = None
                     cls._instance.last_error = None
+                    cls._instance._counter_lock = threading.Lock()
+                    cls._instance._total_messages = 0
+                    cls._instance._last_processed_ts = None
         return cls._instance
 
+    @property
+    def total_messages_processed(self) -> int:
+        """Number of messages processed so far"""
+        return self._total_messages
+
+    @property
+    def last_processed_time(self):
+        """When the last message was processed (None before the first one)"""
+        if self._last_processed_ts is None:
+            return None
+        return datetime.fromtimestamp(self._last_processed_ts)
+
     def increment_messages(self):
         """
-        Increment message processing count in a thread-safe manner.
+        Increment message processing count.
         """
-        with self._lock:
-            self.total_messages_processed += 1
-            self.last_processed_time = datetime.now()
+        # Uncontended except when messages finish at the same moment
+        with self._counter_lock:
+            self._total_messages += 1
+        self._last_processed_ts = time.time()
 
     def set_kafka_connection(self, status: bool):
         """
         Update Kafka connection status.
         """
-        with self._lock:
-            self.kafka_connected = status
+        # A single attribute assignment is atomic
+        self.kafka_connected = status
 
     def record_error(self, error: str):
         """
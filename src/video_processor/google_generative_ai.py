@@ -1,18 +1,27 @@
 import time
 import os
 import asyncio
+import hashlib
 import json
 import logging
 import re
-import json
-from typing import Dict, List, Optional, Any
+import weakref
+from typing import Dict, List, Optional, Any, Tuple
 
 import google.generativeai as genai
-from slack_sdk import WebClient
+import orjson
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
 from src.config.settings import settings
 
+# Optional cachetools import (description-alignment results are not cached without it)
+try:
+    from cachetools import LFUCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
 # Configure logging
 environment = settings.NODE_ENV
 log_level = logging.DEBUG if environment == "development" else logging.INFO
@@ -25,6 +34,280 @@ logging.basicConfig(
 # Reduce third-party noise
 logging.getLogger("kafka").setLevel(logging.WARNING)
 
+# JSON inside a markdown code fence
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+
+
+def _find_json_objects(text: str):
+    """
+    Yield balanced top-level {...} substrings of text in a single pass
+
+    Braces inside JSON string literals are ignored. A linear scan replaces
+    the nested-quantifier regex, which could backtrack exponentially on
+    large malformed responses. When a stray "{" (e.g. in prose before the
+    JSON) is never closed, the outermost objects that did close after it
+    are yielded instead.
+
+    Args:
+        text: Text that may contain JSON objects
+
+    Yields:
+        Candidate JSON object substrings, in order
+    """
+    # Start positions of the objects currently open, outermost first
+    opened = []
+    # Objects closed while an enclosing "{" was still open, in closing order
+    closed_inside = []
+    in_string = False
+    escape = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            opened.append(i)
+        elif opened:
+            if char == '"':
+                in_string = True
+            elif char == "}":
+                start = opened.pop()
+                if opened:
+                    closed_inside.append((start, i + 1))
+                else:
+                    closed_inside.clear()
+                    yield text[start:i + 1]
+
+    # Unterminated candidate: fall back to the outermost objects inside it
+    end = -1
+    for start, stop in sorted(closed_inside):
+        if start >= end:
+            end = stop
+            yield text[start:stop]
+
+
+# Description-alignment results by (model, caption, aiContext) digest; least
+# frequently used are evicted, so captions that keep coming back stay cached
+ALIGNMENT_CACHE_SIZE = 50_000
+_alignment_cache = LFUCache(maxsize=ALIGNMENT_CACHE_SIZE) if CACHETOOLS_AVAILABLE else None
+# One lock per digest while its Gemini call is running, so identical
+# concurrent requests make a single call
+_alignment_locks: "weakref.WeakValueDictionary[bytes, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _alignment_cache_key(model_name: str, user_caption: str, ai_context: str) -> bytes:
+    """Digest of the whitespace-normalized alignment inputs"""
+    normalized = "|".join(
+        " ".join(text.split()) for text in (model_name, user_caption, ai_context)
+    )
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+# Videos analyzed by one batched generate_content call, and the instructions
+# appended to the combined prompt for such a call
+VIDEO_BATCH_SIZE = 5
+BATCH_PROMPT_SUFFIX = """
+BATCH MODE: You are given {count} videos above, each preceded by its "Video jobId=..." label.
+Analyze every video independently using the rules above and return ONE JSON object:
+{{"results": [{{"jobId": "<jobId from the label>", "safety_check": {{...}}, "tags": [...], "aiContext": "..."}}, ...]}}
+with exactly one entry per video.
+"""
+
+# Slack safety notifications by contentFlag: (channel key, default reason, template)
+_NOTIFICATION_HEADER = (
+    "*Job ID:* {job_id}\n"
+    "*Video File:* {video_name}\n"
+    "*Video Link:* {video_url}\n"
+    "*Content Flag:* {content_flag}\n"
+)
+SAFETY_NOTIFICATION_TEMPLATES = {
+    "SAFE": (
+        "passed",
+        "",
+        ":white_check_mark: *Video Safety Check PASSED* :white_check_mark:\n"
+        + _NOTIFICATION_HEADER
+        + "*AI Context:* {ai_context}\n"
+        "*Generated Tags:* {tags}",
+    ),
+    "RESTRICT_18+": (
+        "review",
+        "Mature content detected",
+        ":warning: *Video Requires 18+ Restriction* :warning:\n"
+        + _NOTIFICATION_HEADER
+        + "*Reason:* {reason}\n"
+        "*AI Context:* {ai_context}\n"
+        "*Generated Tags:* {tags}",
+    ),
+    "BLOCK_VIOLATION": (
+        "review",
+        "Policy violation detected",
+        ":no_entry: *Video BLOCKED - Policy Violation* :no_entry:\n"
+        + _NOTIFICATION_HEADER
+        + "*Violation Reason:* {reason}\n"
+        "*AI Context:* {ai_context}\n"
+        "*Action Required:* Manual review and potential content removal\n"
+        "*Timestamp:* {timestamp}",
+    ),
+}
+
+# Attempts for idempotent Gemini file calls (upload, state polling)
+GEMINI_FILE_ATTEMPTS = 5
+
+
+def _call_with_retry(func, *args, **kwargs):
+    """
+    Call a blocking Gemini function, retrying with exponential backoff
+
+    Args:
+        func: Function to call
+        *args, **kwargs: Passed to func
+
+    Returns:
+        func's return value (the last attempt's exception is re-raised)
+    """
+    for attempt in range(1, GEMINI_FILE_ATTEMPTS + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == GEMINI_FILE_ATTEMPTS:
+                raise
+            delay = 2 ** (attempt - 1)
+            logging.warning(
+                f"{func.__name__} failed (attempt {attempt}/{GEMINI_FILE_ATTEMPTS}): {e}, "
+                f"retrying in {delay}s"
+            )
+            time.sleep(delay)
+
+
+# Combined safety check and tagging prompt (identical for every video)
+COMBINED_SAFETY_TAGGING_PROMPT = """
+You are an expert video content analyst and a content policy moderator for the platform Circo. Your task is to analyze the provided video, enforce the content policy, and classify the content according to the 'Circo Interest Categories & Subcategories' list. You must adhere strictly to all rules and the required output format.
+
+Part 1: Content Policy Enforcement
+First, you must evaluate the video against Circo's Content Policy and assign a `contentFlag`. This is your most important task.
+
+* `contentFlag: "SAFE"`
+    Assign this flag if the video contains no mature or policy-violating material. This is the default for most content.
+
+* `contentFlag: "RESTRICT_18+"`
+    Assign this flag for content that is allowed on the platform but is considered mature and should be age-gated (18+) and de-amplified from the main "For You" page. This includes:
+    - Sex Education: Factual, educational content about sexual health, consent, and safe sex practices.
+    - Artistic & Sensual Expression: Content like professional pole dancing, sensual dance, or non-graphic artistic representations of the human body focused on expression and body positivity.
+    - NSFW Humor: Comedic skits, jokes, or commentary with mature themes that are not graphically explicit.
+    - Mature Discussions: Conversational or educational content about relationships, intimacy, kink, or fetishes that is not visually explicit.
+
+* `contentFlag: "BLOCK_VIOLATION"`
+    Assign this flag for content that is strictly forbidden and must be blocked. This includes:
+    - Pornography: Any depiction of sexually explicit acts.
+    - Non-Consensual Content: Any content depicting sexual acts without clear consent.
+    - Hate Speech & Harassment: Content that attacks or demeans individuals or groups.
+    - Graphic Violence or Gore: Extreme, graphic depictions of violence or injury.
+    - Dangerous Acts: Content promoting self-harm or dangerous challenges.
+    - Child Exploitative Content: Any content that could exploit or harm minors.
+
+Part 2: Interest & Subcategory Tagging
+If the content is SAFE or RESTRICT_18+, classify it according to these Circo Interest Categories:
+
+1. Entertainment & Gossip: Celebrity News, Reality TV, Viral Moments, Breakups & Hookups, Red Carpet, Influencer Drama, Nollywood Buzz, African Royalty, Paparazzi, Awards & Events, Rumors & Leaks, Memes & Trends, Behind-the-Scenes, Social Media Fights, Baby Bumps & Babies, Throwback Moments, Housemate Highlights, Scandals, Fashion Police, Entertainment Reviews, Fan Reactions, Rich Kid Chronicles, Musician Feuds, Flashbacks, Reunions
+
+2. Music: Afrobeats, Gospel, Hip-Hop, R&B, Amapiano, Live Performances, Cover Songs, Music Reviews, Artist Freestyles, Street Music, Throwback Hits, Music Videos, Studio Sessions, Breakthrough Artists, DJ Mixes, Music Battles, Indigenous Sounds, Interviews & Behind-the-Mic, Lyrics & Meaning, Sound Engineering, TikTok Challenges, New Releases, Fan Tributes, Top Charts, Instrumentals
+
+3. Food & Cooking: Street Food, African Dishes, Quick Meals, Traditional Recipes, Food Reviews, Budget Cooking, Baking, Drinks & Cocktails, Food Challenges, Cooking Tips, Kitchen Hacks, Celebrity Chefs, Food Vlogging, Restaurant Tours, Vegan & Healthy, Jollof Wars, Food Markets, Home Cooking, Spicy Dishes, Cooking for Events, Continental Fusion, Recipe Recreation, Meals for Kids, Plating & Aesthetics, Cooking Mistakes
+
+4. Business & Money: Side Hustles, Investing Basics, Mobile Money, Forex & Crypto, Personal Finance, Entrepreneurship, African Startups, Grant Opportunities, Real Estate, Business News, Savings & Budgeting, Small Biz Tips, Market Trends, Online Selling, Youth Finance, Women in Business, Business Interviews, Risk Management, Stock Market, Passive Income, Freelancing, Digital Business, E-commerce, Money Scams, Business Fails
+
+5. Tech & Innovation: Mobile Apps, African Startups, Product Reviews, Gadgets & Unboxing, Coding Tips, Tech News, AI & Automation, EdTech, Internet & Data Tips, Developer Vlogs, Cybersecurity, Fintech, How-To Tech, Hardware Builds, Local Innovation, Space & Science, Tech Events, Smart Homes, Cloud & SaaS, Tech DIY, UI/UX, Digital Tools, Tech Comedy, Internet Culture, AR/VR & Metaverse
+
+6. Education & Self-Development: Study Hacks, Exam Prep, Career Advice, Public Speaking, Productivity Tips, Reading & Book Summaries, Financial Literacy, Skill Acquisition, Personal Branding, Time Management, Online Courses, Mindset Shift, Motivational Talks, Student Life, Academic Scholarships, Mental Clarity, Growth Mindset, Resume & Interview Tips, Soft Skills, Coding for Beginners, Personal Discipline, Language Learning, Study Abroad, Journaling, Goal Setting
+
+7. Sports & Fitness: Football Highlights, Workout Routines, Gym Motivation, Athlete Profiles, Match Analysis, Sports Gossip, African Leagues, Women in Sports, Sports Comedy, Home Workouts, Injury Prevention, Live Scores, Football Skills, Boxing & MMA, Street Sports, Esports Fitness, Fitness Challenges, Supplements & Nutrition, Fitness Myths, Daily Exercise, Youth Sports, Coaching Tips, National Teams, Bodybuilding, Fantasy Sports
+
+8. News & Opinions: Breaking News, Local Stories, Investigative Reports, Commentary, Social Issues, Global News, Community Watch, News Roundups, Panel Discussions, Youth Voices, Opinion Pieces, Interviews, Fact-Checking, Editorials, UGC Reports, Media Reactions, Diaspora Watch, Civic Education, Crime Reports, Environment, Legal & Courts, Trending Topics, Press Reviews, Activism, Satire & Parody
+
+9. Religion: Gospel Sermons, Islamic Teachings, Daily Devotionals, Prayers, Spiritual Questions, Religious Music, Bible Study, Quran Recitation, Church Highlights, Islamic Lectures, Faith & Lifestyle, Miracles & Testimonies, Interfaith Dialogue, Religious Events, Youth & Faith, Christian Comedy, Motivation from Scripture, End Time Messages, Fasting & Prayer, Prophecies, Faith Debates, Sunday Messages, Mosque Moments, Faith & Money, Marriage in Faith
+
+10. Comedy & Skits: Relationship Skits, Village Comedy, Office Banter, Slang Humor, Pranks, Stand-up Clips, Political Satire, Skits about Parents, Dating Misadventures, Campus Life, Parody Songs, Nigerian Comedy, Ghanaian Humor, Everyday Frustrations, Situationship Skits, Religious Comedy, Voiceover Comedy, Meme Reenactments, Social Media Comedy, Dance Comedy, Regional Dialects, Fashion Fails, Food Jokes, Comic Reactions, Skit Series
+
+11. Web3 & Finance: Crypto Basics, NFT Culture, Blockchain Explained, DeFi Tips, Wallet Safety, Token Reviews, Web3 News, Smart Contracts, Trading Signals, Scams to Avoid, Metaverse Trends, Web3 Startups, Yield Farming, Web3 Jobs, Decentralized Apps, DAO Governance, Gas Fees Explained, Play-to-Earn Games, Layer 2 Solutions, Real Use Cases, Airdrops & Giveaways, Digital Identity, Stablecoins, On-chain Analysis, Community Tokens
+
+12. Movie & Drama: Nollywood Reviews, Series Breakdowns, Love Stories, Suspense & Thriller, Movie Recaps, Behind the Scenes, Short Films, Classic Movies, Cinema Releases, Actor Spotlights, Comedy Drama, Youth Series, K-Drama Fandom, Soap Operas, Movie Trailers, Movie Monologues, Reenactments, Soundtrack Highlights, Subtitled Clips, Fan Theories, Celebrity Cameos, Script Reads, Film Production, Drama Challenges, Viewer Reactions
+
+13. Career & Workplace: CV Writing, Interview Prep, Work From Home, Office Politics, Career Switch, Entry-Level Advice, Job Opportunities, Workplace Humor, Productivity Tips, Corporate Culture, Professional Etiquette, Career Coaching, Remote Tools, Tech Careers, Soft Skills, Salary Negotiation, Career Stories, Intern Diaries, Women at Work, Startup Jobs, Burnout & Recovery, Performance Reviews, Freelancing Life, Job Rejections, Leadership Tips
+
+14. Communities: Student Communities, Diaspora Life, Women Groups, Tech Communities, Creators Circle, Writers' Hub, Activist Spaces, LGBTQ+ Voices, Faith Circles, Rural Voices, African Creators, Campus Tribes, Neighborhood Watch, Community Service, Fans & Fandoms, Single Parents, Youth Clubs, Fashion Tribes, Entrepreneurs Unite, Language Groups, City Spotlights, Alumni Networks, Creatives & Makers, Immigrant Life, Tribal & Ethnic Unity
+
+15. Travel and Tourism: Local Destinations, Budget Travel, Travel Vlogs, Food Tourism, Cultural Experiences, Nature & Parks, Road Trips, Historical Sites, Travel Hacks, African Wonders, Urban Adventures, Travel Safety, Beach Diaries, Border Crossings, Group Trips, Honeymoon Spots, Travel Photography, Wildlife Tours, Festivals Abroad, Backpacking, Rural Exploration, Hotel Reviews, Airport Diaries, Language Abroad, Visa Stories
+
+16. Health and Wellness: Mental Health, Fitness Goals, Healthy Eating, Women's Health, Men's Health, Stress Management, Home Remedies, Disease Awareness, Therapy & Counseling, Nutrition Tips, Weight Loss, Meditation, Health Tech, Sexual Health, Sleep Hygiene, Menstrual Health, Pregnancy & Birth, Herbal Medicine, Body Positivity, Fitness Myths, COVID & Vaccines, Daily Wellness Routines, Medical Stories, Public Health, Health Q&A
+
+17. Lifestyle & Culture: Daily Vlogs, Home Decor, Morning Routines, Night Routines, Cultural Practices, Festive Celebrations, Family Life, Shopping Vlogs, Minimalist Living, Local Languages, African Proverbs, Productivity Hacks, Meal Prepping, Sustainable Living, Cleaning Routines, DIY Crafts, Parenting Tips, Celebrating Traditions, Personal Journals, Rituals & Customs, Life Lessons, Urban Living, Digital Detox, Weekend Diaries, Life Abroad
+
+18. Art & Culture: Painting Process, Traditional Art, Dance Performances, Spoken Word, Drawing Time-lapse, Fashion Design, Art Commentary, Poetry, Sculpture, Graffiti & Street Art, Photography Vlogs, Artist Profiles, Art Challenges, Theatre Clips, Cultural Dance, Music Fusion, Animation Clips, Digital Art, Craft Tutorials, Calligraphy, Cultural Artifacts, Art Exhibitions, Fan Art, Creative Expression, Restoration Projects
+
+19. Politics: National Politics, Youth in Politics, Political Commentary, Election Updates, Law & Constitution, Government Spending, Party Analysis, Political Debates, Activism, Corruption Watch, Political History, Voter Education, Policy Review, African Union, International Politics, Protest Highlights, Legislative Summaries, Political Satire, Campaign Videos, Fact Checking, Public Office Profiles, Local Government, Women in Politics, Opinion Polls, Government Projects
+
+20. Beauty & Fashion: Makeup Tutorials, Skincare Routines, Fashion Hauls, Style Tips, Beauty Reviews, Hair Care, Fashion Trends, Outfit Ideas, Beauty Challenges, Fashion Shows, Styling Tips, Beauty Hacks, Fashion DIY, Seasonal Fashion, Beauty Product Reviews, Fashion History, Sustainable Fashion, Men's Grooming, Fashion Fails, Beauty Transformations
+
+Output Format:
+Your entire response MUST be a single, valid JSON object with these keys:
+
+```json
+{
+  "safety_check": {
+    "contentFlag": "SAFE|RESTRICT_18+|BLOCK_VIOLATION",
+    "reason": "Brief explanation for the flag assignment"
+  },
+  "tags": [
+    {
+      "category": "Category Name",
+      "subcategory": ["Subcategory1", "Subcategory2"]
+    }
+  ],
+  "aiContext": "One-sentence description of the video content and your analysis reasoning"
+}
+```
+
+CRITICAL: If contentFlag is "BLOCK_VIOLATION", set tags to an empty array and explain the violation in the reason and aiContext.
+CRITICAL OUTPUT FORMAT:
+Return ONLY a valid JSON object without any markdown formatting or code blocks.
+Do not wrap your response in ```json or ``` tags.
+"""
+
+# Description alignment prompt (filled with str.format)
+DESCRIPTION_ALIGNMENT_PROMPT_TEMPLATE = """
+You are an AI-powered SEO and Content Strategist. Your primary function is to analyze and score the alignment between a video's true content (represented by the `aiContext`) and the user-provided caption.
+
+Inputs:
+1. [aiContext from Video Analysis]: {ai_context}
+2. [User-Provided Video Caption]: {user_caption}
+
+Analysis Criteria:
+Evaluate the User-Provided Video Caption based on:
+1. Semantic Relevance: Does the caption's topic match the aiContext?
+2. Keyword Overlap: Do key concepts from the aiContext appear in the caption?
+3. Accuracy & Honesty: Is the caption an honest representation of the content, or is it misleading clickbait?
+
+Your entire response MUST be a single, valid JSON object with these keys:
+1. `alignmentScore`: An integer score from 0 to 100
+2. `alignmentLevel`: A string: 90-100: `EXCELLENT`, 70-89: `GOOD`, 45-69: `FAIR`, 0-44: `POOR`
+3. `justification`: A brief explanation for your score
+4. `suggestion`: If score is below 90, provide an improved caption. If 90+, confirm it's excellent.
+
+Example:
+```json
+{{
+  "alignmentScore": 75,
+  "alignmentLevel": "GOOD",
+  "justification": "Caption matches video content with relevant keywords but could be more specific",
+  "suggestion": "Consider adding more specific details about the video content"
+}}
+```
+"""
+
 
 class EnhancedGoogleGenerativeService:
     """Enhanced Google Generative AI Service for video analysis, safety checks, and content tagging"""
@@ -39,21 +322,25 @@ class EnhancedGoogleGenerativeService:
         self.model_name = settings.GEMINI_MODEL
         self.timeout = settings.GEMINI_TIMEOUT
 
+        # One model instance is shared by every analysis call
+        self.model = genai.GenerativeModel(model_name=self.model_name)
+
         # Initialize Slack client
         self.slack_token = settings.SLACK_BOT_TOKEN
         if not self.slack_token:
             raise ValueError("SLACK_BOT_TOKEN environment variable is not set")
 
-        self.slack_client = WebClient(token=self.slack_token)
+        # Async client: notifications do not block the event loop
+        self.slack_client = AsyncWebClient(token=self.slack_token)
         self.slack_channels = settings.get_slack_channels()
 
         logging.info("Enhanced Google Generative AI Service initialized successfully")
 
-    def get_health_status(self) -> Dict[str, Any]:
+    async def get_health_status(self) -> Dict[str, Any]:
         """Get health status of the AI service"""
         try:
             # Test Gemini connection
-            genai.list_models()
+            await asyncio.to_thread(genai.list_models)
             gemini_status = "healthy"
         except Exception as e:
             logging.error(f"Gemini AI health check failed: {e}")
@@ -61,7 +348,7 @@ class EnhancedGoogleGenerativeService:
 
         try:
             # Test Slack connection
-            self.slack_client.auth_test()
+            await self.slack_client.auth_test()
             slack_status = "healthy"
         except Exception as e:
             logging.error(f"Slack health check failed: {e}")
@@ -88,36 +375,38 @@ class EnhancedGoogleGenerativeService:
             Dict containing safety_check, tags, aiContext, and video_info
         """
         try:
-            job_id = circo_post.get("jobId", "unknown")
-
-            # Upload video to Gemini
-            video_file = genai.upload_file(video_path)
+            video_file = await self._upload_video(video_path)
+        except Exception as e:
+            logging.error(f"Error in Gemini safety and tag analysis: {e}")
+            return self._safety_error_result(circo_post, e)
 
-            # Wait for processing
-            while video_file.state.name == "PROCESSING":
-                await asyncio.sleep(10)
-                video_file = genai.get_file(video_file.name)
+        return await self._analyze_uploaded_video(video_file, circo_post)
 
-            if video_file.state.name == "FAILED":
-                raise ValueError("Gemini video processing failed")
+    async def _analyze_uploaded_video(
+        self, video_file, circo_post: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Safety and tag analysis of a video already uploaded to Gemini"""
+        try:
+            job_id = circo_post.get("jobId", "unknown")
 
             # Combined safety and tagging prompt
             prompt = self.get_combined_safety_tagging_prompt()
 
-            model = genai.GenerativeModel(model_name=self.model_name)
-            response = model.generate_content(
-                [video_file, prompt], request_options={"timeout": self.timeout}
+            response = await asyncio.to_thread(
+                self.model.generate_content,
+                [video_file, prompt],
+                request_options={"timeout": self.timeout},
             )
 
             if not response or not response.text:
                 raise ValueError("No response from Gemini AI")
 
-            print(response.text)  # Debugging line to see the response
+            logging.debug(f"Gemini safety response: {response.text}")
 
             # Parse JSON response
             try:
                 analysis_result = (
-                    await EnhancedGoogleGenerativeService.extract_json_from_response(
+                    EnhancedGoogleGenerativeService.extract_json_from_response(
                         response.text
                     )
                 )
@@ -137,25 +426,7 @@ class EnhancedGoogleGenerativeService:
                     ),
                 }
 
-            # Ensure proper structure and add metadata
-            result = {
-                "jobId": job_id,
-                "safety_check": analysis_result.get(
-                    "safety_check",
-                    {
-                        "contentFlag": "BLOCK_VIOLATION",
-                        "reason": "Unknown safety status",
-                    },
-                ),
-                "tags": analysis_result.get("tags", []),
-                "aiContext": analysis_result.get("aiContext", "No context available"),
-                "video_info": self._extract_video_info(circo_post),
-                "analysis_metadata": {
-                    "model": self.model_name,
-                    "timestamp": int(time.time()),
-                    "processing_time": None,  # Can be calculated by caller
-                },
-            }
+            result = self._build_safety_result(job_id, analysis_result, circo_post)
 
             logging.info(
                 f"Successfully analyzed video safety and tags for job {job_id}"
@@ -164,53 +435,224 @@ class EnhancedGoogleGenerativeService:
 
         except Exception as e:
             logging.error(f"Error in Gemini safety and tag analysis: {e}")
-            return {
-                "jobId": circo_post.get("jobId", "unknown"),
-                "safety_check": {
+            return self._safety_error_result(circo_post, e)
+
+    async def analyze_video_safety_and_tags_batch(
+        self, items: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several videos for safety and tags with one Gemini call per batch
+
+        Videos are uploaded concurrently, then up to VIDEO_BATCH_SIZE of them
+        share a single generate_content request (one round-trip, and the
+        combined prompt is sent once). Videos the batch response does not
+        cover are analyzed individually.
+
+        Args:
+            items: (processed video path, CircoPost) pairs
+
+        Returns:
+            One result per item, in order, shaped like analyze_video_safety_and_tags
+        """
+        results = []
+        for start in range(0, len(items), VIDEO_BATCH_SIZE):
+            results.extend(
+                await self._analyze_safety_batch(items[start:start + VIDEO_BATCH_SIZE])
+            )
+        return results
+
+    async def _analyze_safety_batch(
+        self, items: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Analyze one batch of videos (see analyze_video_safety_and_tags_batch)"""
+        if len(items) == 1:
+            return [await self.analyze_video_safety_and_tags(*items[0])]
+
+        # jobIds are compared as strings: the model echoes them back as text
+        job_ids = [str(circo_post.get("jobId", "unknown")) for _, circo_post in items]
+
+        # A failed upload only fails its own video
+        video_files = await asyncio.gather(
+            *(self._upload_video(video_path) for video_path, _ in items),
+            return_exceptions=True,
+        )
+        uploaded = [
+            (job_id, video_file)
+            for job_id, video_file in zip(job_ids, video_files)
+            if not isinstance(video_file, BaseException)
+        ]
+
+        analyses = {}
+        if uploaded:
+            try:
+                # Each video is labelled with its jobId so the answers can be matched up
+                contents = []
+                for job_id, video_file in uploaded:
+                    contents.extend([f"Video jobId={job_id}:", video_file])
+                contents.append(
+                    self.get_combined_safety_tagging_prompt()
+                    + BATCH_PROMPT_SUFFIX.format(count=len(uploaded))
+                )
+
+                response = await asyncio.to_thread(
+                    self.model.generate_content,
+                    contents,
+                    request_options={"timeout": self.timeout},
+                )
+
+                if not response or not response.text:
+                    raise ValueError("No response from Gemini AI")
+
+                batch_result = EnhancedGoogleGenerativeService.extract_json_from_response(
+                    response.text
+                )
+                analyses = {
+                    str(analysis.get("jobId")): analysis
+                    for analysis in batch_result.get("results", [])
+                    if isinstance(analysis, dict)
+                }
+            except Exception as e:
+                logging.error(f"Batch Gemini safety analysis failed: {e}")
+
+        async def resolve(job_id, video_file, circo_post):
+            if isinstance(video_file, BaseException):
+                logging.error(f"Error uploading video for job {job_id}: {video_file}")
+                return self._safety_error_result(circo_post, video_file)
+
+            analysis = analyses.get(job_id)
+            if analysis is None:
+                # The upload is reused, only the analysis is repeated
+                logging.warning(f"Job {job_id} missing from batch response, analyzing alone")
+                return await self._analyze_uploaded_video(video_file, circo_post)
+            return self._build_safety_result(circo_post.get("jobId", "unknown"), analysis, circo_post)
+
+        # Fallbacks run concurrently, so a failed batch call costs one more
+        # round of Gemini calls rather than one per video in turn
+        results = list(await asyncio.gather(*(
+            resolve(job_id, video_file, circo_post)
+            for job_id, video_file, (_, circo_post) in zip(job_ids, video_files, items)
+        )))
+
+        logging.info(f"Analyzed video safety and tags for a batch of {len(items)} jobs")
+        return results
+
+    async def _upload_video(self, video_path: str):
+        """
+        Upload a video to Gemini and wait until it is processed
+
+        Args:
+            video_path: Path to the processed video file
+
+        Returns:
+            The processed Gemini file
+        """
+        # Upload video to Gemini (blocking SDK calls run off the event loop)
+        video_file = await asyncio.to_thread(
+            _call_with_retry, genai.upload_file, video_path
+        )
+
+        # Wait for processing (bounded by the Gemini timeout)
+        video_file = await asyncio.wait_for(
+            self._wait_until_processed(video_file), timeout=self.timeout
+        )
+
+        if video_file.state.name == "FAILED":
+            raise ValueError("Gemini video processing failed")
+
+        return video_file
+
+    def _build_safety_result(
+        self, job_id: str, analysis_result: Dict[str, Any], circo_post: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Ensure proper structure of a safety analysis and add metadata"""
+        return {
+            "jobId": job_id,
+            "safety_check": analysis_result.get(
+                "safety_check",
+                {
                     "contentFlag": "BLOCK_VIOLATION",
-                    "reason": f"Analysis failed: {str(e)}",
+                    "reason": "Unknown safety status",
                 },
-                "tags": [],
-                "aiContext": f"Analysis error: {str(e)}",
-                "video_info": self._extract_video_info(circo_post),
-                "analysis_metadata": {
-                    "model": self.model_name,
-                    "timestamp": int(time.time()),
-                    "error": str(e),
-                },
-            }
+            ),
+            "tags": analysis_result.get("tags", []),
+            "aiContext": analysis_result.get("aiContext", "No context available"),
+            "video_info": self._extract_video_info(circo_post),
+            "analysis_metadata": {
+                "model": self.model_name,
+                "timestamp": int(time.time()),
+                "processing_time": None,  # Can be calculated by caller
+            },
+        }
+
+    def _safety_error_result(self, circo_post: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Blocking result for a failed safety analysis"""
+        return {
+            "jobId": circo_post.get("jobId", "unknown"),
+            "safety_check": {
+                "contentFlag": "BLOCK_VIOLATION",
+                "reason": f"Analysis failed: {str(error)}",
+            },
+            "tags": [],
+            "aiContext": f"Analysis error: {str(error)}",
+            "video_info": self._extract_video_info(circo_post),
+            "analysis_metadata": {
+                "model": self.model_name,
+                "timestamp": int(time.time()),
+                "error": str(error),
+            },
+        }
+
+    async def _wait_until_processed(self, video_file):
+        """
+        Poll an uploaded file until Gemini has finished processing it
+
+        The delay starts at 1s and grows 1.5x up to 15s, so short videos are
+        picked up quickly and long ones are not polled needlessly often.
+
+        Args:
+            video_file: File returned by genai.upload_file
+
+        Returns:
+            The file in its final state
+        """
+        delay = 1.0
+        while video_file.state.name == "PROCESSING":
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 15.0)
+            video_file = await asyncio.to_thread(
+                _call_with_retry, genai.get_file, video_file.name
+            )
+        return video_file
 
     @staticmethod
-    async def extract_json_from_response(response_text: str) -> dict:
+    def extract_json_from_response(response_text: str) -> dict:
         """
         Extract JSON from Gemini response that may be wrapped in markdown code blocks
         """
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+        # handlers below (and the callers') catch both
         try:
             # First, try to parse as direct JSON
-            return json.loads(response_text)
+            return orjson.loads(response_text)
         except json.JSONDecodeError:
             pass
 
         # Try to extract JSON from markdown code blocks
         # Pattern 1: ```json ... ```
-        json_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        match = re.search(json_pattern, response_text, re.DOTALL | re.IGNORECASE)
+        match = JSON_FENCE_RE.search(response_text)
 
         if match:
             try:
                 json_content = match.group(1)
                 if json_content:  # Fix: Check if match group is not None
-                    return json.loads(json_content)
+                    return orjson.loads(json_content)
             except json.JSONDecodeError:
                 pass
 
         # Pattern 2: Look for any JSON-like structure
-        json_pattern = r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}"
-        matches = re.findall(json_pattern, response_text, re.DOTALL)
-
-        for match_str in matches:
+        for match_str in _find_json_objects(response_text):
             try:
-                return json.loads(match_str)
+                return orjson.loads(match_str)
             except json.JSONDecodeError:
                 continue
 
@@ -257,18 +699,64 @@ class EnhancedGoogleGenerativeService:
                     },
                 }
 
+            if _alignment_cache is None:
+                return await self._analyze_description_alignment(user_caption, ai_context)
+
+            cache_key = _alignment_cache_key(self.model_name, user_caption, ai_context)
+            lock = _alignment_locks.get(cache_key)
+            if lock is None:
+                lock = _alignment_locks[cache_key] = asyncio.Lock()
+
+            async with lock:
+                cached = _alignment_cache.get(cache_key)
+                if cached is not None:
+                    logging.info("Description alignment cache hit")
+                    result = dict(cached)
+                    result["analysis_metadata"] = {
+                        **cached["analysis_metadata"],
+                        "timestamp": int(time.time()),
+                        "cached": True,
+                    }
+                    return result
+
+                result = await self._analyze_description_alignment(user_caption, ai_context)
+                # Fallback, error and unparseable results are not worth repeating
+                if "alignmentScore" in result and "error" not in result["analysis_metadata"]:
+                    _alignment_cache[cache_key] = dict(result)
+                return result
+
+        except Exception as e:
+            logging.error(f"Error in description alignment analysis: {e}")
+            return {
+                "alignmentScore": 0,
+                "alignmentLevel": "POOR",
+                "justification": f"Analysis failed: {str(e)}",
+                "suggestion": "Please review the caption manually",
+                "analysis_metadata": {
+                    "model": self.model_name,
+                    "timestamp": int(time.time()),
+                    "error": str(e),
+                },
+            }
+
+    async def _analyze_description_alignment(
+        self, user_caption: str, ai_context: str
+    ) -> Dict[str, Any]:
+        """Ask Gemini for the caption/aiContext alignment (uncached)"""
+        try:
             # Description alignment prompt
             prompt = self.get_description_alignment_prompt(user_caption, ai_context)
 
-            model = genai.GenerativeModel(model_name=self.model_name)
-            response = model.generate_content(prompt, request_options={"timeout": 300})
+            response = await asyncio.to_thread(
+                self.model.generate_content, prompt, request_options={"timeout": 300}
+            )
 
             if not response or not response.text:
                 raise ValueError("No response from Gemini AI")
 
             try:
                 alignment_result = (
-                    await EnhancedGoogleGenerativeService.extract_json_from_response(
+                    EnhancedGoogleGenerativeService.extract_json_from_response(
                         response.text
                     )
                 )
@@ -318,132 +806,15 @@ class EnhancedGoogleGenerativeService:
 
     def get_combined_safety_tagging_prompt(self) -> str:
         """Get the combined safety check and tagging prompt"""
-        return """
-You are an expert video content analyst and a content policy moderator for the platform Circo. Your task is to analyze the provided video, enforce the content policy, and classify the content according to the 'Circo Interest Categories & Subcategories' list. You must adhere strictly to all rules and the required output format.
-
-Part 1: Content Policy Enforcement
-First, you must evaluate the video against Circo's Content Policy and assign a `contentFlag`. This is your most important task.
-
-* `contentFlag: "SAFE"`
-    Assign this flag if the video contains no mature or policy-violating material. This is the default for most content.
-
-* `contentFlag: "RESTRICT_18+"`
-    Assign this flag for content that is allowed on the platform but is considered mature and should be age-gated (18+) and de-amplified from the main "For You" page. This includes:
-    - Sex Education: Factual, educational content about sexual health, consent, and safe sex practices.
-    - Artistic & Sensual Expression: Content like professional pole dancing, sensual dance, or non-graphic artistic representations of the human body focused on expression and body positivity.
-    - NSFW Humor: Comedic skits, jokes, or commentary with mature themes that are not graphically explicit.
-    - Mature Discussions: Conversational or educational content about relationships, intimacy, kink, or fetishes that is not visually explicit.
-
-* `contentFlag: "BLOCK_VIOLATION"`
-    Assign this flag for content that is strictly forbidden and must be blocked. This includes:
-    - Pornography: Any depiction of sexually explicit acts.
-    - Non-Consensual Content: Any content depicting sexual acts without clear consent.
-    - Hate Speech & Harassment: Content that attacks or demeans individuals or groups.
-    - Graphic Violence or Gore: Extreme, graphic depictions of violence or injury.
-    - Dangerous Acts: Content promoting self-harm or dangerous challenges.
-    - Child Exploitative Content: Any content that could exploit or harm minors.
-
-Part 2: Interest & Subcategory Tagging
-If the content is SAFE or RESTRICT_18+, classify it according to these Circo Interest Categories:
-
-1. Entertainment & Gossip: Celebrity News, Reality TV, Viral Moments, Breakups & Hookups, Red Carpet, Influencer Drama, Nollywood Buzz, African Royalty, Paparazzi, Awards & Events, Rumors & Leaks, Memes & Trends, Behind-the-Scenes, Social Media Fights, Baby Bumps & Babies, Throwback Moments, Housemate Highlights, Scandals, Fashion Police, Entertainment Reviews, Fan Reactions, Rich Kid Chronicles, Musician Feuds, Flashbacks, Reunions
-
-2. Music: Afrobeats, Gospel, Hip-Hop, R&B, Amapiano, Live Performances, Cover Songs, Music Reviews, Artist Freestyles, Street Music, Throwback Hits, Music Videos, Studio Sessions, Breakthrough Artists, DJ Mixes, Music Battles, Indigenous Sounds, Interviews & Behind-the-Mic, Lyrics & Meaning, Sound Engineering, TikTok Challenges, New Releases, Fan Tributes, Top Charts, Instrumentals
-
-3. Food & Cooking: Street Food, African Dishes, Quick Meals, Traditional Recipes, Food Reviews, Budget Cooking, Baking, Drinks & Cocktails, Food Challenges, Cooking Tips, Kitchen Hacks, Celebrity Chefs, Food Vlogging, Restaurant Tours, Vegan & Healthy, Jollof Wars, Food Markets, Home Cooking, Spicy Dishes, Cooking for Events, Continental Fusion, Recipe Recreation, Meals for Kids, Plating & Aesthetics, Cooking Mistakes
-
-4. Business & Money: Side Hustles, Investing Basics, Mobile Money, Forex & Crypto, Personal Finance, Entrepreneurship, African Startups, Grant Opportunities, Real Estate, Business News, Savings & Budgeting, Small Biz Tips, Market Trends, Online Selling, Youth Finance, Women in Business, Business Interviews, Risk Management, Stock Market, Passive Income, Freelancing, Digital Business, E-commerce, Money Scams, Business Fails
-
-5. Tech & Innovation: Mobile Apps, African Startups, Product Reviews, Gadgets & Unboxing, Coding Tips, Tech News, AI & Automation, EdTech, Internet & Data Tips, Developer Vlogs, Cybersecurity, Fintech, How-To Tech, Hardware Builds, Local Innovation, Space & Science, Tech Events, Smart Homes, Cloud & SaaS, Tech DIY, UI/UX, Digital Tools, Tech Comedy, Internet Culture, AR/VR & Metaverse
-
-6. Education & Self-Development: Study Hacks, Exam Prep, Career Advice, Public Speaking, Productivity Tips, Reading & Book Summaries, Financial Literacy, Skill Acquisition, Personal Branding, Time Management, Online Courses, Mindset Shift, Motivational Talks, Student Life, Academic Scholarships, Mental Clarity, Growth Mindset, Resume & Interview Tips, Soft Skills, Coding for Beginners, Personal Discipline, Language Learning, Study Abroad, Journaling, Goal Setting
-
-7. Sports & Fitness: Football Highlights, Workout Routines, Gym Motivation, Athlete Profiles, Match Analysis, Sports Gossip, African Leagues, Women in Sports, Sports Comedy, Home Workouts, Injury Prevention, Live Scores, Football Skills, Boxing & MMA, Street Sports, Esports Fitness, Fitness Challenges, Supplements & Nutrition, Fitness Myths, Daily Exercise, Youth Sports, Coaching Tips, National Teams, Bodybuilding, Fantasy Sports
-
-8. News & Opinions: Breaking News, Local Stories, Investigative Reports, Commentary, Social Issues, Global News, Community Watch, News Roundups, Panel Discussions, Youth Voices, Opinion Pieces, Interviews, Fact-Checking, Editorials, UGC Reports, Media Reactions, Diaspora Watch, Civic Education, Crime Reports, Environment, Legal & Courts, Trending Topics, Press Reviews, Activism, Satire & Parody
-
-9. Religion: Gospel Sermons, Islamic Teachings, Daily Devotionals, Prayers, Spiritual Questions, Religious Music, Bible Study, Quran Recitation, Church Highlights, Islamic Lectures, Faith & Lifestyle, Miracles & Testimonies, Interfaith Dialogue, Religious Events, Youth & Faith, Christian Comedy, Motivation from Scripture, End Time Messages, Fasting & Prayer, Prophecies, Faith Debates, Sunday Messages, Mosque Moments, Faith & Money, Marriage in Faith
-
-10. Comedy & Skits: Relationship Skits, Village Comedy, Office Banter, Slang Humor, Pranks, Stand-up Clips, Political Satire, Skits about Parents, Dating Misadventures, Campus Life, Parody Songs, Nigerian Comedy, Ghanaian Humor, Everyday Frustrations, Situationship Skits, Religious Comedy, Voiceover Comedy, Meme Reenactments, Social Media Comedy, Dance Comedy, Regional Dialects, Fashion Fails, Food Jokes, Comic Reactions, Skit Series
-
-11. Web3 & Finance: Crypto Basics, NFT Culture, Blockchain Explained, DeFi Tips, Wallet Safety, Token Reviews, Web3 News, Smart Contracts, Trading Signals, Scams to Avoid, Metaverse Trends, Web3 Startups, Yield Farming, Web3 Jobs, Decentralized Apps, DAO Governance, Gas Fees Explained, Play-to-Earn Games, Layer 2 Solutions, Real Use Cases, Airdrops & Giveaways, Digital Identity, Stablecoins, On-chain Analysis, Community Tokens
-
-12. Movie & Drama: Nollywood Reviews, Series Breakdowns, Love Stories, Suspense & Thriller, Movie Recaps, Behind the Scenes, Short Films, Classic Movies, Cinema Releases, Actor Spotlights, Comedy Drama, Youth Series, K-Drama Fandom, Soap Operas, Movie Trailers, Movie Monologues, Reenactments, Soundtrack Highlights, Subtitled Clips, Fan Theories, Celebrity Cameos, Script Reads, Film Production, Drama Challenges, Viewer Reactions
-
-13. Career & Workplace: CV Writing, Interview Prep, Work From Home, Office Politics, Career Switch, Entry-Level Advice, Job Opportunities, Workplace Humor, Productivity Tips, Corporate Culture, Professional Etiquette, Career Coaching, Remote Tools, Tech Careers, Soft Skills, Salary Negotiation, Career Stories, Intern Diaries, Women at Work, Startup Jobs, Burnout & Recovery, Performance Reviews, Freelancing Life, Job Rejections, Leadership Tips
-
-14. Communities: Student Communities, Diaspora Life, Women Groups, Tech Communities, Creators Circle, Writers' Hub, Activist Spaces, LGBTQ+ Voices, Faith Circles, Rural Voices, African Creators, Campus Tribes, Neighborhood Watch, Community Service, Fans & Fandoms, Single Parents, Youth Clubs, Fashion Tribes, Entrepreneurs Unite, Language Groups, City Spotlights, Alumni Networks, Creatives & Makers, Immigrant Life, Tribal & Ethnic Unity
-
-15. Travel and Tourism: Local Destinations, Budget Travel, Travel Vlogs, Food Tourism, Cultural Experiences, Nature & Parks, Road Trips, Historical Sites, Travel Hacks, African Wonders, Urban Adventures, Travel Safety, Beach Diaries, Border Crossings, Group Trips, Honeymoon Spots, Travel Photography, Wildlife Tours, Festivals Abroad, Backpacking, Rural Exploration, Hotel Reviews, Airport Diaries, Language Abroad, Visa Stories
-
-16. Health and Wellness: Mental Health, Fitness Goals, Healthy Eating, Women's Health, Men's Health, Stress Management, Home Remedies, Disease Awareness, Therapy & Counseling, Nutrition Tips, Weight Loss, Meditation, Health Tech, Sexual Health, Sleep Hygiene, Menstrual Health, Pregnancy & Birth, Herbal Medicine, Body Positivity, Fitness Myths, COVID & Vaccines, Daily Wellness Routines, Medical Stories, Public Health, Health Q&A
-
-17. Lifestyle & Culture: Daily Vlogs, Home Decor, Morning Routines, Night Routines, Cultural Practices, Festive Celebrations, Family Life, Shopping Vlogs, Minimalist Living, Local Languages, African Proverbs, Productivity Hacks, Meal Prepping, Sustainable Living, Cleaning Routines, DIY Crafts, Parenting Tips, Celebrating Traditions, Personal Journals, Rituals & Customs, Life Lessons, Urban Living, Digital Detox, Weekend Diaries, Life Abroad
-
-18. Art & Culture: Painting Process, Traditional Art, Dance Performances, Spoken Word, Drawing Time-lapse, Fashion Design, Art Commentary, Poetry, Sculpture, Graffiti & Street Art, Photography Vlogs, Artist Profiles, Art Challenges, Theatre Clips, Cultural Dance, Music Fusion, Animation Clips, Digital Art, Craft Tutorials, Calligraphy, Cultural Artifacts, Art Exhibitions, Fan Art, Creative Expression, Restoration Projects
-
-19. Politics: National Politics, Youth in Politics, Political Commentary, Election Updates, Law & Constitution, Government Spending, Party Analysis, Political Debates, Activism, Corruption Watch, Political History, Voter Education, Policy Review, African Union, International Politics, Protest Highlights, Legislative Summaries, Political Satire, Campaign Videos, Fact Checking, Public Office Profiles, Local Government, Women in Politics, Opinion Polls, Government Projects
-
-20. Beauty & Fashion: Makeup Tutorials, Skincare Routines, Fashion Hauls, Style Tips, Beauty Reviews, Hair Care, Fashion Trends, Outfit Ideas, Beauty Challenges, Fashion Shows, Styling Tips, Beauty Hacks, Fashion DIY, Seasonal Fashion, Beauty Product Reviews, Fashion History, Sustainable Fashion, Men's Grooming, Fashion Fails, Beauty Transformations
-
-Output Format:
-Your entire response MUST be a single, valid JSON object with these keys:
-
-```json
-{
-  "safety_check": {
-    "contentFlag": "SAFE|RESTRICT_18+|BLOCK_VIOLATION",
-    "reason": "Brief explanation for the flag assignment"
-  },
-  "tags": [
-    {
-      "category": "Category Name",
-      "subcategory": ["Subcategory1", "Subcategory2"]
-    }
-  ],
-  "aiContext": "One-sentence description of the video content and your analysis reasoning"
-}
-```
-
-CRITICAL: If contentFlag is "BLOCK_VIOLATION", set tags to an empty array and explain the violation in the reason and aiContext.
-CRITICAL OUTPUT FORMAT:
-Return ONLY a valid JSON object without any markdown formatting or code blocks.
-Do not wrap your response in ```json or ``` tags.
-"""
+        return COMBINED_SAFETY_TAGGING_PROMPT
 
     def get_description_alignment_prompt(
         self, user_caption: str, ai_context: str
     ) -> str:
         """Get the description alignment analysis prompt"""
-        return f"""
-You are an AI-powered SEO and Content Strategist. Your primary function is to analyze and score the alignment between a video's true content (represented by the `aiContext`) and the user-provided caption.
-
-Inputs:
-1. [aiContext from Video Analysis]: {ai_context}
-2. [User-Provided Video Caption]: {user_caption}
-
-Analysis Criteria:
-Evaluate the User-Provided Video Caption based on:
-1. Semantic Relevance: Does the caption's topic match the aiContext?
-2. Keyword Overlap: Do key concepts from the aiContext appear in the caption?
-3. Accuracy & Honesty: Is the caption an honest representation of the content, or is it misleading clickbait?
-
-Your entire response MUST be a single, valid JSON object with these keys:
-1. `alignmentScore`: An integer score from 0 to 100
-2. `alignmentLevel`: A string: 90-100: `EXCELLENT`, 70-89: `GOOD`, 45-69: `FAIR`, 0-44: `POOR`
-3. `justification`: A brief explanation for your score
-4. `suggestion`: If score is below 90, provide an improved caption. If 90+, confirm it's excellent.
-
-Example:
-```json
-{{
-  "alignmentScore": 75,
-  "alignmentLevel": "GOOD",
-  "justification": "Caption matches video content with relevant keywords but could be more specific",
-  "suggestion": "Consider adding more specific details about the video content"
-}}
-```
-"""
+        return DESCRIPTION_ALIGNMENT_PROMPT_TEMPLATE.format(
+            ai_context=ai_context, user_caption=user_caption
+        )
 
     async def send_safety_notification(
         self,
@@ -460,50 +831,26 @@ Example:
             safety_check = analysis_result.get("safety_check", {})
             content_flag = safety_check.get("contentFlag", "UNKNOWN")
 
-            video_name = video_info.get("name", "Unknown File")
-            video_url = video_info.get("url", "Unknown Link")
-            tags = analysis_result.get("tags", [])
-            ai_context = analysis_result.get("aiContext", "No context available")
-            job_id = analysis_result.get("jobId", "unknown")
-
-            if content_flag == "SAFE":
-                message = (
-                    f":white_check_mark: *Video Safety Check PASSED* :white_check_mark:\n"
-                    f"*Job ID:* {job_id}\n"
-                    f"*Video File:* {video_name}\n"
-                    f"*Video Link:* {video_url}\n"
-                    f"*Content Flag:* {content_flag}\n"
-                    f"*AI Context:* {ai_context}\n"
-                    f"*Generated Tags:* {self._format_tags_for_slack(tags)}"
-                )
-                await self.send_slack_message(self.slack_channels["passed"], message)
-
-            elif content_flag == "RESTRICT_18+":
-                message = (
-                    f":warning: *Video Requires 18+ Restriction* :warning:\n"
-                    f"*Job ID:* {job_id}\n"
-                    f"*Video File:* {video_name}\n"
-                    f"*Video Link:* {video_url}\n"
-                    f"*Content Flag:* {content_flag}\n"
-                    f"*Reason:* {safety_check.get('reason', 'Mature content detected')}\n"
-                    f"*AI Context:* {ai_context}\n"
-                    f"*Generated Tags:* {self._format_tags_for_slack(tags)}"
-                )
-                await self.send_slack_message(self.slack_channels["review"], message)
-
-            else:  # BLOCK_VIOLATION
-                message = (
-                    f":no_entry: *Video BLOCKED - Policy Violation* :no_entry:\n"
-                    f"*Job ID:* {job_id}\n"
-                    f"*Video File:* {video_name}\n"
-                    f"*Video Link:* {video_url}\n"
-                    f"*Content Flag:* {content_flag}\n"
-                    f"*Violation Reason:* {safety_check.get('reason', 'Policy violation detected')}\n"
-                    f"*AI Context:* {ai_context}\n"
-                    f"*Action Required:* Manual review and potential content removal\n"
-                    f"*Timestamp:* {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())}"
-                )
-                await self.send_slack_message(self.slack_channels["review"], message)
+            # Unknown flags are reported like BLOCK_VIOLATION
+            channel_key, default_reason, template = SAFETY_NOTIFICATION_TEMPLATES.get(
+                content_flag, SAFETY_NOTIFICATION_TEMPLATES["BLOCK_VIOLATION"]
+            )
+
+            message = template.format(
+                job_id=analysis_result.get("jobId", "unknown"),
+                video_name=video_info.get("name", "Unknown File"),
+                video_url=video_info.get("url", "Unknown Link"),
+                content_flag=content_flag,
+                reason=safety_check.get("reason", default_reason),
+                ai_context=analysis_result.get("aiContext", "No context available"),
+                tags=(
+                    self._format_tags_for_slack(analysis_result.get("tags", []))
+                    if "{tags}" in template
+                    else ""
+                ),
+                timestamp=time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+            )
+            await self.send_slack_message(self.slack_channels[channel_key], message)
 
         except Exception as e:
             logging.error(f"Error sending Slack notification: {e}")
@@ -511,7 +858,7 @@ Example:
     async def send_slack_message(self, channel: str, text: str):
         """Send message to Slack channel"""
         try:
-            response = self.slack_client.chat_postMessage(channel=channel, text=text)
+            response = await self.slack_client.chat_postMessage(channel=channel, text=text)
             logging.info(f"Slack message sent to {channel}")
             return response
         except SlackApiError as e:
@@ -559,8 +906,9 @@ Example:
     async def test_ai_connection(self) -> Dict[str, Any]:
         """Test the AI service connection and capabilities"""
         try:
-            # Test model listing
-            models = genai.list_models()
+            # Test model listing (list_models pages lazily, so it is also
+            # iterated off the event loop)
+            models = await asyncio.to_thread(lambda: list(genai.list_models()))
             available_models = [
                 model.name
                 for model in models
@@ -568,8 +916,8 @@ Example:
             ]
 
             # Test a simple content generation
-            model = genai.GenerativeModel(model_name=self.model_name)
-            test_response = model.generate_content(
+            test_response = await asyncio.to_thread(
+                self.model.generate_content,
                 "Respond with exactly: 'AI service test successful'",
                 request_options={"timeout": 30},
             )
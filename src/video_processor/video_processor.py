@@ -66,9 +66,9 @@ class EnhancedVideoProcessor:
 
         logging.info("Enhanced Video Processor initialized successfully")
 
-    def get_health_status(self) -> Dict[str, Any]:
+    async def get_health_status(self) -> Dict[str, Any]:
         """Get health status of the video processor"""
-        ai_health = self.ai_service.get_health_status()
+        ai_health = await self.ai_service.get_health_status()
 
         return {
             "video_analyzer": "healthy" if self.video_analyzer else "unhealthy",
@@ -348,20 +348,21 @@ class EnhancedVideoProcessor:
                     "description_analysis": {"error": "No video URL found"},
                 }
 
-            # Quality Analysis
-            quality_result = await self.analyze_video_quality(video_url)
-
             # Description Analysis - use AI context from Stage 1
             user_title = circo_post.get("secondaryCaption", "")
             user_caption = circo_post.get("primaryCaption", "")
             total_description = f"{user_title}\n{user_caption}".strip()
             if ai_context:
-                description_result = (
-                    await self.ai_service.analyze_description_alignment(
+                # Quality probe and Gemini alignment call are independent, so
+                # they run concurrently
+                quality_result, description_result = await asyncio.gather(
+                    self.analyze_video_quality(video_url),
+                    self.ai_service.analyze_description_alignment(
                         total_description, ai_context
-                    )
+                    ),
                 )
             else:
+                quality_result = await self.analyze_video_quality(video_url)
                 logging.warning("No AI context provided for description analysis")
                 description_result = {
                     "alignmentScore": 0,
@@ -397,7 +398,10 @@ class EnhancedVideoProcessor:
         """
         try:
             # Get detailed video information using the analyzer
-            detailed_info = self.video_analyzer.get_detailed_info(video_url)
+            # (blocking probe - run off the event loop)
+            detailed_info = await asyncio.to_thread(
+                self.video_analyzer.get_detailed_info, video_url
+            )
 
             if not detailed_info:
                 return {
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from src.audio_processor.audio_transcription_processor import parse_gemini_json
+
+
+class TestParseGeminiJson:
+    """Test suite for parsing Gemini transcription responses"""
+
+    def test_plain_json(self):
+        """A bare JSON body is parsed as-is (surrounding whitespace ignored)"""
+        assert parse_gemini_json('\n  {"transcription": "Hello", "language": "en"}  \n') == {
+            "transcription": "Hello",
+            "language": "en",
+        }
+
+    def test_json_code_fence(self):
+        """A ```json fence and the prose around it are stripped"""
+        response = 'Here is the transcript:\n```json\n{"transcription": "Hi", "speakers": []}\n```\nDone.'
+        assert parse_gemini_json(response) == {"transcription": "Hi", "speakers": []}
+
+    def test_unlabelled_code_fence(self):
+        """A fence without a language tag is stripped too"""
+        assert parse_gemini_json('```\n{"transcription": "Hi"}\n```') == {"transcription": "Hi"}
+
+    def test_nested_braces_inside_fence(self):
+        """The whole fenced object is kept, including nested objects"""
+        response = '```json\n{"timestamps": [{"time": "00:01", "text": "{laughs}"}]}\n```'
+        assert parse_gemini_json(response) == {
+            "timestamps": [{"time": "00:01", "text": "{laughs}"}]
+        }
+
+    @pytest.mark.parametrize(
+        "response",
+        ["Sorry, I could not transcribe this audio.", '```json\n{"transcription": \n```', ""],
+    )
+    def test_invalid_json_raises(self, response):
+        """Responses without valid JSON raise json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_gemini_json(response)
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from src.services.job_store import JobStore
+
+
+class TestJobStoreEviction:
+    """Test suite for the in-memory job store's LRU and TTL eviction"""
+
+    @pytest.mark.asyncio
+    async def test_overflow_evicts_least_recently_used_finished_job(self):
+        """Going over capacity drops the finished job touched longest ago"""
+        store = JobStore(max_jobs=2)
+        await store.create("a", {"status": "completed"})
+        await store.create("b", {"status": "completed"})
+
+        # Reading "a" makes "b" the least recently used
+        await store.get("a")
+        await store.create("c", {"status": "queued"})
+
+        assert await store.get("b") is None
+        assert await store.get("a") is not None
+        assert await store.get("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_overflow_keeps_unfinished_jobs(self):
+        """Queued and processing jobs are never evicted, even over capacity"""
+        store = JobStore(max_jobs=1)
+        await store.create("a", {"status": "processing"})
+        await store.create("b", {"status": "queued"})
+
+        assert await store.count() == 2
+
+        await store.update("a", status="failed")
+        await store.create("c", {"status": "queued"})
+
+        assert await store.get("a") is None
+        assert await store.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_sweep_drops_expired_finished_jobs(self):
+        """sweep() removes finished jobs older than the TTL only"""
+        store = JobStore(ttl_seconds=60)
+        old = time.time() - 120
+        await store.create("old-done", {"status": "completed", "created_at": old})
+        await store.create("old-failed", {"status": "failed", "created_at": old})
+        await store.create("old-running", {"status": "processing", "created_at": old})
+        await store.create("new-done", {"status": "completed", "created_at": time.time()})
+
+        assert await store.sweep() == 2
+        assert set(await store.list_jobs()) == {"old-running", "new-done"}
+
+    @pytest.mark.asyncio
+    async def test_on_drop_runs_for_swept_and_evicted_jobs(self):
+        """Every job removed by sweep() or eviction is reported to on_drop"""
+        dropped = []
+        store = JobStore(max_jobs=3, ttl_seconds=60, on_drop=dropped.append)
+        await store.create("expired", {"status": "completed", "created_at": time.time() - 120})
+        await store.create("evicted", {"status": "failed", "created_at": time.time()})
+        await store.create("running", {"status": "processing", "created_at": time.time()})
+
+        await store.sweep()
+        assert dropped == ["expired"]
+
+        await store.create("queued-1", {"status": "queued", "created_at": time.time()})
+        await store.create("queued-2", {"status": "queued", "created_at": time.time()})
+        assert dropped == ["expired", "evicted"]
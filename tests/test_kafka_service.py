@@ -0,0 +1,105 @@
+from unittest.mock import Mock
+
+from src.services.kafka_service import KafkaService, PartitionOffsetTracker
+
+
+class FakeConsumer:
+    """Records stored and committed offsets instead of talking to Kafka"""
+
+    def __init__(self):
+        self.stored = []
+        self.commits = 0
+
+    def store_offsets(self, offsets):
+        self.stored.extend((tp.topic, tp.partition, tp.offset) for tp in offsets)
+
+    def commit(self, asynchronous=True):
+        self.commits += 1
+
+
+def make_msg(offset, partition=0, topic="input"):
+    msg = Mock()
+    msg.topic.return_value = topic
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    return msg
+
+
+def make_partition(partition=0, topic="input"):
+    tp = Mock()
+    tp.topic = topic
+    tp.partition = partition
+    return tp
+
+
+class TestPartitionOffsetTracker:
+    """Test suite for contiguous offset storing with out-of-order handlers"""
+
+    def test_out_of_order_completion_stores_contiguous_prefix(self):
+        """Nothing is stored past a message that is still being handled"""
+        consumer = FakeConsumer()
+        tracker = PartitionOffsetTracker(consumer)
+        msgs = [make_msg(offset) for offset in (10, 11, 12)]
+        for msg in msgs:
+            tracker.track(msg)
+
+        assert tracker.complete(msgs[2]) == 0
+        assert tracker.complete(msgs[1]) == 0
+        assert consumer.stored == []
+        assert tracker.pending_count(msgs[0]) == 3
+
+        # The head finishing releases everything behind it in one store
+        assert tracker.complete(msgs[0]) == 3
+        assert consumer.stored == [("input", 0, 13)]
+        assert tracker.pending_count(msgs[0]) == 0
+
+    def test_unfinished_message_holds_back_only_its_partition(self):
+        """A message that has not completed blocks its own partition alone"""
+        consumer = FakeConsumer()
+        tracker = PartitionOffsetTracker(consumer)
+        failing, after = make_msg(5), make_msg(6)
+        other = make_msg(40, partition=1)
+        for msg in (failing, after, other):
+            tracker.track(msg)
+
+        tracker.complete(after)
+        tracker.complete(other)
+        assert consumer.stored == [("input", 1, 41)]
+
+        # Once the failing message is given up on (dead-lettered) and
+        # completed, its partition moves on
+        tracker.complete(failing)
+        assert consumer.stored[-1] == ("input", 0, 7)
+
+    def test_revoke_forgets_partition(self):
+        """Completions for a revoked partition are ignored"""
+        consumer = FakeConsumer()
+        tracker = PartitionOffsetTracker(consumer)
+        msg = make_msg(3)
+        tracker.track(msg)
+
+        tracker.revoke([make_partition(0)])
+
+        assert tracker.pending_count(msg) == 0
+        assert tracker.complete(msg) == 0
+        assert consumer.stored == []
+
+    def test_on_revoke_commits_stored_offsets(self):
+        """Handled work is committed before the partitions move away"""
+        consumer = FakeConsumer()
+        service = KafkaService.__new__(KafkaService)
+        service._offsets = PartitionOffsetTracker(consumer)
+        service._uncommitted = 0
+        service._last_commit = 0.0
+
+        done, running = make_msg(1), make_msg(2)
+        service._offsets.track(done)
+        service._offsets.track(running)
+        service._store_offset(done)
+        assert service._uncommitted == 1
+
+        service._on_revoke(consumer, [make_partition(0)])
+
+        assert consumer.commits == 1
+        assert service._uncommitted == 0
+        assert service._offsets.pending_count(running) == 0
@@ -4,7 +4,10 @@ import json
 import logging
 from unittest.mock import Mock, patch, AsyncMock
 from src.video_processor.video_processor import EnhancedVideoProcessor
-from src.video_processor.google_generative_ai import EnhancedGoogleGenerativeService
+from src.video_processor.google_generative_ai import (
+    EnhancedGoogleGenerativeService,
+    _find_json_objects,
+)
 from src.config.settings import settings
 from dotenv import load_dotenv
 
@@ -369,11 +372,12 @@ class TestEnhancedVideoProcessor:
             assert result["alignmentScore"] == 85
             assert result["alignmentLevel"] == "GOOD"
 
-    def test_get_health_status(self, processor):
+    @pytest.mark.asyncio
+    async def test_get_health_status(self, processor):
         """Test health status check for video processor"""
         with patch("google.generativeai.list_models"):
             with patch.object(processor.ai_service.slack_client, "auth_test"):
-                status = processor.get_health_status()
+                status = await processor.get_health_status()
 
                 assert "video_analyzer" in status
                 assert "ai_service" in status
@@ -399,7 +403,7 @@ class TestEnhancedGoogleGenerativeService:
     async def test_analyze_video_safety_and_tags(self, ai_service):
         """Test video safety and tagging analysis"""
         with patch("google.generativeai.upload_file") as mock_upload:
-            with patch("google.generativeai.GenerativeModel") as mock_model:
+            with patch.object(ai_service, "model") as mock_model_instance:
                 # Setup mocks
                 mock_file = Mock()
                 mock_file.state.name = "ACTIVE"
@@ -422,9 +426,7 @@ class TestEnhancedGoogleGenerativeService:
                     }
                 )
 
-                mock_model_instance = Mock()
                 mock_model_instance.generate_content.return_value = mock_response
-                mock_model.return_value = mock_model_instance
 
                 result = await ai_service.analyze_video_safety_and_tags(
                     "/tmp/test.mp4", COMEDY_CIRCO_POST
@@ -438,7 +440,7 @@ class TestEnhancedGoogleGenerativeService:
     @pytest.mark.asyncio
     async def test_analyze_description_alignment(self, ai_service):
         """Test description alignment analysis"""
-        with patch("google.generativeai.GenerativeModel") as mock_model:
+        with patch.object(ai_service, "model") as mock_model_instance:
             mock_response = Mock()
             mock_response.text = json.dumps(
                 {
@@ -449,9 +451,7 @@ class TestEnhancedGoogleGenerativeService:
                 }
             )
 
-            mock_model_instance = Mock()
             mock_model_instance.generate_content.return_value = mock_response
-            mock_model.return_value = mock_model_instance
 
             result = await ai_service.analyze_description_alignment(
                 "This had me rolling 😂😂 African parents be like...",
@@ -491,11 +491,12 @@ class TestEnhancedGoogleGenerativeService:
             assert "testing_passed" in args[0]  # Channel name
             assert "Video Safety Check PASSED" in args[0][1]  # Message content
 
-    def test_ai_service_health_status(self, ai_service):
+    @pytest.mark.asyncio
+    async def test_ai_service_health_status(self, ai_service):
         """Test AI service health status"""
         with patch("google.generativeai.list_models"):
             with patch.object(ai_service.slack_client, "auth_test"):
-                status = ai_service.get_health_status()
+                status = await ai_service.get_health_status()
 
                 assert "gemini_ai" in status
                 assert "slack_integration" in status
@@ -864,6 +865,219 @@ class TestEnhancedGoogleGenerativeService:
             assert "testing_passed" in args[0]  # Channel name
             assert "Video Safety Check PASSED" in args[0][1]  # Message content
 
+    @pytest.mark.asyncio
+    async def test_safety_batch_matches_job_ids_and_falls_back(self, ai_service):
+        """Batch answers are matched by jobId as strings; missing ones are analyzed alone"""
+        numeric_post = {**COMEDY_CIRCO_POST, "jobId": 101}
+        other_post = {**MUSIC_DANCE_CIRCO_POST, "jobId": "job-b"}
+        uploaded = [Mock(name="video-101"), Mock(name="video-b")]
+
+        batch_response = Mock()
+        batch_response.text = json.dumps({
+            "results": [{
+                "jobId": "101",
+                "safety_check": {"contentFlag": "SAFE", "reason": ""},
+                "tags": [{"category": "Comedy & Skits", "subcategory": []}],
+                "aiContext": "Batch context",
+            }]
+        })
+        single_response = Mock()
+        single_response.text = json.dumps({
+            "safety_check": {"contentFlag": "RESTRICT_18+", "reason": "Mature"},
+            "tags": [],
+            "aiContext": "Single context",
+        })
+
+        with patch.object(
+            ai_service, "_upload_video", new_callable=AsyncMock, side_effect=uploaded
+        ) as mock_upload, patch.object(ai_service, "model") as mock_model:
+            mock_model.generate_content.side_effect = [batch_response, single_response]
+
+            results = await ai_service.analyze_video_safety_and_tags_batch(
+                [("/tmp/a.mp4", numeric_post), ("/tmp/b.mp4", other_post)]
+            )
+
+        assert [r["jobId"] for r in results] == [101, "job-b"]
+        assert results[0]["aiContext"] == "Batch context"
+        assert results[1]["safety_check"]["contentFlag"] == "RESTRICT_18+"
+
+        # Each video is uploaded once; the fallback reuses the upload
+        assert mock_upload.await_count == 2
+        fallback_contents = mock_model.generate_content.call_args_list[1][0][0]
+        assert fallback_contents[0] is uploaded[1]
+
+    @pytest.mark.asyncio
+    async def test_safety_batch_failure_analyzes_each_video(self, ai_service):
+        """A failed batch call falls back to one analysis per uploaded video"""
+        posts = [{**COMEDY_CIRCO_POST, "jobId": f"job-{i}"} for i in range(3)]
+        single_response = Mock()
+        single_response.text = json.dumps({
+            "safety_check": {"contentFlag": "SAFE", "reason": ""},
+            "tags": [],
+            "aiContext": "Single context",
+        })
+
+        with patch.object(
+            ai_service, "_upload_video", new_callable=AsyncMock, return_value=Mock()
+        ), patch.object(ai_service, "model") as mock_model:
+            mock_model.generate_content.side_effect = [
+                RuntimeError("batch failed"), single_response, single_response, single_response
+            ]
+
+            results = await ai_service.analyze_video_safety_and_tags_batch(
+                [(f"/tmp/{i}.mp4", post) for i, post in enumerate(posts)]
+            )
+
+        assert [r["jobId"] for r in results] == ["job-0", "job-1", "job-2"]
+        assert all(r["safety_check"]["contentFlag"] == "SAFE" for r in results)
+        assert mock_model.generate_content.call_count == 4
+
+    async def _render_notification(self, ai_service, safety_check):
+        """Send a notification for safety_check and return (channel, text)"""
+        analysis_result = {
+            "jobId": "test-job-123",
+            "safety_check": safety_check,
+            "tags": [{"category": "Comedy & Skits", "subcategory": ["Family Comedy"]}],
+            "aiContext": "Comedy skit about African parenting styles",
+        }
+        video_info = {"name": "clip.mp4", "url": REAL_VIDEO_URLS[1]}
+
+        # Settings are frozen, so the module's reference is swapped instead
+        with patch(
+            "src.video_processor.google_generative_ai.settings",
+            Mock(ENABLE_SLACK_NOTIFICATIONS=True),
+        ), patch(
+            "src.video_processor.google_generative_ai.time.strftime",
+            return_value="2025-01-01 00:00:00",
+        ), patch.object(ai_service, "send_slack_message", new_callable=AsyncMock) as mock_slack:
+            await ai_service.send_safety_notification(
+                analysis_result, video_info, COMEDY_CIRCO_POST
+            )
+
+        mock_slack.assert_awaited_once()
+        return mock_slack.call_args[0]
+
+    def _expected_header(self, content_flag):
+        return (
+            "*Job ID:* test-job-123\n"
+            "*Video File:* clip.mp4\n"
+            f"*Video Link:* {REAL_VIDEO_URLS[1]}\n"
+            f"*Content Flag:* {content_flag}\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_slack_notification_safe_message(self, ai_service):
+        """SAFE notifications render exactly as before the template table"""
+        channel, text = await self._render_notification(
+            ai_service, {"contentFlag": "SAFE", "reason": "Content is safe"}
+        )
+        tags = ai_service._format_tags_for_slack(
+            [{"category": "Comedy & Skits", "subcategory": ["Family Comedy"]}]
+        )
+
+        assert channel == ai_service.slack_channels["passed"]
+        assert text == (
+            ":white_check_mark: *Video Safety Check PASSED* :white_check_mark:\n"
+            + self._expected_header("SAFE")
+            + "*AI Context:* Comedy skit about African parenting styles\n"
+            f"*Generated Tags:* {tags}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_slack_notification_restricted_message(self, ai_service):
+        """RESTRICT_18+ notifications fall back to the default reason"""
+        channel, text = await self._render_notification(
+            ai_service, {"contentFlag": "RESTRICT_18+"}
+        )
+        tags = ai_service._format_tags_for_slack(
+            [{"category": "Comedy & Skits", "subcategory": ["Family Comedy"]}]
+        )
+
+        assert channel == ai_service.slack_channels["review"]
+        assert text == (
+            ":warning: *Video Requires 18+ Restriction* :warning:\n"
+            + self._expected_header("RESTRICT_18+")
+            + "*Reason:* Mature content detected\n"
+            "*AI Context:* Comedy skit about African parenting styles\n"
+            f"*Generated Tags:* {tags}"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content_flag", ["BLOCK_VIOLATION", "UNKNOWN"])
+    async def test_slack_notification_blocked_message(self, ai_service, content_flag):
+        """BLOCK_VIOLATION (and unknown flags) render the violation message"""
+        channel, text = await self._render_notification(
+            ai_service, {"contentFlag": content_flag, "reason": "Graphic violence"}
+        )
+
+        assert channel == ai_service.slack_channels["review"]
+        assert text == (
+            ":no_entry: *Video BLOCKED - Policy Violation* :no_entry:\n"
+            + self._expected_header(content_flag)
+            + "*Violation Reason:* Graphic violence\n"
+            "*AI Context:* Comedy skit about African parenting styles\n"
+            "*Action Required:* Manual review and potential content removal\n"
+            "*Timestamp:* 2025-01-01 00:00:00"
+        )
+
+
+class TestFindJsonObjects:
+    """Test suite for the balanced-brace JSON scanner"""
+
+    def test_nested_objects(self):
+        """Nested objects are returned as one top-level candidate"""
+        text = 'Result: {"safety_check": {"contentFlag": "SAFE"}, "tags": [{"a": 1}]} done'
+        assert list(_find_json_objects(text)) == [
+            '{"safety_check": {"contentFlag": "SAFE"}, "tags": [{"a": 1}]}'
+        ]
+
+    def test_multiple_objects_in_order(self):
+        """Separate top-level objects are yielded in order"""
+        assert list(_find_json_objects('{"a": 1} and {"b": 2}')) == ['{"a": 1}', '{"b": 2}']
+
+    def test_braces_inside_strings(self):
+        """Braces inside string literals do not change the nesting depth"""
+        text = '{"aiContext": "a } b { c"} {"tags": "}{"}'
+        assert list(_find_json_objects(text)) == ['{"aiContext": "a } b { c"}', '{"tags": "}{"}']
+
+    def test_escaped_quotes(self):
+        """An escaped quote does not end the string literal"""
+        text = r'{"reason": "said \"}\" twice", "ok": {"x": "\\"}} trailing }'
+        expected = r'{"reason": "said \"}\" twice", "ok": {"x": "\\"}}'
+        candidates = list(_find_json_objects(text))
+        assert candidates == [expected]
+        assert json.loads(candidates[0])["reason"] == 'said "}" twice'
+
+    def test_malformed_input(self):
+        """Unterminated input yields no candidate beyond the objects that closed"""
+        assert list(_find_json_objects('{"a": {"b": 1}')) == ['{"b": 1}']
+        assert list(_find_json_objects('{"a": "unterminated }')) == []
+        assert list(_find_json_objects("no json here")) == []
+
+    def test_unbalanced_brace_before_json(self):
+        """A stray "{" in prose does not hide the JSON that follows it"""
+        text = 'Sure { see: {"safety_check": {"contentFlag": "SAFE"}, "tags": []} and {"x": 1}'
+        assert list(_find_json_objects(text)) == [
+            '{"safety_check": {"contentFlag": "SAFE"}, "tags": []}',
+            '{"x": 1}',
+        ]
+        assert EnhancedGoogleGenerativeService.extract_json_from_response(text) == {
+            "safety_check": {"contentFlag": "SAFE"},
+            "tags": [],
+        }
+
+    def test_stray_closing_brace_ignored(self):
+        """Closing braces outside any object are skipped"""
+        assert list(_find_json_objects('} } {"a": 1}')) == ['{"a": 1}']
+
+    def test_extract_json_from_response_uses_scanner(self):
+        """Prose around an object (no code fence) is still parsed"""
+        text = 'Here you go: {"tags": [], "aiContext": "x {y}"} Hope that helps!'
+        assert EnhancedGoogleGenerativeService.extract_json_from_response(text) == {
+            "tags": [],
+            "aiContext": "x {y}",
+        }
+
 
 # Integration test with real data structure
 @pytest.mark.asyncio